@@ -1,20 +1,51 @@
 # app/api/dependencies.py
-from typing import Tuple, Dict, Optional
+import hmac
+from datetime import datetime
+from typing import Tuple, Dict, Optional, List
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
 from jwt import PyJWTError
 import jwt
+from app.core.cache import token_blacklist_cache
 from app.core.config import settings
-from app.models.user import User
+from app.models.user import UserProfile
 from app.services.user_service import UserService
-from app.core.exceptions import UnauthorizedException, ForbiddenException
+from app.core.exceptions import UnauthorizedException, ForbiddenException, NotFoundException
 from app.repositories.token_blacklist_repository import TokenBlacklistRepository
 
 # OAuth2 로그인 스키마 설정
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.API_V1_STR}/auth/login")
 
 
+async def find_revocations(jtis: List[str]) -> Dict[str, datetime]:
+    """jti 중 블랙리스트에 등록된 것과 그 만료 시각 조회
+
+    캐시에서 먼저 확인하고, 캐시에 정보가 없는 jti만 한 번의 쿼리로 조회
+    """
+    revoked: Dict[str, datetime] = {}
+    unknown = []
+    for jti in jtis:
+        expire_at = token_blacklist_cache.revoked_until(jti)
+        if expire_at is not None:
+            revoked[jti] = expire_at
+        elif token_blacklist_cache.lookup(jti) is None:
+            unknown.append(jti)
+
+    if not unknown:
+        return revoked
+
+    blacklisted = await TokenBlacklistRepository.find_blacklisted(unknown)
+    for jti in unknown:
+        if jti in blacklisted:
+            token_blacklist_cache.mark_revoked(jti, blacklisted[jti])
+            revoked[jti] = blacklisted[jti]
+        else:
+            token_blacklist_cache.mark_valid(jti)
+
+    return revoked
+
+
 async def get_token_data(token: str = Depends(oauth2_scheme)) -> Dict:
     """토큰에서 데이터 추출 (블랙리스트 확인 포함)"""
     try:
@@ -37,16 +68,19 @@ async def get_token_data(token: str = Depends(oauth2_scheme)) -> Dict:
         if jti is None:
             raise UnauthorizedException("유효하지 않은 토큰 형식")
 
-        # 토큰 블랙리스트 확인
-        is_blacklisted = await TokenBlacklistRepository.is_token_blacklisted(jti)
-
-        # 사용자의 모든 토큰 무효화 확인
-        special_jti = f"user_{user_id}_all"
-        is_user_blacklisted = await TokenBlacklistRepository.is_token_blacklisted(special_jti)
-
-        if is_blacklisted or is_user_blacklisted:
+        # 토큰 블랙리스트 및 사용자의 모든 토큰 무효화 여부를 함께 확인
+        special_jti = TokenBlacklistRepository.user_sentinel_jti(user_id)
+        revoked = await find_revocations([jti, special_jti])
+        if jti in revoked:
             raise UnauthorizedException("만료된 토큰입니다. 다시 로그인해주세요.")
 
+        # 사용자의 모든 토큰 무효화는 그 시각 전에 발급된 토큰에만 적용 (이후 발급한 토큰은 유효)
+        if special_jti in revoked:
+            issued_at = payload.get("iat")
+            revoked_at = TokenBlacklistRepository.user_revoked_at(revoked[special_jti])
+            if issued_at is None or datetime.utcfromtimestamp(issued_at) < revoked_at:
+                raise UnauthorizedException("만료된 토큰입니다. 다시 로그인해주세요.")
+
         # 추가 권한 정보
         is_admin: bool = payload.get("is_admin", False)
         role: str = payload.get("role", "solver")  # 기본값은 일반 사용자
@@ -64,7 +98,7 @@ async def get_token_data(token: str = Depends(oauth2_scheme)) -> Dict:
         raise
 
 
-async def get_current_user(token_data: Dict = Depends(get_token_data)) -> User:
+async def get_current_user(token_data: Dict = Depends(get_token_data)) -> UserProfile:
     """현재 인증된 사용자 가져오기"""
     user_id = token_data.get("user_id")
 
@@ -78,7 +112,7 @@ async def get_current_user(token_data: Dict = Depends(get_token_data)) -> User:
     return user
 
 
-async def get_current_active_user(current_user: User = Depends(get_current_user)) -> User:
+async def get_current_active_user(current_user: UserProfile = Depends(get_current_user)) -> UserProfile:
     """현재 활성 상태인 사용자 가져오기 (추가 검증 시 확장 가능)"""
     if current_user.is_active != "Y":
         raise UnauthorizedException("계정이 비활성화되었습니다")
@@ -87,8 +121,8 @@ async def get_current_active_user(current_user: User = Depends(get_current_user)
 
 async def get_current_admin_user(
         token_data: Dict = Depends(get_token_data),
-        current_user: User = Depends(get_current_user)
-) -> User:
+        current_user: UserProfile = Depends(get_current_user)
+) -> UserProfile:
     """현재 관리자 권한을 가진 사용자 가져오기 (JWT 토큰에서 확인)"""
     if not token_data.get("is_admin", False):
         raise ForbiddenException("관리자 권한이 필요합니다")
@@ -98,9 +132,29 @@ async def get_current_admin_user(
 async def get_user_by_role(
         role: str,
         token_data: Dict = Depends(get_token_data),
-        current_user: User = Depends(get_current_user)
-) -> User:
+        current_user: UserProfile = Depends(get_current_user)
+) -> UserProfile:
     """특정 역할을 가진 사용자 가져오기 (JWT 토큰에서 확인)"""
     if token_data.get("role") != role:
         raise ForbiddenException(f"{role} 역할이 필요합니다")
-    return current_user
\ No newline at end of file
+    return current_user
+
+
+def verify_metrics_access(request: Request) -> None:
+    """/metrics 접근 권한 확인
+
+    METRICS_ENABLED가 꺼져 있으면 404, 허용 IP(METRICS_ALLOWED_IPS)에서 온 요청이거나
+    Authorization: Bearer <METRICS_TOKEN>이 맞으면 허용하고 그 외에는 403
+    """
+    if not settings.METRICS_ENABLED:
+        raise NotFoundException("지표 수집이 꺼져 있습니다.")
+
+    if request.client and request.client.host in settings.METRICS_ALLOWED_IPS:
+        return
+
+    if settings.METRICS_TOKEN:
+        scheme, _, token = request.headers.get("Authorization", "").partition(" ")
+        if scheme.lower() == "bearer" and hmac.compare_digest(token.encode(), settings.METRICS_TOKEN.encode()):
+            return
+
+    raise ForbiddenException("지표를 조회할 권한이 없습니다.")
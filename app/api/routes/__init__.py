@@ -1,6 +1,6 @@
 # app/api/routes/__init__.py
 from fastapi import APIRouter
-from app.api.routes import qna, category, auth, user_score, quiz, jwt_test, role_request
+from app.api.routes import qna, category, auth, user_score, quiz, jwt_test, role_request, group
 
 api_router = APIRouter()
 
@@ -51,4 +51,11 @@ api_router.include_router(
     role_request.router,
     prefix="/role-requests",
     tags=["Role Requests"]
+)
+
+# 그룹 관련 엔드포인트
+api_router.include_router(
+    group.router,
+    prefix="/groups",
+    tags=["Groups"]
 )
\ No newline at end of file
@@ -1,16 +1,26 @@
 # app/api/routes/auth.py
+import csv
+import io
+import json
 from typing import List, Dict, Any, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status, Body, Query, Path
+from fastapi import APIRouter, Depends, HTTPException, status, Body, Query, Path, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
 from fastapi.security import OAuth2PasswordRequestForm
 
 from app.api.dependencies import get_current_active_user, get_current_admin_user, get_token_data
-from app.core.exceptions import ValidationException, UnauthorizedException, ForbiddenException, NotFoundException
-from app.models.user import UserCreate, UserLogin, UserUpdate, User
+from app.core.exceptions import ValidationException, UnauthorizedException, ForbiddenException, NotFoundException, \
+    ServiceUnavailableException
+from app.core.pagination import NEXT_CURSOR_HEADER
+from app.models.user import UserCreate, UserLogin, UserUpdate, User, UserSummary
 from app.services.user_service import UserService
 
 router = APIRouter()
 
+# 사용자 목록 내보내기(CSV) 컬럼 순서
+USER_SUMMARY_FIELDS = ("user_id", "email", "username", "role", "is_active", "is_admin", "create_at")
+
 
 # 공통 API 엔드포인트 (인증 불필요)
 @router.post("/register", response_model=Dict[str, Any])
@@ -23,6 +33,8 @@ async def register(user_data: UserCreate = Body(...)):
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e.detail)
         )
+    except ServiceUnavailableException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -40,6 +52,8 @@ async def login(login_data: UserLogin = Body(...)):
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail=str(e.detail)
         )
+    except ServiceUnavailableException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -62,6 +76,8 @@ async def admin_login(login_data: UserLogin = Body(...)):
             status_code=status.HTTP_403_FORBIDDEN,
             detail=str(e.detail)
         )
+    except ServiceUnavailableException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -96,6 +112,8 @@ async def login_access_token(form_data: OAuth2PasswordRequestForm = Depends()):
             status_code=status.HTTP_403_FORBIDDEN,
             detail=str(e.detail)
         )
+    except ServiceUnavailableException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -132,6 +150,8 @@ async def update_user_me(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e.detail)
         )
+    except ServiceUnavailableException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -140,10 +160,20 @@ async def update_user_me(
 
 
 @router.get("/solvers", response_model=List[Dict[str, Any]])
-async def get_solvers(current_user: User = Depends(get_current_active_user)):
-    """풀이자 목록 조회 (모든 사용자가 접근 가능)"""
+async def get_solvers(
+        response: Response,
+        limit: int = Query(100, ge=1, le=1000, description="페이지 크기"),
+        after: Optional[str] = Query(None, description="이전 응답의 X-Next-Cursor 헤더 값"),
+        current_user: User = Depends(get_current_active_user)
+):
+    """풀이자 목록 조회 (모든 사용자가 접근 가능)
+    user_id 순서로 한 페이지씩 조회하고 다음 페이지 커서를 X-Next-Cursor 헤더로 반환"""
     try:
-        solvers = await UserService.get_users_by_role("solver", current_user.user_id, check_admin=False)
+        solvers, cursor = await UserService.get_users_by_role_page(
+            "solver", current_user.user_id, limit, after, check_admin=False
+        )
+        if cursor:
+            response.headers[NEXT_CURSOR_HEADER] = cursor
 
         return [
             {
@@ -153,6 +183,11 @@ async def get_solvers(current_user: User = Depends(get_current_active_user)):
             }
             for user in solvers
         ]
+    except ValidationException as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e.detail)
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -161,31 +196,37 @@ async def get_solvers(current_user: User = Depends(get_current_active_user)):
 
 
 # 관리자 API 엔드포인트 (관리자 권한 필요)
+def _user_summary_dict(user: UserSummary) -> Dict[str, Any]:
+    """사용자 요약 정보를 응답용 딕셔너리로 변환"""
+    return {
+        "user_id": user.user_id,
+        "email": user.email,
+        "username": user.username,
+        "role": user.role,
+        "is_active": user.is_active == "Y",
+        "is_admin": user.is_admin == "Y",
+        "create_at": user.create_at
+    }
+
+
 @router.get("/admin/users", response_model=List[Dict[str, Any]])
 async def get_all_users(
+        response: Response,
         role: Optional[str] = Query(None, description="사용자 역할 필터링 (admin, creator, solver)"),
+        limit: int = Query(100, ge=1, le=1000, description="페이지 크기"),
+        after: Optional[str] = Query(None, description="이전 응답의 X-Next-Cursor 헤더 값"),
         current_user: User = Depends(get_current_admin_user)  # 관리자만 접근 가능
 ):
     """사용자 목록 조회 (관리자 전용)
-    role 매개변수를 제공하면 특정 역할의 사용자만 필터링하여 조회"""
+    role 매개변수를 제공하면 특정 역할의 사용자만 필터링하여 조회
+    user_id 순서로 한 페이지씩 조회하고 다음 페이지 커서를 X-Next-Cursor 헤더로 반환
+    (전체 목록이 필요하면 /admin/users/export 사용)"""
     try:
-        if role:
-            users = await UserService.get_users_by_role(role, current_user.user_id)
-        else:
-            users = await UserService.get_all_users(current_user.user_id)
+        users, cursor = await UserService.get_users_page(current_user.user_id, limit, after, role)
+        if cursor:
+            response.headers[NEXT_CURSOR_HEADER] = cursor
 
-        return [
-            {
-                "user_id": user.user_id,
-                "email": user.email,
-                "username": user.username,
-                "role": user.role,
-                "is_active": user.is_active == "Y",
-                "is_admin": user.is_admin == "Y",
-                "create_at": user.create_at
-            }
-            for user in users
-        ]
+        return [_user_summary_dict(user) for user in users]
     except ForbiddenException as e:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -203,6 +244,62 @@ async def get_all_users(
         )
 
 
+@router.get("/admin/users/export")
+async def export_users(
+        format: str = Query("ndjson", pattern="^(ndjson|csv)$", description="내보내기 형식 (ndjson, csv)"),
+        role: Optional[str] = Query(None, description="사용자 역할 필터링 (admin, creator, solver)"),
+        current_user: User = Depends(get_current_admin_user)  # 관리자만 접근 가능
+):
+    """전체 사용자 목록 내보내기 (관리자 전용)
+    사용자 수와 관계없이 일정한 메모리로 NDJSON 또는 CSV 형식으로 스트리밍"""
+    try:
+        users = await UserService.export_users(current_user.user_id, role)
+    except ForbiddenException as e:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=str(e.detail)
+        )
+    except ValidationException as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e.detail)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"사용자 목록 내보내기 중 오류 발생: {str(e)}"
+        )
+
+    if format == "csv":
+        async def csv_rows():
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            writer.writerow(USER_SUMMARY_FIELDS)
+            async for user in users:
+                row = _user_summary_dict(user)
+                writer.writerow([row[field] for field in USER_SUMMARY_FIELDS])
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate(0)
+            yield buffer.getvalue()
+
+        return StreamingResponse(
+            csv_rows(),
+            media_type="text/csv; charset=utf-8",
+            headers={"Content-Disposition": 'attachment; filename="users.csv"'}
+        )
+
+    async def ndjson_rows():
+        async for user in users:
+            yield json.dumps(jsonable_encoder(_user_summary_dict(user)), ensure_ascii=False) + "\n"
+
+    return StreamingResponse(
+        ndjson_rows(),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": 'attachment; filename="users.ndjson"'}
+    )
+
+
 @router.get("/admin/users/{user_id}", response_model=Dict[str, Any])
 async def get_user_detail(
         user_id: int = Path(..., ge=1, description="조회할 사용자 ID"),
@@ -253,6 +350,8 @@ async def update_user(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e.detail)
         )
+    except ServiceUnavailableException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
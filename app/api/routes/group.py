@@ -0,0 +1,76 @@
+# app/api/routes/group.py
+from typing import Dict, Any
+
+from fastapi import APIRouter, Depends, Path, HTTPException, status
+
+from app.api.dependencies import get_current_active_user
+from app.core.exceptions import ValidationException, NotFoundException, ForbiddenException
+from app.models.group import GroupMemberBulkRequest
+from app.models.user import User
+from app.services.group_service import GroupService
+
+router = APIRouter()
+
+
+@router.post("/{group_id}/members/bulk", response_model=Dict[str, Any])
+async def add_group_members_bulk(
+        request: GroupMemberBulkRequest,
+        group_id: int = Path(..., ge=1),
+        current_user: User = Depends(get_current_active_user)
+):
+    """그룹에 여러 멤버를 한 번에 추가 (그룹 소유자 또는 관리자)
+    사용자 ID 또는 이메일 목록을 받아 추가된 사용자, 이미 멤버인 사용자, 없는 사용자를 함께 반환"""
+    try:
+        return await GroupService.add_members_bulk(group_id, request, current_user.user_id)
+    except ValidationException as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e.detail)
+        )
+    except NotFoundException as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e.detail)
+        )
+    except ForbiddenException as e:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=str(e.detail)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"그룹 멤버 일괄 추가 중 오류 발생: {str(e)}"
+        )
+
+
+@router.post("/{group_id}/members/bulk-remove", response_model=Dict[str, Any])
+async def remove_group_members_bulk(
+        request: GroupMemberBulkRequest,
+        group_id: int = Path(..., ge=1),
+        current_user: User = Depends(get_current_active_user)
+):
+    """그룹에서 여러 멤버를 한 번에 제거 (그룹 소유자 또는 관리자)
+    제거된 사용자, 멤버가 아닌 사용자, 없는 사용자를 함께 반환"""
+    try:
+        return await GroupService.remove_members_bulk(group_id, request, current_user.user_id)
+    except ValidationException as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e.detail)
+        )
+    except NotFoundException as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e.detail)
+        )
+    except ForbiddenException as e:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=str(e.detail)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"그룹 멤버 일괄 제거 중 오류 발생: {str(e)}"
+        )
@@ -1,5 +1,5 @@
 # app/api/routes/qna.py
-from fastapi import APIRouter, Depends, Query, Path, Body, status, HTTPException
+from fastapi import APIRouter, Depends, Query, Path, Body, Response, status, HTTPException
 from typing import List, Optional
 from app.models.question import QuestionCreate, QuestionUpdate
 from app.models.answer import AnswerCreate, AnswerUpdate
@@ -7,7 +7,8 @@ from app.models.submit import SubmitAnswer
 from app.models.qna import QuestionWithAnswers
 from app.models.user import User
 from app.services.qna_service import QnAService
-from app.core.exceptions import NotFoundException, DatabaseException
+from app.core.exceptions import NotFoundException, DatabaseException, ValidationException
+from app.core.pagination import NEXT_CURSOR_HEADER
 from app.api.dependencies import get_current_active_user, get_current_admin_user
 
 router = APIRouter()
@@ -52,15 +53,29 @@ async def get_question_with_answers(
 
 @router.get("/questions", response_model=List[QuestionWithAnswers])
 async def get_all_questions_with_answers(
+        response: Response,
         skip: int = Query(0, ge=0),
         limit: int = Query(10, ge=1, le=100),
         category_id: Optional[int] = Query(None, ge=1),
+        after: Optional[str] = Query(None, description="이전 응답의 X-Next-Cursor 헤더 값 (skip과 함께 사용 불가)"),
         current_user: User = Depends(get_current_active_user)  # 로그인 사용자만 조회 가능
 ):
-    """모든 질문과 답변 목록 조회 (로그인 필요)"""
+    """모든 질문과 답변 목록 조회 (로그인 필요)
+
+    skip 없이 조회하면 다음 페이지 커서를 X-Next-Cursor 헤더로 반환
+    """
     try:
-        return await QnAService.get_all_questions_with_answers(skip, limit, category_id)
-    except NotFoundException as e:
+        if skip:
+            if after:
+                raise ValidationException("skip과 after는 함께 사용할 수 없습니다.")
+            # 기존 오프셋 방식
+            return await QnAService.get_all_questions_with_answers(skip, limit, category_id)
+
+        questions, cursor = await QnAService.get_questions_page(limit, category_id, after=after)
+        if cursor:
+            response.headers[NEXT_CURSOR_HEADER] = cursor
+        return questions
+    except (NotFoundException, ValidationException) as e:
         raise
     except Exception as e:
         raise HTTPException(
@@ -1,10 +1,13 @@
 # app/api/routes/quiz.py
-from typing import List
+import json
+from typing import List, Optional
 
 from fastapi import APIRouter, Depends, Query, Path, Body, status, HTTPException
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
 
 from app.api.dependencies import get_current_active_user
-from app.core.exceptions import NotFoundException
+from app.core.exceptions import NotFoundException, ValidationException, ServiceUnavailableException
 from app.models.quiz_session import QuizSessionCreate, QuizSessionWithStats
 from app.models.submit import SubmitAnswer
 from app.models.user import User
@@ -16,11 +19,21 @@ router = APIRouter()
 async def create_quiz_session(
     session: QuizSessionCreate,
     question_count: int = Query(10, ge=1, le=50),
+    seed: Optional[int] = Query(None, description="문제 추출 난수 시드 (같은 시드면 같은 문제 구성)"),
+    exclude_correct: bool = Query(False, description="이미 맞힌 문제 제외"),
+    exclude_recent_days: Optional[int] = Query(None, ge=1, le=365, description="최근 N일 안에 풀었던 문제 제외"),
     current_user: User = Depends(get_current_active_user)
 ):
     """카테고리별 퀴즈 세션 생성 (로그인 필요)"""
     try:
-        return await QuizService.create_quiz_session(session, question_count)
+        return await QuizService.create_quiz_session(
+            session,
+            question_count,
+            user_id=current_user.user_id,
+            seed=seed,
+            exclude_correct=exclude_correct,
+            exclude_recent_days=exclude_recent_days
+        )
     except NotFoundException as e:
         raise
     except Exception as e:
@@ -67,7 +80,11 @@ async def submit_session_answer(
     submit_data: SubmitAnswer = Body(...),
     current_user: User = Depends(get_current_active_user)
 ):
-    """세션 내 문제 답변 제출 (로그인 필요)"""
+    """세션 내 문제 답변 제출 (로그인 필요)
+
+    성적 쓰기 지연 버퍼(SCORE_WRITE_BUFFER_ENABLED)가 켜져 있으면 성적이 나중에 기록되므로
+    score_id는 null이고 score_buffered는 true
+    """
     try:
         return await QuizService.submit_session_answer(
             session_id,
@@ -75,7 +92,7 @@ async def submit_session_answer(
             submit_data.selected_answer_ids,
             current_user.user_id
         )
-    except NotFoundException as e:
+    except (NotFoundException, ValidationException, ServiceUnavailableException) as e:
         raise
     except Exception as e:
         raise HTTPException(
@@ -86,10 +103,23 @@ async def submit_session_answer(
 @router.get("/sessions/{session_id}/questions", response_model=List[dict])
 async def get_session_questions(
     session_id: int = Path(..., ge=1),
+    stream: bool = Query(False, description="문제를 한 줄에 하나씩 NDJSON으로 스트리밍"),
     current_user: User = Depends(get_current_active_user)
 ):
-    """세션에 포함된 문제 목록 조회 (로그인 필요)"""
+    """세션에 포함된 문제 목록 조회 (로그인 필요)
+
+    stream=true이면 application/x-ndjson 으로 문제를 조회되는 대로 전송
+    """
     try:
+        if stream:
+            items = await QuizService.stream_session_questions(session_id)
+
+            async def ndjson():
+                async for item in items:
+                    yield json.dumps(jsonable_encoder(item), ensure_ascii=False) + "\n"
+
+            return StreamingResponse(ndjson(), media_type="application/x-ndjson")
+
         return await QuizService.get_session_questions(session_id)
     except NotFoundException as e:
         raise
@@ -1,10 +1,11 @@
 # app/api/routes/role_request.py
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
-from fastapi import APIRouter, Depends, Body, Path, HTTPException, status
+from fastapi import APIRouter, Depends, Body, Path, Query, Response, HTTPException, status
 
 from app.api.dependencies import get_current_active_user, get_current_admin_user
 from app.core.exceptions import ValidationException, NotFoundException, ForbiddenException
+from app.core.pagination import NEXT_CURSOR_HEADER, TOTAL_COUNT_HEADER
 from app.models.role_request import RoleRequest, RoleApprovalRequest
 from app.models.user import User
 from app.services.role_request_service import RoleRequestService
@@ -55,15 +56,34 @@ async def get_my_role_requests(current_user: User = Depends(get_current_active_u
 
 
 @router.get("/pending", response_model=List[Dict[str, Any]])
-async def get_pending_role_requests(current_user: User = Depends(get_current_admin_user)):
-    """관리자용 대기 중인 역할 변경 요청 목록 조회"""
+async def get_pending_role_requests(
+        response: Response,
+        limit: int = Query(100, ge=1, le=500, description="페이지 크기"),
+        after: Optional[str] = Query(None, description="이전 응답의 X-Next-Cursor 헤더 값"),
+        current_user: User = Depends(get_current_admin_user)
+):
+    """관리자용 대기 중인 역할 변경 요청 목록 조회
+    오래된 요청부터 한 페이지씩 조회하고 다음 페이지 커서는 X-Next-Cursor 헤더,
+    대기 중인 전체 요청 수는 X-Total-Count 헤더로 반환"""
     try:
-        return await RoleRequestService.get_pending_requests(current_user.user_id)
+        requests, cursor, total = await RoleRequestService.get_pending_requests(
+            current_user.user_id, limit, after
+        )
+        if cursor:
+            response.headers[NEXT_CURSOR_HEADER] = cursor
+        response.headers[TOTAL_COUNT_HEADER] = str(total)
+
+        return requests
     except ForbiddenException as e:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail=str(e.detail)
         )
+    except ValidationException as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e.detail)
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -1,10 +1,11 @@
 # app/api/routes/user_score.py
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
-from fastapi import APIRouter, Depends, Query, Path, status, HTTPException
+from fastapi import APIRouter, Depends, Query, Path, Response, status, HTTPException
 
 from app.api.dependencies import get_current_active_user
-from app.core.exceptions import NotFoundException
+from app.core.exceptions import NotFoundException, ServiceUnavailableException, ValidationException
+from app.core.pagination import NEXT_CURSOR_HEADER
 from app.models.submit import SubmitAnswer
 from app.models.user import User
 from app.models.user_score import UserScore, UserScoreSummary
@@ -17,10 +18,14 @@ async def submit_answer(
     submit_data: SubmitAnswer,
     current_user: User = Depends(get_current_active_user)
 ):
-    """사용자 답변 제출 및 결과 기록"""
+    """사용자 답변 제출 및 결과 기록
+
+    성적 쓰기 지연 버퍼(SCORE_WRITE_BUFFER_ENABLED)가 켜져 있으면 성적이 나중에 기록되므로
+    score_id는 null이고 score_buffered는 true
+    """
     try:
         return await UserScoreService.record_user_answer(current_user.user_id, submit_data)
-    except NotFoundException as e:
+    except (NotFoundException, ServiceUnavailableException) as e:
         raise
     except Exception as e:
         raise HTTPException(
@@ -30,12 +35,19 @@ async def submit_answer(
 
 @router.get("/history", response_model=List[UserScore])
 async def get_score_history(
+    response: Response,
     limit: int = Query(100, ge=1, le=1000),
+    after: Optional[str] = Query(None, description="이전 응답의 X-Next-Cursor 헤더 값"),
     current_user: User = Depends(get_current_active_user)
 ):
-    """사용자의 성적 기록 조회"""
+    """사용자의 성적 기록 조회 (최신순, 다음 페이지 커서는 X-Next-Cursor 헤더로 반환)"""
     try:
-        return await UserScoreService.get_user_scores(current_user.user_id, limit)
+        scores, cursor = await UserScoreService.get_user_scores_page(current_user.user_id, limit, after)
+        if cursor:
+            response.headers[NEXT_CURSOR_HEADER] = cursor
+        return scores
+    except ValidationException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -0,0 +1,34 @@
+# app/commands/rebuild_session_stats.py
+"""quiz_session 통계 카운터 재계산 명령
+
+사용법:
+    python -m app.commands.rebuild_session_stats                 # 전체 세션
+    python -m app.commands.rebuild_session_stats --session-id 3  # 특정 세션
+"""
+import argparse
+import asyncio
+import logging
+
+from app.core.database import close_db_connections, init_db_pool
+from app.services.quiz_service import QuizService
+
+logger = logging.getLogger(__name__)
+
+
+async def main(session_id: int = None):
+    await init_db_pool()
+    try:
+        result = await QuizService.rebuild_session_stats(session_id)
+        logger.info(result["message"] + f" (변경된 세션 수: {result['updated_count']})")
+    finally:
+        await close_db_connections()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
+
+    parser = argparse.ArgumentParser(description="session_question 기준으로 quiz_session 통계 카운터 재계산")
+    parser.add_argument("--session-id", type=int, default=None, help="재계산할 세션 ID (없으면 전체)")
+    args = parser.parse_args()
+
+    asyncio.run(main(args.session_id))
@@ -1,15 +1,32 @@
 # app/core/auth.py
+import asyncio
 import jwt
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from passlib.context import CryptContext
 from app.core.config import settings
-from typing import Optional, Dict, Any
+from app.core.exceptions import ServiceUnavailableException
+from app.core.metrics import registry
+from typing import Optional, Dict, Any, Callable
 from app.models.user import User
 
 # 비밀번호 해싱 컨텍스트
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# bcrypt 연산 전용 스레드 풀 (이벤트 루프 블로킹 방지)
+_password_executor = ThreadPoolExecutor(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    thread_name_prefix="password-hash"
+)
+_password_pending = 0  # 실행 중 + 대기 중인 작업 수
+
+_password_pending_gauge = registry.gauge("password_hash_pending", "bcrypt 스레드 풀에서 실행 중 + 대기 중인 작업 수")
+_password_rejected_counter = registry.counter(
+    "password_hash_rejected_total", "bcrypt 대기열이 가득 차서 거절한 요청 수"
+)
+registry.register_collector(lambda: _password_pending_gauge.set(value=_password_pending))
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """일반 텍스트 비밀번호와 해시된 비밀번호를 비교"""
@@ -21,6 +38,31 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+async def _run_password_task(func: Callable, *args):
+    """bcrypt 작업을 전용 스레드 풀에서 실행 (대기열이 가득 차면 503)"""
+    global _password_pending
+    if _password_pending >= settings.PASSWORD_HASH_QUEUE_LIMIT:
+        _password_rejected_counter.inc()
+        raise ServiceUnavailableException("로그인 요청이 많아 잠시 후 다시 시도해주세요.")
+
+    _password_pending += 1
+    try:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_password_executor, func, *args)
+    finally:
+        _password_pending -= 1
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """verify_password의 비동기 버전 (전용 스레드 풀에서 실행)"""
+    return await _run_password_task(verify_password, plain_password, hashed_password)
+
+
+async def get_password_hash_async(password: str) -> str:
+    """get_password_hash의 비동기 버전 (전용 스레드 풀에서 실행)"""
+    return await _run_password_task(get_password_hash, password)
+
+
 def create_access_token(data: Dict[str, Any], expires_delta: Optional[timedelta] = None) -> str:
     """JWT 액세스 토큰 생성 (JTI 포함)"""
     to_encode = data.copy()
@@ -0,0 +1,152 @@
+# app/core/cache.py
+import time
+from collections import OrderedDict
+from contextvars import ContextVar
+from datetime import datetime
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+from app.core.config import settings
+
+
+# 이름 → TTLCache (통계 수집용)
+_named_caches: Dict[str, "TTLCache"] = {}
+
+
+class TTLCache:
+    """크기 제한이 있는 인메모리 캐시
+
+    - maxsize를 넘으면 가장 오래 사용되지 않은 항목부터 제거 (LRU)
+    - ttl(초)이 지정되면 항목별로 만료 시간 적용 (None이면 만료 없음)
+    - 단일 이벤트 루프에서만 사용하므로 별도 락 없음
+    """
+
+    def __init__(self, maxsize: int, ttl: Optional[float] = None, name: Optional[str] = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data: "OrderedDict[Hashable, Tuple[Optional[float], Any]]" = OrderedDict()
+
+        # 이름을 주면 get_cache_stats()(/metrics)에 포함
+        if name is not None:
+            _named_caches[name] = self
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """값 조회 (없거나 만료된 경우 default)"""
+        entry = self._data.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+
+        expire_at, value = entry
+        if expire_at is not None and expire_at <= time.monotonic():
+            del self._data[key]
+            self.misses += 1
+            return default
+
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """값 저장 (ttl을 주면 기본 ttl 대신 사용)"""
+        ttl = self.ttl if ttl is None else ttl
+        if ttl is not None and ttl <= 0:
+            # 이미 만료된 값은 저장하지 않음
+            self._data.pop(key, None)
+            return
+
+        expire_at = time.monotonic() + ttl if ttl is not None else None
+        self._data[key] = (expire_at, value)
+        self._data.move_to_end(key)
+
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        """값 삭제"""
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """모든 값 삭제"""
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+def get_cache_stats() -> Dict[str, Dict[str, int]]:
+    """이름을 붙인 캐시별 적중/미적중 수와 항목 수"""
+    return {
+        name: {"hits": cache.hits, "misses": cache.misses, "size": len(cache)}
+        for name, cache in _named_caches.items()
+    }
+
+
+# 요청 범위 메모 (RequestMemoMiddleware가 요청마다 새 딕셔너리로 설정)
+_request_memo: ContextVar[Optional[Dict[Hashable, Any]]] = ContextVar("request_memo", default=None)
+
+
+def get_request_memo() -> Optional[Dict[Hashable, Any]]:
+    """현재 요청 범위의 메모 딕셔너리 조회 (요청 밖에서 호출되면 None)"""
+    return _request_memo.get()
+
+
+def start_request_memo():
+    """새 요청 범위 메모 시작 (반환된 토큰은 end_request_memo에 전달)"""
+    return _request_memo.set({})
+
+
+def end_request_memo(token) -> None:
+    """요청 범위 메모 종료"""
+    _request_memo.reset(token)
+
+
+class TokenBlacklistCache:
+    """토큰 블랙리스트 조회 결과 캐시
+
+    - revoked: 블랙리스트에 등록된 jti (해당 레코드의 expire_at까지 유지)
+    - valid: 블랙리스트에 없다고 확인된 jti (짧은 TTL 동안만 유지)
+
+    다른 워커에서 발생한 블랙리스트 등록은 valid TTL이 지난 뒤에 반영됨
+    트랜잭션 안에서 기록한 등록이 롤백되더라도 캐시에는 남으므로 차단 쪽으로 동작함
+    """
+
+    def __init__(self, maxsize: int, valid_ttl: float, name: Optional[str] = None):
+        self._revoked = TTLCache(maxsize, name=f"{name}_revoked" if name else None)
+        self._valid = TTLCache(maxsize, ttl=valid_ttl, name=f"{name}_valid" if name else None)
+
+    def lookup(self, jti: str) -> Optional[bool]:
+        """블랙리스트 여부 조회 (True: 등록됨, False: 없음, None: 캐시에 정보 없음)"""
+        if self._revoked.get(jti) is not None:
+            return True
+        if self._valid.get(jti) is not None:
+            return False
+        return None
+
+    def revoked_until(self, jti: str) -> Optional[datetime]:
+        """블랙리스트에 등록된 jti의 만료 시각 (등록 정보가 캐시에 없으면 None)"""
+        return self._revoked.get(jti)
+
+    def mark_revoked(self, jti: str, expire_at: datetime) -> None:
+        """블랙리스트 등록 기록 (expire_at은 UTC 기준)"""
+        self._valid.delete(jti)
+        remaining = (expire_at - datetime.utcnow()).total_seconds()
+        self._revoked.set(jti, expire_at, ttl=remaining)
+
+    def mark_valid(self, jti: str) -> None:
+        """블랙리스트에 없음을 기록"""
+        self._valid.set(jti, True)
+
+    def clear(self) -> None:
+        """캐시 초기화"""
+        self._revoked.clear()
+        self._valid.clear()
+
+
+# 토큰 블랙리스트 캐시 인스턴스
+token_blacklist_cache = TokenBlacklistCache(
+    maxsize=settings.TOKEN_BLACKLIST_CACHE_SIZE,
+    valid_ttl=settings.TOKEN_BLACKLIST_CACHE_TTL,
+    name="token_blacklist"
+)
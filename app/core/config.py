@@ -1,6 +1,6 @@
 # app/core/config.py
 import os
-from typing import List
+from typing import List, Optional
 
 from dotenv import load_dotenv
 
@@ -30,11 +30,83 @@ class Settings:
     MYSQL_PASSWORD: str = os.getenv("MYSQL_PASSWORD", "")
     MYSQL_DB: str = os.getenv("MYSQL_DB", "qna")
 
+    # MySQL 연결 풀 설정 (uvicorn 워커 수 x MAXSIZE가 DB max_connections를 넘지 않도록 조정)
+    MYSQL_POOL_MINSIZE: int = int(os.getenv("MYSQL_POOL_MINSIZE", "5"))
+    MYSQL_POOL_MAXSIZE: int = int(os.getenv("MYSQL_POOL_MAXSIZE", "20"))
+    MYSQL_POOL_RECYCLE: int = int(os.getenv("MYSQL_POOL_RECYCLE", "3600"))  # 초 단위, -1이면 재생성하지 않음
+    MYSQL_POOL_WARMUP: bool = os.getenv("MYSQL_POOL_WARMUP", "True").lower() == "true"
+    MYSQL_CONNECT_TIMEOUT: int = int(os.getenv("MYSQL_CONNECT_TIMEOUT", "10"))  # 초 단위
+    _read_timeout = os.getenv("MYSQL_READ_TIMEOUT", "")
+    MYSQL_READ_TIMEOUT: Optional[float] = float(_read_timeout) if _read_timeout else None  # 초 단위, 비우면 제한 없음
+
     # JWT 설정
     SECRET_KEY: str = os.getenv("SECRET_KEY", "super-secret-key-please-change-in-production")
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
 
+    # /metrics 지표 수집 여부 (끄면 쿼리/요청별 측정을 생략)
+    METRICS_ENABLED: bool = os.getenv("METRICS_ENABLED", "True").lower() == "true"
+    # /metrics 접근 허용: 허용 IP에서 온 요청 또는 METRICS_TOKEN을 Bearer 토큰으로 보낸 요청만
+    # (리버스 프록시 뒤에서는 프록시 IP로 보이므로 토큰 사용)
+    _metrics_ips = os.getenv("METRICS_ALLOWED_IPS", "127.0.0.1,::1")
+    METRICS_ALLOWED_IPS: List[str] = [ip.strip() for ip in _metrics_ips.split(",") if ip.strip()]
+    METRICS_TOKEN: str = os.getenv("METRICS_TOKEN", "")  # 비우면 토큰 인증 사용 안 함
+
+    # DB 행을 모델로 변환할 때 pydantic 검증 수행 여부 (기본값: DEBUG 모드에서만 검증)
+    STRICT_ROW_VALIDATION: bool = os.getenv("STRICT_ROW_VALIDATION", str(DEBUG)).lower() == "true"
+
+    # 사용자 정보 캐시 설정 (다른 워커에서의 변경은 TTL이 지난 뒤에 반영됨)
+    USER_CACHE_SIZE: int = int(os.getenv("USER_CACHE_SIZE", "10000"))
+    USER_CACHE_TTL: float = float(os.getenv("USER_CACHE_TTL", "30"))  # 초 단위
+
+    # 퀴즈 문제 추출용 카테고리별 문제 ID 캐시 설정
+    QUESTION_ID_CACHE_SIZE: int = int(os.getenv("QUESTION_ID_CACHE_SIZE", "256"))  # 캐시할 카테고리 수
+    QUESTION_ID_CACHE_TTL: float = float(os.getenv("QUESTION_ID_CACHE_TTL", "300"))  # 초 단위
+
+    # 카테고리 레지스트리 설정 (다른 워커에서의 카테고리 변경은 TTL이 지난 뒤에 반영됨)
+    CATEGORY_REGISTRY_TTL: float = float(os.getenv("CATEGORY_REGISTRY_TTL", "300"))  # 초 단위
+
+    # 사용자별 그룹 멤버십 캐시 설정 (다른 워커에서의 멤버 변경은 TTL이 지난 뒤에 반영됨)
+    GROUP_MEMBERSHIP_CACHE_SIZE: int = int(os.getenv("GROUP_MEMBERSHIP_CACHE_SIZE", "10000"))
+    GROUP_MEMBERSHIP_CACHE_TTL: float = float(os.getenv("GROUP_MEMBERSHIP_CACHE_TTL", "60"))  # 초 단위
+
+    # 채점용 정답 키 캐시 설정 (다른 워커에서의 정답 변경은 TTL이 지난 뒤에 반영됨)
+    ANSWER_KEY_CACHE_SIZE: int = int(os.getenv("ANSWER_KEY_CACHE_SIZE", "50000"))
+    ANSWER_KEY_CACHE_TTL: float = float(os.getenv("ANSWER_KEY_CACHE_TTL", "300"))  # 초 단위
+
+    # 세션 문제 목록 스트리밍 시 한 번에 조회할 문제 수
+    SESSION_QUESTION_STREAM_CHUNK: int = int(os.getenv("SESSION_QUESTION_STREAM_CHUNK", "10"))
+
+    # 성적 쓰기 지연(write-behind) 버퍼 설정
+    SCORE_WRITE_BUFFER_ENABLED: bool = os.getenv("SCORE_WRITE_BUFFER_ENABLED", "False").lower() == "true"
+    SCORE_WRITE_BUFFER_FLUSH_INTERVAL_MS: int = int(os.getenv("SCORE_WRITE_BUFFER_FLUSH_INTERVAL_MS", "200"))
+    SCORE_WRITE_BUFFER_MAX_BATCH: int = int(os.getenv("SCORE_WRITE_BUFFER_MAX_BATCH", "500"))  # 한 번에 반영할 최대 행 수
+    SCORE_WRITE_BUFFER_QUEUE_SIZE: int = int(os.getenv("SCORE_WRITE_BUFFER_QUEUE_SIZE", "10000"))
+    SCORE_WRITE_BUFFER_PUT_TIMEOUT: float = float(os.getenv("SCORE_WRITE_BUFFER_PUT_TIMEOUT", "2"))  # 초 단위, 큐가 가득 찼을 때 대기 시간
+    SCORE_WRITE_BUFFER_FLUSH_RETRIES: int = int(os.getenv("SCORE_WRITE_BUFFER_FLUSH_RETRIES", "3"))  # 배치 반영 실패 시 재시도 횟수
+    SCORE_WRITE_BUFFER_RETRY_BACKOFF: float = float(os.getenv("SCORE_WRITE_BUFFER_RETRY_BACKOFF", "0.5"))  # 초 단위, 재시도마다 2배로 증가
+    # 재시도와 행 단위 기록까지 실패한 성적을 JSON Lines로 남길 파일 (수동 복구용)
+    SCORE_WRITE_BUFFER_DEAD_LETTER_PATH: str = os.getenv("SCORE_WRITE_BUFFER_DEAD_LETTER_PATH", "score_write_buffer_failed.jsonl")
+
+    # 관리자 사용자 목록 내보내기 시 한 번에 조회할 사용자 수
+    USER_EXPORT_CHUNK_SIZE: int = int(os.getenv("USER_EXPORT_CHUNK_SIZE", "1000"))
+
+    # 그룹 멤버 일괄 추가/제거 요청 한 번에 받을 최대 사용자 수 (ID + 이메일)
+    GROUP_MEMBER_BULK_MAX_SIZE: int = int(os.getenv("GROUP_MEMBER_BULK_MAX_SIZE", "1000"))
+
+    # 비밀번호 해싱(bcrypt) 전용 스레드 풀 설정
+    PASSWORD_HASH_WORKERS: int = int(os.getenv("PASSWORD_HASH_WORKERS", "4"))
+    PASSWORD_HASH_QUEUE_LIMIT: int = int(os.getenv("PASSWORD_HASH_QUEUE_LIMIT", "64"))  # 실행 중 + 대기 중 작업 최대 개수
+
+    # 토큰 블랙리스트 캐시 설정
+    TOKEN_BLACKLIST_CACHE_SIZE: int = int(os.getenv("TOKEN_BLACKLIST_CACHE_SIZE", "10000"))
+    TOKEN_BLACKLIST_CACHE_TTL: float = float(os.getenv("TOKEN_BLACKLIST_CACHE_TTL", "5"))  # 초 단위, "블랙리스트 아님" 결과 유지 시간
+
+    # 만료된 블랙리스트 레코드 정리 작업 설정
+    TOKEN_PURGE_ENABLED: bool = os.getenv("TOKEN_PURGE_ENABLED", "True").lower() == "true"
+    TOKEN_PURGE_INTERVAL: float = float(os.getenv("TOKEN_PURGE_INTERVAL", "3600"))  # 초 단위
+    TOKEN_PURGE_BATCH_SIZE: int = int(os.getenv("TOKEN_PURGE_BATCH_SIZE", "1000"))
+
     class Config:
         env_file = ".env"
         extra = "ignore"  # 알 수 없는 필드는 무시
@@ -1,7 +1,11 @@
 # app/core/database.py
+import asyncio
 import asyncmy
 import logging
+import time
+from typing import Any, Dict, Optional
 from app.core.config import settings
+from app.core.metrics import registry, db_pool_acquire_wait_seconds, db_pool_connections
 from contextlib import asynccontextmanager
 
 logger = logging.getLogger(__name__)
@@ -23,26 +27,91 @@ async def init_db_pool():
                 db=settings.MYSQL_DB,
                 charset="utf8mb4",
                 autocommit=True,
+                minsize=settings.MYSQL_POOL_MINSIZE,
+                maxsize=settings.MYSQL_POOL_MAXSIZE,
+                pool_recycle=settings.MYSQL_POOL_RECYCLE,
+                connect_timeout=settings.MYSQL_CONNECT_TIMEOUT,
+                read_timeout=settings.MYSQL_READ_TIMEOUT,
+            )
+            logger.info(
+                f"MySQL 연결 풀이 성공적으로 생성되었습니다! 🎯 "
+                f"(min: {settings.MYSQL_POOL_MINSIZE}, max: {settings.MYSQL_POOL_MAXSIZE})"
             )
-            logger.info("MySQL 연결 풀이 성공적으로 생성되었습니다! 🎯")
         except Exception as e:
             logger.error(f"MySQL 연결 풀 생성 오류: {e}")
             raise
 
 
-async def get_db():
-    """FastAPI 의존성 주입을 위한 데이터베이스 연결 제공자"""
+async def warm_up_db_pool():
+    """minsize 개수만큼 커넥션을 동시에 꺼내 ping 후 반납 (서버 시작 시 연결 비용을 미리 지불)"""
     global mysql_pool
     if mysql_pool is None:
         await init_db_pool()
 
+    count = mysql_pool.minsize
+    if count <= 0:
+        return
+
+    conns = await asyncio.gather(*(mysql_pool.acquire() for _ in range(count)))
+    try:
+        await asyncio.gather(*(conn.ping() for conn in conns))
+    finally:
+        for conn in conns:
+            await mysql_pool.release(conn)
+
+    logger.info(f"MySQL 연결 풀 워밍업 완료 (커넥션 {count}개)")
+
+
+async def _acquire():
+    """풀에서 커넥션을 얻고 기다린 시간을 기록"""
+    started = time.perf_counter()
     conn = await mysql_pool.acquire()
+    db_pool_acquire_wait_seconds.observe(time.perf_counter() - started)
+    return conn
+
+
+def get_pool_stats() -> Optional[Dict[str, Any]]:
+    """커넥션 풀 상태 (풀이 없으면 None)"""
+    if mysql_pool is None:
+        return None
+    return {
+        "acquired": mysql_pool.size - mysql_pool.freesize,
+        "idle": mysql_pool.freesize,
+        "max": mysql_pool.maxsize
+    }
+
+
+def _collect_pool_metrics() -> None:
+    stats = get_pool_stats()
+    if stats is None:
+        return
+    for state, value in stats.items():
+        db_pool_connections.set(state, value=value)
+
+
+registry.register_collector(_collect_pool_metrics)
+
+
+@asynccontextmanager
+async def connection():
+    """풀에서 커넥션을 하나 빌려 사용하고 블록이 끝나면 반납하는 컨텍스트 매니저"""
+    global mysql_pool
+    if mysql_pool is None:
+        await init_db_pool()
+
+    conn = await _acquire()
     try:
         yield conn
     finally:
         await mysql_pool.release(conn)
 
 
+async def get_db():
+    """FastAPI 의존성 주입을 위한 데이터베이스 연결 제공자"""
+    async with connection() as conn:
+        yield conn
+
+
 @asynccontextmanager
 async def transaction():
     """데이터베이스 트랜잭션 컨텍스트 매니저"""
@@ -50,7 +119,7 @@ async def transaction():
     if mysql_pool is None:
         await init_db_pool()
 
-    conn = await mysql_pool.acquire()
+    conn = await _acquire()
     try:
         await conn.begin()
         yield conn
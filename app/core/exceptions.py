@@ -30,6 +30,14 @@ class UnauthorizedException(HTTPException):
             detail=detail
         )
 
+class ServiceUnavailableException(HTTPException):
+    """서버가 일시적으로 요청을 처리할 수 없을 때 발생하는 예외"""
+    def __init__(self, detail: str = "요청이 많아 잠시 후 다시 시도해주세요."):
+        super().__init__(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=detail
+        )
+
 class ForbiddenException(HTTPException):
     """권한 없음 예외"""
     def __init__(self, detail: str = "접근 권한이 없습니다."):
@@ -0,0 +1,247 @@
+# app/core/metrics.py
+import math
+from bisect import bisect_left
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from app.core.cache import get_cache_stats
+
+# 응답 시간용 기본 히스토그램 구간 (초)
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# 행 수용 히스토그램 구간
+ROW_BUCKETS = (0, 1, 5, 10, 50, 100, 500, 1000, 5000, 10000)
+
+# Prometheus 텍스트 형식 Content-Type
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)) + "}"
+
+
+class _Metric:
+    """레이블 조합별 값을 가지는 지표의 공통 부분"""
+
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+
+    def _key(self, labels: Sequence[str]) -> Tuple[str, ...]:
+        if len(labels) != len(self.labelnames):
+            raise ValueError(f"{self.name} 지표의 레이블 개수가 맞지 않습니다: {self.labelnames}")
+        return tuple(str(label) for label in labels)
+
+    def _samples(self) -> List[str]:
+        raise NotImplementedError
+
+    def render(self) -> List[str]:
+        return [
+            f"# HELP {self.name} {_escape(self.documentation)}",
+            f"# TYPE {self.name} {self.type_name}",
+            *self._samples()
+        ]
+
+
+class _ValueMetric(_Metric):
+    """레이블 조합별로 숫자 하나를 가지는 지표"""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0) + amount
+
+    def set(self, *labels: str, value: float) -> None:
+        """값 설정 (카운터는 다른 곳에서 누적한 값을 collector에서 옮겨올 때만 사용)"""
+        self._values[self._key(labels)] = value
+
+    def get(self, *labels: str) -> float:
+        return self._values.get(self._key(labels), 0)
+
+    def _samples(self) -> List[str]:
+        return [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+            for key, value in sorted(self._values.items())
+        ]
+
+
+class Counter(_ValueMetric):
+    """증가만 하는 누적 값"""
+
+    type_name = "counter"
+
+
+class Gauge(_ValueMetric):
+    """증가/감소하거나 조회 시점에 설정하는 현재 값"""
+
+    type_name = "gauge"
+
+    def dec(self, *labels: str, amount: float = 1) -> None:
+        self.inc(*labels, amount=-amount)
+
+
+class Histogram(_Metric):
+    """구간별 관측 횟수와 합계 (Prometheus 히스토그램 형식)"""
+
+    type_name = "histogram"
+
+    def __init__(self,
+                 name: str,
+                 documentation: str,
+                 labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # 레이블 조합 → [구간별 횟수 (마지막은 +Inf), 합계]
+        self._values: Dict[Tuple[str, ...], List] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        key = self._key(labels)
+        entry = self._values.get(key)
+        if entry is None:
+            entry = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0]
+        entry[0][bisect_left(self.buckets, value)] += 1
+        entry[1] += value
+
+    def get_count(self, *labels: str) -> int:
+        entry = self._values.get(self._key(labels))
+        return sum(entry[0]) if entry else 0
+
+    def _samples(self) -> List[str]:
+        lines = []
+        for key, (counts, total) in sorted(self._values.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (math.inf,), counts):
+                cumulative += count
+                labels = _format_labels(self.labelnames + ("le",), key + (_format_value(bound),))
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """프로세스 안의 지표 모음 (외부 수집기 없이 /metrics에서 텍스트로 출력)
+
+    - 조회 시점에 값을 채워야 하는 지표(풀 상태, 캐시 통계 등)는 collector로 등록
+    - 단일 이벤트 루프에서만 갱신하므로 별도 락 없음
+    """
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._collectors: List[Callable[[], None]] = []
+
+    def _register(self, metric: _Metric) -> _Metric:
+        if metric.name in self._metrics:
+            raise ValueError(f"이미 등록된 지표입니다: {metric.name}")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge(name, documentation, labelnames))
+
+    def histogram(self,
+                  name: str,
+                  documentation: str,
+                  labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def get(self, name: str) -> Optional[_Metric]:
+        return self._metrics.get(name)
+
+    def register_collector(self, collector: Callable[[], None]) -> None:
+        """render 직전에 호출할 함수 등록 (게이지 값을 현재 상태로 설정하는 용도)"""
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        """Prometheus 텍스트 형식으로 출력"""
+        for collector in self._collectors:
+            collector()
+
+        lines = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+# 전역 지표 레지스트리
+registry = MetricsRegistry()
+
+# HTTP 요청 (레이블 prefix: api_router에 등록된 라우터 prefix, 예: /qna, /quiz)
+http_requests_total = registry.counter(
+    "http_requests_total", "처리한 HTTP 요청 수", ("prefix", "method", "status")
+)
+http_request_duration_seconds = registry.histogram(
+    "http_request_duration_seconds", "HTTP 요청 처리 시간(초)", ("prefix", "method")
+)
+http_requests_in_flight = registry.gauge(
+    "http_requests_in_flight", "처리 중인 HTTP 요청 수", ("prefix",)
+)
+
+# DB 쿼리 (BaseRepository.execute_query에서 기록)
+db_query_duration_seconds = registry.histogram(
+    "db_query_duration_seconds", "레포지토리 메서드별 쿼리 실행 시간(초)", ("repository", "method")
+)
+db_query_rows = registry.histogram(
+    "db_query_rows", "레포지토리 메서드별 쿼리 결과 행 수 (SELECT가 아니면 영향받은 행 수)",
+    ("repository", "method"), buckets=ROW_BUCKETS
+)
+db_query_errors_total = registry.counter(
+    "db_query_errors_total", "레포지토리 메서드별 쿼리 오류 수", ("repository", "method")
+)
+
+# DB 커넥션 풀
+db_pool_connections = registry.gauge(
+    "db_pool_connections", "MySQL 커넥션 풀 상태별 커넥션 수 (acquired, idle, max)", ("state",)
+)
+db_pool_acquire_wait_seconds = registry.histogram(
+    "db_pool_acquire_wait_seconds", "풀에서 커넥션을 얻기까지 기다린 시간(초)"
+)
+
+# 인메모리 캐시 (이름을 붙인 TTLCache)
+cache_hits_total = registry.counter("cache_hits_total", "캐시 적중 수", ("cache",))
+cache_misses_total = registry.counter("cache_misses_total", "캐시 미적중 수", ("cache",))
+cache_entries = registry.gauge("cache_entries", "캐시 항목 수", ("cache",))
+
+
+def observe_query(repository: str, method: str, duration: float, rows: int, failed: bool = False) -> None:
+    """쿼리 한 번의 실행 시간과 행 수 기록"""
+    db_query_duration_seconds.observe(duration, repository, method)
+    if failed:
+        db_query_errors_total.inc(repository, method)
+    else:
+        db_query_rows.observe(rows, repository, method)
+
+
+def _collect_caches() -> None:
+    for name, stats in get_cache_stats().items():
+        cache_hits_total.set(name, value=stats["hits"])
+        cache_misses_total.set(name, value=stats["misses"])
+        cache_entries.set(name, value=stats["size"])
+
+
+registry.register_collector(_collect_caches)
@@ -0,0 +1,74 @@
+# app/core/middleware.py
+import time
+from typing import Sequence
+
+from app.core.cache import start_request_memo, end_request_memo
+from app.core.metrics import http_requests_total, http_request_duration_seconds, http_requests_in_flight
+
+
+class RequestMemoMiddleware:
+    """HTTP 요청마다 새 요청 범위 메모를 열어주는 ASGI 미들웨어
+
+    같은 요청 안에서 동일한 데이터를 여러 번 조회하지 않도록 하기 위해 사용
+    (BaseHTTPMiddleware와 달리 엔드포인트와 같은 컨텍스트에서 실행됨)
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        token = start_request_memo()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            end_request_memo(token)
+
+
+class MetricsMiddleware:
+    """HTTP 요청별 처리 시간, 처리 중인 요청 수, 상태 코드별 요청 수를 기록하는 ASGI 미들웨어
+
+    경로는 api_prefix 다음의 라우터 prefix(/qna, /quiz 등)로 묶어서 레이블 수를 제한
+    (등록되지 않은 경로는 other)
+    """
+
+    def __init__(self, app, api_prefix: str, prefixes: Sequence[str]):
+        self.app = app
+        self.api_prefix = api_prefix.rstrip("/")
+        # 긴 prefix부터 비교 (/quiz와 /quiz-xxx 같은 경우 대비)
+        self.prefixes = sorted(prefixes, key=len, reverse=True)
+
+    def _label(self, path: str) -> str:
+        if path.startswith(self.api_prefix + "/"):
+            sub_path = path[len(self.api_prefix):]
+            for prefix in self.prefixes:
+                if sub_path == prefix or sub_path.startswith(prefix + "/"):
+                    return prefix
+        return "other"
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        prefix = self._label(scope["path"])
+        method = scope["method"]
+        status_code = 500
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        http_requests_in_flight.inc(prefix)
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            http_requests_in_flight.dec(prefix)
+            http_request_duration_seconds.observe(time.perf_counter() - started, prefix, method)
+            http_requests_total.inc(prefix, method, str(status_code))
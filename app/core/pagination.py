@@ -0,0 +1,73 @@
+# app/core/pagination.py
+import base64
+import json
+from datetime import datetime
+from typing import Any, List, Optional, Sequence, Tuple, Type
+
+from app.core.exceptions import ValidationException
+
+# 다음 페이지 커서를 전달하는 응답 헤더
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+# 전체 항목 수를 전달하는 응답 헤더
+TOTAL_COUNT_HEADER = "X-Total-Count"
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """키셋 값 목록을 불투명한 커서 문자열로 변환 (base64url, 패딩 없음)"""
+    payload = [value.isoformat() if isinstance(value, datetime) else value for value in values]
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str, types: Sequence[Type]) -> Tuple[Any, ...]:
+    """커서 문자열을 키셋 값 튜플로 복원 (types: 각 값의 타입, int 또는 datetime)
+
+    형식이 맞지 않으면 ValidationException
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+        if not isinstance(payload, list) or len(payload) != len(types):
+            raise ValueError("커서 값 개수가 맞지 않습니다.")
+
+        values = []
+        for value, value_type in zip(payload, types):
+            if value_type is datetime:
+                values.append(datetime.fromisoformat(value))
+            elif value_type is int:
+                if not isinstance(value, int) or isinstance(value, bool):
+                    raise ValueError("정수가 아닌 커서 값입니다.")
+                values.append(value)
+            else:
+                values.append(value_type(value))
+
+        return tuple(values)
+    except (ValueError, TypeError):
+        raise ValidationException("유효하지 않은 커서입니다.")
+
+
+def keyset_condition(columns: Sequence[str],
+                     values: Sequence[Any],
+                     descending: bool = False) -> Tuple[str, List[Any]]:
+    """(columns) 가 values 다음에 오는 행을 찾는 WHERE 조건과 파라미터 생성
+
+    MySQL이 인덱스 범위 검색을 사용할 수 있도록 행 비교 대신 OR 조건으로 풀어서 작성
+    예) (a, b) 내림차순: (a < %s OR (a = %s AND b < %s))
+    """
+    op = "<" if descending else ">"
+    clauses = []
+    params: List[Any] = []
+
+    for i, column in enumerate(columns):
+        parts = [f"{prev} = %s" for prev in columns[:i]] + [f"{column} {op} %s"]
+        params.extend(values[:i])
+        params.append(values[i])
+        clauses.append(parts[0] if len(parts) == 1 else "(" + " AND ".join(parts) + ")")
+
+    return "(" + " OR ".join(clauses) + ")", params
+
+
+def next_cursor(next_key: Optional[Sequence[Any]]) -> Optional[str]:
+    """다음 페이지 키셋 값으로 커서 생성 (마지막 페이지면 None)"""
+    return encode_cursor(next_key) if next_key is not None else None
@@ -34,4 +34,10 @@ class AnswerInDB(AnswerBase):
 
 
 class Answer(AnswerInDB):
-    pass
\ No newline at end of file
+    pass
+
+
+class AnswerRef(BaseModel):
+    """답변 ID와 질문 ID만 조회할 때 사용 (수정 시 정답 키 캐시 갱신용)"""
+    answer_id: int
+    question_id: int
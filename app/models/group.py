@@ -1,5 +1,5 @@
 # app/models/group.py
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, EmailStr, Field
 from typing import List, Optional
 from datetime import datetime
 
@@ -47,5 +47,11 @@ class GroupMember(GroupMemberInDB):
     pass
 
 
+class GroupMemberBulkRequest(BaseModel):
+    """그룹 멤버 일괄 추가/제거 요청 (사용자 ID와 이메일을 함께 사용 가능)"""
+    user_ids: List[int] = []
+    emails: List[EmailStr] = []
+
+
 class GroupWithMembers(Group):
     members: List[int] = []  # 사용자 ID 목록
\ No newline at end of file
@@ -36,4 +36,10 @@ class QuestionInDB(QuestionBase):
 
 
 class Question(QuestionInDB):
-    pass
\ No newline at end of file
+    pass
+
+
+class QuestionRef(BaseModel):
+    """질문 ID와 카테고리 ID만 조회할 때 사용 (수정/삭제 시 캐시 갱신용)"""
+    question_id: int
+    category_id: int
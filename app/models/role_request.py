@@ -41,5 +41,17 @@ class RoleRequest(RoleRequestInDB):
     pass
 
 
+class PendingRoleRequest(BaseModel):
+    """관리자용 대기 중인 요청 목록 항목 (요청 + 요청자 정보)"""
+    request_id: int
+    user_id: int
+    username: str
+    email: str
+    current_role: str
+    requested_role: str
+    reason: str
+    create_at: datetime
+
+
 class RoleApprovalRequest(BaseModel):
-    admin_comment: Optional[str] = None
\ No newline at end of file
+    admin_comment: Optional[str] = None
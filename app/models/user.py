@@ -32,9 +32,9 @@ class UserUpdate(BaseModel):
     role: Optional[str] = None
 
 
-class UserInDB(UserBase):
+class UserProfile(UserBase):
+    """비밀번호를 제외한 사용자 정보 (인증, 권한 확인용)"""
     user_id: int
-    password: str  # 비밀번호 필드 추가
     is_active: str
     is_admin: str
     role: str
@@ -42,10 +42,25 @@ class UserInDB(UserBase):
     update_at: datetime
 
 
+class UserInDB(UserProfile):
+    password: str  # 비밀번호 필드 추가
+
+
 class User(UserInDB):
     pass
 
 
+class UserSummary(BaseModel):
+    """사용자 목록 조회용 요약 정보 (비밀번호 제외)"""
+    user_id: int
+    email: str
+    username: str
+    role: str
+    is_active: str
+    is_admin: str
+    create_at: datetime
+
+
 class UserLogin(BaseModel):
     email: EmailStr
     password: str
\ No newline at end of file
@@ -5,7 +5,7 @@ from typing import List
 from asyncmy import Connection
 
 from app.models.answer import Answer, AnswerCreate
-from app.repositories.base_repository import BaseRepository
+from app.repositories.base_repository import BaseRepository, query_method
 
 logger = logging.getLogger(__name__)
 
@@ -18,6 +18,7 @@ class AnswerRepository(BaseRepository[Answer]):
     id_column = "answer_id"
 
     @classmethod
+    @query_method
     async def create(cls, answer: AnswerCreate, conn: Connection = None) -> int:
         """새 답변 생성"""
         query = """
@@ -31,10 +32,21 @@ class AnswerRepository(BaseRepository[Answer]):
             answer.note
         )
 
-        cursor = await cls.execute_query(query, values, conn)
-        return cursor.lastrowid
+        result = await cls.execute(query, values, conn)
+        return result.lastrowid
 
     @classmethod
+    @query_method
+    async def create_bulk(cls, answers: List[AnswerCreate], conn: Connection = None) -> int:
+        """여러 답변을 한 번에 생성하고 생성된 행 수 반환"""
+        return await cls.bulk_create(
+            answers,
+            conn,
+            fields=("question_id", "is_correct", "answer_text", "note")
+        )
+
+    @classmethod
+    @query_method
     async def get_by_question_id(cls, question_id: int, conn: Connection = None) -> List[Answer]:
         """질문 ID로 답변들 조회"""
         return await cls.get_all(
@@ -44,9 +56,21 @@ class AnswerRepository(BaseRepository[Answer]):
         )
 
     @classmethod
+    @query_method
+    async def get_ids_by_question_id(cls, question_id: int, conn: Connection = None) -> List[int]:
+        """질문 ID로 답변 ID 목록 조회 (생성 순서)"""
+        rows = await cls.fetch_all(
+            "SELECT answer_id FROM answer WHERE question_id = %s ORDER BY answer_id",
+            (question_id,),
+            conn
+        )
+        return [row["answer_id"] for row in rows]
+
+    @classmethod
+    @query_method
     async def delete_by_question_id(cls, question_id: int, conn: Connection = None) -> bool:
         """질문 ID로 모든 답변 삭제"""
         query = "DELETE FROM answer WHERE question_id = %s"
 
-        cursor = await cls.execute_query(query, (question_id,), conn)
-        return cursor.rowcount > 0
\ No newline at end of file
+        result = await cls.execute(query, (question_id,), conn)
+        return result.rowcount > 0
\ No newline at end of file
@@ -1,16 +1,63 @@
 # app/repositories/base_repository.py
+import functools
 import logging
-from typing import Dict, List, Optional, TypeVar, Generic, Type, Union
+import time
+from contextvars import ContextVar
+from typing import Any, Dict, List, Optional, Sequence, Tuple, TypeVar, Generic, Type, Union
 
 from asyncmy import Connection
+from asyncmy.cursors import DictCursor
 from pydantic import BaseModel
 
-from app.core.database import get_db
+from app.core.config import settings
+from app.core.database import connection
+from app.core.metrics import observe_query
+from app.core.pagination import keyset_condition
+from app.repositories.row_mapper import materialize, materialize_many
 
 logger = logging.getLogger(__name__)
 
 T = TypeVar('T', bound=BaseModel)
 
+# 실행 중인 레포지토리 메서드의 (정의된 클래스 이름, 메서드 이름) - 쿼리 지표 레이블
+_query_label: ContextVar[Optional[Tuple[str, str]]] = ContextVar("query_label", default=None)
+
+
+def query_method(func):
+    """쿼리 지표 레이블을 지정하는 레포지토리 메서드 데코레이터
+
+    @classmethod / @staticmethod 바로 아래에 붙이면 메서드 안에서 실행한 쿼리가
+    (정의된 클래스 이름, 메서드 이름)으로 기록됨 (중첩 호출이면 가장 안쪽 메서드 기준)
+    BaseRepository에 정의된 메서드는 호출한 레포지토리 클래스 이름으로 기록
+    """
+    # __qualname__ 예: "UserRepository.get_by_id" (함수 안에서 정의한 클래스면 앞에 "<locals>" 경로가 붙음)
+    owner, _, name = func.__qualname__.rpartition(".")
+    label = (owner.rpartition(".")[2], name)
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        token = _query_label.set(label)
+        try:
+            return await func(*args, **kwargs)
+        finally:
+            _query_label.reset(token)
+
+    return wrapper
+
+
+class QueryResult:
+    """쿼리 실행 결과
+
+    커넥션을 풀에 반납하기 전에 결과 행과 rowcount, lastrowid를 모두 읽어둔 값
+    """
+
+    __slots__ = ("rows", "rowcount", "lastrowid")
+
+    def __init__(self, rows: List[Dict[str, Any]], rowcount: int, lastrowid: int):
+        self.rows = rows
+        self.rowcount = rowcount
+        self.lastrowid = lastrowid
+
 
 class BaseRepository(Generic[T]):
     """기본 레포지토리 클래스"""
@@ -19,28 +66,85 @@ class BaseRepository(Generic[T]):
     model_class: Type[T]
     id_column: str
 
+    @staticmethod
+    async def _run(conn: Connection, query: str, params: tuple = None) -> QueryResult:
+        """주어진 커넥션으로 쿼리를 실행하고 결과를 모두 읽어서 반환"""
+        async with conn.cursor(DictCursor) as cursor:
+            await cursor.execute(query, params)
+            rows = list(await cursor.fetchall()) if cursor.description else []
+            return QueryResult(rows, cursor.rowcount, cursor.lastrowid)
+
     @classmethod
-    async def execute_query(cls, query: str, params: tuple = None, conn: Connection = None, auto_close: bool = True):
-        """쿼리 실행 및 커넥션 관리 공통 메서드"""
-        if conn:
-            async with conn.cursor() as cursor:  # dictionary=True 제거
-                await cursor.execute(query, params)
-                return cursor
-        else:
-            db_gen = get_db()
-            conn = await db_gen.__anext__()
-            try:
-                async with conn.cursor() as cursor:  # dictionary=True 제거
-                    await cursor.execute(query, params)
-                    return cursor
-            finally:
-                if auto_close:
-                    try:
-                        await db_gen.__anext__()
-                    except StopAsyncIteration:
-                        pass
+    async def execute_query(cls, query: str, params: tuple = None, conn: Connection = None) -> QueryResult:
+        """쿼리 실행 및 커넥션 관리 공통 메서드
+
+        conn이 주어지면 해당 커넥션(트랜잭션)에서 실행하고, 없으면 풀에서 커넥션을 빌려
+        결과를 모두 읽은 뒤에 반납
+        METRICS_ENABLED이면 @query_method로 지정한 레포지토리 메서드별로 실행 시간과 행 수를 기록
+        """
+        if not settings.METRICS_ENABLED:
+            if conn is not None:
+                return await cls._run(conn, query, params)
+
+            async with connection() as pooled_conn:
+                return await cls._run(pooled_conn, query, params)
+
+        owner, method = _query_label.get() or (cls.__name__, "unlabelled")
+        # BaseRepository에 정의된 메서드(get_by_id 등)는 호출한 레포지토리 클래스 이름 사용
+        repository = cls.__name__ if owner == BaseRepository.__name__ else owner
+
+        if conn is not None:
+            return await cls._run_measured(conn, query, params, repository, method)
+
+        async with connection() as pooled_conn:
+            return await cls._run_measured(pooled_conn, query, params, repository, method)
 
     @classmethod
+    async def _run_measured(cls,
+                            conn: Connection,
+                            query: str,
+                            params: tuple,
+                            repository: str,
+                            method: str) -> QueryResult:
+        """_run 실행 후 실행 시간과 행 수를 지표에 기록 (커넥션 대기 시간 제외)"""
+        started = time.perf_counter()
+        try:
+            result = await cls._run(conn, query, params)
+        except Exception:
+            observe_query(repository, method, time.perf_counter() - started, 0, failed=True)
+            raise
+
+        rows = len(result.rows) if result.rows else max(result.rowcount or 0, 0)
+        observe_query(repository, method, time.perf_counter() - started, rows)
+        return result
+
+    @classmethod
+    async def fetch_all(cls, query: str, params: tuple = None, conn: Connection = None) -> List[Dict[str, Any]]:
+        """모든 결과 행을 딕셔너리 리스트로 조회"""
+        result = await cls.execute_query(query, params, conn)
+        return result.rows
+
+    @classmethod
+    async def fetch_one(cls, query: str, params: tuple = None, conn: Connection = None) -> Optional[Dict[str, Any]]:
+        """첫 번째 결과 행 조회 (없으면 None)"""
+        result = await cls.execute_query(query, params, conn)
+        return result.rows[0] if result.rows else None
+
+    @classmethod
+    async def fetch_val(cls, query: str, params: tuple = None, conn: Connection = None, default: Any = None) -> Any:
+        """첫 번째 결과 행의 첫 번째 컬럼 값 조회 (없으면 default)"""
+        row = await cls.fetch_one(query, params, conn)
+        if not row:
+            return default
+        return next(iter(row.values()))
+
+    @classmethod
+    async def execute(cls, query: str, params: tuple = None, conn: Connection = None) -> QueryResult:
+        """INSERT/UPDATE/DELETE 실행 (rowcount, lastrowid 확인용)"""
+        return await cls.execute_query(query, params, conn)
+
+    @classmethod
+    @query_method
     async def create(cls, item: BaseModel, conn: Connection = None) -> int:
         """새 레코드 생성"""
         # 모델에서 dictionary로 변환
@@ -53,40 +157,123 @@ class BaseRepository(Generic[T]):
 
         query = f"INSERT INTO {cls.table_name} ({fields}) VALUES ({placeholders})"
 
-        cursor = await cls.execute_query(query, values, conn)
-        return cursor.lastrowid
+        result = await cls.execute(query, values, conn)
+        return result.lastrowid
+
+    @classmethod
+    @query_method
+    async def bulk_create(cls,
+                          items: Sequence[BaseModel],
+                          conn: Connection = None,
+                          fields: Sequence[str] = None) -> int:
+        """여러 레코드를 하나의 multi-row INSERT로 생성하고 생성된 행 수 반환
+
+        fields가 없으면 첫 번째 항목에서 설정된 필드를 사용 (모든 항목의 필드가 같아야 함)
+        생성된 ID가 연속이라는 보장이 없으므로 (auto_increment_increment, innodb_autoinc_lock_mode)
+        ID가 필요하면 같은 트랜잭션에서 다시 조회
+        """
+        if not items:
+            return 0
+
+        if fields is None:
+            fields = list(items[0].dict(exclude_unset=True).keys())
+            for item in items[1:]:
+                if list(item.dict(exclude_unset=True).keys()) != fields:
+                    raise ValueError("bulk_create에 전달된 항목들의 필드 구성이 서로 다릅니다.")
+
+        # SQL 쿼리 및 파라미터 구성
+        row_placeholder = '(' + ', '.join(['%s'] * len(fields)) + ')'
+        placeholders = ', '.join([row_placeholder] * len(items))
+        values = tuple(getattr(item, field) for item in items for field in fields)
+
+        query = f"INSERT INTO {cls.table_name} ({', '.join(fields)}) VALUES {placeholders}"
+
+        result = await cls.execute(query, values, conn)
+        return result.rowcount
+
+    @classmethod
+    def _select_list(cls, columns: Sequence[str] = None) -> str:
+        """SELECT 절 컬럼 목록 (columns가 없으면 *)"""
+        return ", ".join(columns) if columns else "*"
+
+    @classmethod
+    def _projection(cls,
+                    columns: Sequence[str] = None,
+                    model: Type[BaseModel] = None) -> Tuple[Optional[Sequence[str]], Type[BaseModel]]:
+        """조회할 컬럼과 반환 모델 결정
+
+        columns를 주면 그 컬럼에 맞는 projection 모델도 함께 지정해야 함 (예: UserProfile)
+        model만 주면 모델의 필드를 조회, 둘 다 없으면 전체 컬럼을 model_class로 반환
+        """
+        if model is None:
+            if columns:
+                raise ValueError(f"{cls.__name__}: columns를 지정하면 반환할 model도 지정해야 합니다.")
+            return None, cls.model_class
+        return columns or tuple(model.model_fields), model
+
+    @classmethod
+    def _to_model(cls, row: Dict[str, Any], model: Type[BaseModel] = None) -> Any:
+        """조회한 행을 모델로 변환 (model이 없으면 model_class)"""
+        return materialize(model or cls.model_class, row)
+
+    @classmethod
+    def _to_models(cls, rows: List[Dict[str, Any]], model: Type[BaseModel] = None) -> List[Any]:
+        """조회한 행 목록을 모델 목록으로 변환 (model이 없으면 model_class)"""
+        return materialize_many(model or cls.model_class, rows)
 
     @classmethod
-    async def get_by_id(cls, id_value: int, conn: Connection = None) -> Optional[T]:
-        """ID로 레코드 조회"""
-        query = f"SELECT * FROM {cls.table_name} WHERE {cls.id_column} = %s"
+    @query_method
+    async def get_by_id(cls,
+                        id_value: int,
+                        conn: Connection = None,
+                        columns: Sequence[str] = None,
+                        model: Type[BaseModel] = None) -> Optional[Any]:
+        """ID로 레코드 조회
 
-        cursor = await cls.execute_query(query, (id_value,), conn)
-        result = await cursor.fetchone()
+        columns/model을 주면 해당 컬럼만 조회해서 model로 반환 (_projection 참고)
+        """
+        columns, model = cls._projection(columns, model)
+        query = f"SELECT {cls._select_list(columns)} FROM {cls.table_name} WHERE {cls.id_column} = %s"
+
+        row = await cls.fetch_one(query, (id_value,), conn)
 
         # 결과가 없으면 None 반환
-        if not result:
+        if not row:
             return None
 
-        # 튜플 결과를 딕셔너리로 변환
-        if not isinstance(result, dict) and hasattr(cursor, 'description'):
-            column_names = [column[0] for column in cursor.description]
-            result_dict = dict(zip(column_names, result))
-            return cls.model_class(**result_dict)
-        else:
-            # 이미 딕셔너리 형태인 경우
-            return cls.model_class(**result)
+        return cls._to_model(row, model)
+
+    @classmethod
+    @query_method
+    async def exists(cls, where_clause: str, params: tuple = None, conn: Connection = None) -> bool:
+        """조건에 맞는 레코드가 있는지 확인 (행을 읽지 않고 SELECT 1 ... LIMIT 1)"""
+        query = f"SELECT 1 FROM {cls.table_name} WHERE {where_clause} LIMIT 1"
+
+        return await cls.fetch_one(query, params, conn) is not None
 
     @classmethod
+    @query_method
+    async def exists_by_id(cls, id_value: int, conn: Connection = None) -> bool:
+        """ID에 해당하는 레코드가 있는지 확인"""
+        return await cls.exists(f"{cls.id_column} = %s", (id_value,), conn)
+
+    @classmethod
+    @query_method
     async def get_all(cls,
                       where_clause: str = "",
                       params: tuple = None,
                       order_by: str = None,
                       limit: int = None,
                       offset: int = None,
-                      conn: Connection = None) -> List[T]:
-        """조건에 맞는 모든 레코드 조회"""
-        query = f"SELECT * FROM {cls.table_name}"
+                      conn: Connection = None,
+                      columns: Sequence[str] = None,
+                      model: Type[BaseModel] = None) -> List[Any]:
+        """조건에 맞는 모든 레코드 조회
+
+        columns/model을 주면 해당 컬럼만 조회해서 model로 반환 (_projection 참고)
+        """
+        columns, model = cls._projection(columns, model)
+        query = f"SELECT {cls._select_list(columns)} FROM {cls.table_name}"
 
         # WHERE 절 추가
         if where_clause:
@@ -102,23 +289,62 @@ class BaseRepository(Generic[T]):
             if offset is not None:
                 query += f" OFFSET {offset}"
 
-        cursor = await cls.execute_query(query, params, conn)
-        rows = await cursor.fetchall()
+        rows = await cls.fetch_all(query, params, conn)
 
-        # 결과가 없으면 빈 리스트 반환
-        if not rows:
-            return []
+        return cls._to_models(rows, model)
 
-        # 튜플 결과를 딕셔너리로 변환 (첫 번째 결과가 딕셔너리가 아닌 경우)
-        if rows and not isinstance(rows[0], dict) and hasattr(cursor, 'description'):
-            column_names = [column[0] for column in cursor.description]
-            result_dicts = [dict(zip(column_names, row)) for row in rows]
-            return [cls.model_class(**result_dict) for result_dict in result_dicts]
-        else:
-            # 이미 딕셔너리 형태인 경우
-            return [cls.model_class(**row) for row in rows]
+    @classmethod
+    @query_method
+    async def get_page(cls,
+                       key_columns: Sequence[str],
+                       limit: int,
+                       after: Optional[Sequence[Any]] = None,
+                       where_clause: str = "",
+                       params: tuple = None,
+                       descending: bool = False,
+                       columns: Sequence[str] = None,
+                       model: Type[BaseModel] = None,
+                       conn: Connection = None,
+                       from_clause: str = None) -> Tuple[List[Any], Optional[Tuple[Any, ...]]]:
+        """키셋(커서) 방식 페이지 조회
+
+        key_columns 순서로 정렬하고 after(이전 페이지 마지막 행의 key_columns 값) 다음 행부터 limit개 조회
+        key_columns의 마지막 컬럼은 유일해야 함 (예: submit_at, score_id)
+        columns/model을 주면 해당 컬럼만 조회해서 model로 반환 (key_columns 포함 필요, _projection 참고)
+        from_clause를 주면 테이블 대신 사용 (JOIN 조회, key_columns는 "r.create_at"처럼 별칭을 붙여도 되며
+        결과 행에서는 별칭을 뗀 컬럼 이름으로 다음 페이지 키를 읽음)
+        반환값: (레코드 목록, 다음 페이지 키 값 - 마지막 페이지면 None)
+        """
+        columns, model = cls._projection(columns, model)
+        conditions = [f"({where_clause})"] if where_clause else []
+        query_params = list(params or ())
+
+        if after is not None:
+            condition, condition_params = keyset_condition(key_columns, after, descending)
+            conditions.append(condition)
+            query_params.extend(condition_params)
+
+        direction = "DESC" if descending else "ASC"
+        query = f"SELECT {cls._select_list(columns)} FROM {from_clause or cls.table_name}"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY " + ", ".join(f"{column} {direction}" for column in key_columns)
+
+        # 다음 페이지 존재 여부 확인을 위해 하나 더 조회
+        query += " LIMIT %s"
+        query_params.append(limit + 1)
+
+        rows = await cls.fetch_all(query, tuple(query_params), conn)
+
+        next_key = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_key = tuple(rows[-1][column.rsplit(".", 1)[-1]] for column in key_columns)
+
+        return cls._to_models(rows, model), next_key
 
     @classmethod
+    @query_method
     async def update(cls, id_value: int, update_data: Union[Dict, BaseModel], conn: Connection = None) -> bool:
         """레코드 업데이트"""
         # Dict 또는 BaseModel 타입 처리
@@ -138,26 +364,29 @@ class BaseRepository(Generic[T]):
 
         query = f"UPDATE {cls.table_name} SET {set_clause} WHERE {cls.id_column} = %s"
 
-        cursor = await cls.execute_query(query, tuple(values), conn)
-        return cursor.rowcount > 0
+        result = await cls.execute(query, tuple(values), conn)
+        return result.rowcount > 0
 
     @classmethod
+    @query_method
     async def delete(cls, id_value: int, conn: Connection = None) -> bool:
         """레코드 삭제"""
         query = f"DELETE FROM {cls.table_name} WHERE {cls.id_column} = %s"
 
-        cursor = await cls.execute_query(query, (id_value,), conn)
-        return cursor.rowcount > 0
+        result = await cls.execute(query, (id_value,), conn)
+        return result.rowcount > 0
 
     @classmethod
-    async def count(cls, where_clause: str = "", params: tuple = None, conn: Connection = None) -> int:
-        """조건에 맞는 레코드 수 조회"""
-        query = f"SELECT COUNT(*) as count FROM {cls.table_name}"
+    @query_method
+    async def count(cls,
+                    where_clause: str = "",
+                    params: tuple = None,
+                    conn: Connection = None,
+                    from_clause: str = None) -> int:
+        """조건에 맞는 레코드 수 조회 (from_clause를 주면 테이블 대신 사용)"""
+        query = f"SELECT COUNT(*) as count FROM {from_clause or cls.table_name}"
 
         if where_clause:
             query += f" WHERE {where_clause}"
 
-        cursor = await cls.execute_query(query, params, conn)
-        result = await cursor.fetchone()
-
-        return result["count"] if result else 0
\ No newline at end of file
+        return await cls.fetch_val(query, params, conn, default=0)
\ No newline at end of file
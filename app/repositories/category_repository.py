@@ -1,11 +1,15 @@
 # app/repositories/category_repository.py
+import asyncio
 import logging
-from typing import List, Optional
+import time
+from typing import Any, Dict, Iterable, List, Optional, Set
 
 from asyncmy import Connection
 
+from app.core.config import settings
+from app.core.metrics import registry as metrics_registry
 from app.models.category import Category, CategoryCreate
-from app.repositories.base_repository import BaseRepository
+from app.repositories.base_repository import BaseRepository, query_method
 
 logger = logging.getLogger(__name__)
 
@@ -18,6 +22,7 @@ class CategoryRepository(BaseRepository[Category]):
     id_column = "category_id"
 
     @classmethod
+    @query_method
     async def create(cls, category: CategoryCreate, conn: Connection = None) -> int:
         """새 카테고리 생성"""
         query = """
@@ -29,10 +34,11 @@ class CategoryRepository(BaseRepository[Category]):
             category.is_use
         )
 
-        cursor = await cls.execute_query(query, values, conn)
-        return cursor.lastrowid
+        result = await cls.execute(query, values, conn)
+        return result.lastrowid
 
     @classmethod
+    @query_method
     async def get_all(cls,
                       is_use: Optional[str] = None,
                       conn: Connection = None) -> List[Category]:
@@ -45,4 +51,123 @@ class CategoryRepository(BaseRepository[Category]):
             params=params,
             order_by="name ASC",
             conn=conn
-        )
\ No newline at end of file
+        )
+
+    @classmethod
+    @query_method
+    async def get_by_ids(cls, category_ids: List[int], conn: Connection = None) -> List[Category]:
+        """여러 ID의 카테고리를 한 번에 조회 (없는 ID는 결과에서 빠짐)"""
+        if not category_ids:
+            return []
+
+        placeholders = ', '.join(['%s'] * len(category_ids))
+        return await super().get_all(
+            where_clause=f"category_id IN ({placeholders})",
+            params=tuple(category_ids),
+            conn=conn
+        )
+
+
+class CategoryRegistry:
+    """전체 카테고리를 메모리에 올려두고 조회하는 레지스트리
+
+    - 서버 시작 시 load()로 전체 카테고리를 읽고, TTL이 지나면 다음 조회 때 다시 읽음
+    - 이 워커의 카테고리 변경은 invalidate()로 바로 반영하고,
+      다른 워커의 변경은 TTL이 지난 뒤에 반영됨
+    - 레지스트리에 없는 ID는 모아서 DB에서 한 번(IN)에 확인하고, 있으면 레지스트리를 만료 처리
+      (다른 워커에서 새로 만든 카테고리 대비, 다음 조회 때 name ASC 순서로 다시 읽음)
+    - DB에도 없던 ID는 다음 load()까지 기억해 두고 다시 조회하지 않음
+    - 반환하는 Category 인스턴스는 공유 객체이므로 수정하지 말 것
+    """
+
+    # 카테고리 ID → Category (DB의 name ASC 순서 유지)
+    _categories: Dict[int, Category] = {}
+    # DB에도 없었던 카테고리 ID (다음 load()까지 유지)
+    _missing: Set[int] = set()
+    _loaded_at: Optional[float] = None
+    _lock: Optional[asyncio.Lock] = None
+
+    @classmethod
+    async def load(cls) -> None:
+        """전체 카테고리를 다시 읽어서 레지스트리 교체"""
+        categories = await CategoryRepository.get_all()
+        cls._categories = {category.category_id: category for category in categories}
+        cls._missing = set()
+        cls._loaded_at = time.monotonic()
+        logger.info(f"카테고리 레지스트리 로드: {len(categories)}개")
+
+    @classmethod
+    def invalidate(cls) -> None:
+        """레지스트리를 만료 처리 (다음 조회 때 다시 읽음)"""
+        cls._loaded_at = None
+
+    @classmethod
+    def _is_fresh(cls) -> bool:
+        return cls._loaded_at is not None and time.monotonic() - cls._loaded_at < settings.CATEGORY_REGISTRY_TTL
+
+    @classmethod
+    async def _ensure_loaded(cls) -> None:
+        """만료되었으면 다시 읽음 (동시에 여러 요청이 와도 한 번만 읽음)"""
+        if cls._is_fresh():
+            return
+
+        if cls._lock is None:
+            cls._lock = asyncio.Lock()
+
+        async with cls._lock:
+            if not cls._is_fresh():
+                await cls.load()
+
+    @classmethod
+    async def get_by_id(cls, category_id: int) -> Optional[Category]:
+        """ID로 카테고리 조회 (없으면 None)"""
+        return (await cls.get_many((category_id,)))[category_id]
+
+    @classmethod
+    async def exists(cls, category_id: int) -> bool:
+        """카테고리 존재 여부 확인"""
+        return await cls.get_by_id(category_id) is not None
+
+    @classmethod
+    async def get_many(cls, category_ids: Iterable[int]) -> Dict[int, Optional[Category]]:
+        """여러 카테고리를 ID별로 조회 (없는 ID는 None)
+
+        레지스트리에 없는 ID는 쿼리 1회로 함께 확인
+        """
+        await cls._ensure_loaded()
+
+        categories = {category_id: cls._categories.get(category_id) for category_id in set(category_ids)}
+        unknown = [category_id for category_id, category in categories.items()
+                   if category is None and category_id not in cls._missing]
+        if unknown:
+            found = await CategoryRepository.get_by_ids(unknown)
+            for category in found:
+                categories[category.category_id] = category
+            if found:
+                # 순서를 유지하도록 항목을 끼워 넣지 않고 전체를 다시 읽음
+                cls.invalidate()
+            cls._missing.update(set(unknown) - {category.category_id for category in found})
+        return categories
+
+    @classmethod
+    async def get_all(cls, is_use: Optional[str] = None) -> List[Category]:
+        """전체 카테고리 조회 (이름 오름차순, 사용 상태 필터링 옵션)"""
+        await cls._ensure_loaded()
+
+        categories = list(cls._categories.values())
+        if is_use:
+            categories = [category for category in categories if category.is_use == is_use]
+        return categories
+
+    @classmethod
+    def get_stats(cls) -> Dict[str, Any]:
+        """레지스트리 상태"""
+        return {
+            "size": len(cls._categories),
+            "age_seconds": time.monotonic() - cls._loaded_at if cls._loaded_at is not None else None,
+            "ttl_seconds": settings.CATEGORY_REGISTRY_TTL
+        }
+
+
+_registry_size_gauge = metrics_registry.gauge("category_registry_entries", "카테고리 레지스트리 항목 수")
+metrics_registry.register_collector(lambda: _registry_size_gauge.set(value=len(CategoryRegistry._categories)))
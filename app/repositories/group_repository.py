@@ -1,14 +1,24 @@
 # app/repositories/group_repository.py
 import logging
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Sequence, Set, Tuple
 
 from asyncmy import Connection
 
+from app.core.cache import TTLCache
+from app.core.config import settings
 from app.models.group import Group, GroupCreate, GroupMember, GroupMemberCreate
-from app.repositories.base_repository import BaseRepository
+from app.repositories.base_repository import BaseRepository, query_method
+from app.repositories.row_mapper import materialize_many
 
 logger = logging.getLogger(__name__)
 
+# 사용자 ID → 소속 그룹 ID 튜플 (문제 공개 범위 확인용)
+_membership_cache = TTLCache(
+    maxsize=settings.GROUP_MEMBERSHIP_CACHE_SIZE,
+    ttl=settings.GROUP_MEMBERSHIP_CACHE_TTL,
+    name="group_membership"
+)
+
 
 class GroupRepository(BaseRepository[Group]):
     """그룹 관련 데이터베이스 작업을 처리하는 레포지토리"""
@@ -18,6 +28,7 @@ class GroupRepository(BaseRepository[Group]):
     id_column = "group_id"
 
     @classmethod
+    @query_method
     async def create_group(cls, group: GroupCreate, conn: Connection = None) -> int:
         """새 그룹 생성"""
         query = """
@@ -30,10 +41,11 @@ class GroupRepository(BaseRepository[Group]):
             group.user_id
         )
 
-        cursor = await cls.execute_query(query, values, conn)
-        return cursor.lastrowid
+        result = await cls.execute(query, values, conn)
+        return result.lastrowid
 
     @classmethod
+    @query_method
     async def get_groups_by_creator(cls, user_id: int, conn: Connection = None) -> List[Group]:
         """출제자 ID로 그룹 목록 조회"""
         where_clause = "user_id = %s"
@@ -47,6 +59,7 @@ class GroupRepository(BaseRepository[Group]):
         )
 
     @classmethod
+    @query_method
     async def get_groups_by_member(cls, user_id: int, conn: Connection = None) -> List[Group]:
         """사용자가 속한 그룹 목록 조회"""
         query = """
@@ -57,12 +70,12 @@ class GroupRepository(BaseRepository[Group]):
         ORDER BY g.name ASC
         """
 
-        cursor = await cls.execute_query(query, (user_id,), conn)
-        results = await cursor.fetchall()
+        results = await cls.fetch_all(query, (user_id,), conn)
 
-        return [Group(**result) for result in results]
+        return materialize_many(Group, results)
 
     @classmethod
+    @query_method
     async def get_group_with_members(cls, group_id: int, conn: Connection = None) -> Dict[str, Any]:
         """그룹 및 멤버 목록 조회"""
         # 그룹 정보 조회
@@ -74,8 +87,7 @@ class GroupRepository(BaseRepository[Group]):
         query = """
         SELECT user_id FROM group_member WHERE group_id = %s
         """
-        cursor = await cls.execute_query(query, (group_id,), conn)
-        members = await cursor.fetchall()
+        members = await cls.fetch_all(query, (group_id,), conn)
 
         member_ids = [member["user_id"] for member in members]
 
@@ -84,6 +96,19 @@ class GroupRepository(BaseRepository[Group]):
             "members": member_ids
         }
 
+    @classmethod
+    @query_method
+    async def delete(cls, group_id: int, conn: Connection = None) -> bool:
+        """그룹 삭제 (소속 멤버의 그룹 멤버십 캐시도 제거)"""
+        member_ids = await GroupMemberRepository.get_members(group_id, conn)
+
+        success = await super().delete(group_id, conn)
+
+        for user_id in member_ids:
+            GroupMemberRepository.invalidate_group_ids(user_id)
+
+        return success
+
 
 class GroupMemberRepository(BaseRepository[GroupMember]):
     """그룹 멤버 관련 데이터베이스 작업을 처리하는 레포지토리"""
@@ -93,6 +118,7 @@ class GroupMemberRepository(BaseRepository[GroupMember]):
     id_column = "member_id"
 
     @classmethod
+    @query_method
     async def add_member(cls, member: GroupMemberCreate, conn: Connection = None) -> int:
         """그룹에 멤버 추가"""
         query = """
@@ -104,35 +130,105 @@ class GroupMemberRepository(BaseRepository[GroupMember]):
             member.user_id
         )
 
-        cursor = await cls.execute_query(query, values, conn)
-        return cursor.lastrowid
+        result = await cls.execute(query, values, conn)
+        cls.invalidate_group_ids(member.user_id)
+        return result.lastrowid
 
     @classmethod
+    @query_method
     async def remove_member(cls, group_id: int, user_id: int, conn: Connection = None) -> bool:
         """그룹에서 멤버 제거"""
         query = """
         DELETE FROM group_member WHERE group_id = %s AND user_id = %s
         """
-        cursor = await cls.execute_query(query, (group_id, user_id), conn)
-        return cursor.rowcount > 0
+        result = await cls.execute(query, (group_id, user_id), conn)
+        cls.invalidate_group_ids(user_id)
+        return result.rowcount > 0
+
+    @classmethod
+    @query_method
+    async def get_group_ids(cls, user_id: int, conn: Connection = None) -> Tuple[int, ...]:
+        """사용자가 속한 그룹 ID 목록 조회 (캐시 사용, ID 오름차순)
+
+        다른 워커에서의 멤버 변경은 TTL이 지난 뒤에 반영됨
+        """
+        group_ids = _membership_cache.get(user_id)
+        if group_ids is None:
+            query = "SELECT group_id FROM group_member WHERE user_id = %s ORDER BY group_id"
+            rows = await cls.fetch_all(query, (user_id,), conn)
+            group_ids = tuple(row["group_id"] for row in rows)
+            _membership_cache.set(user_id, group_ids)
+        return group_ids
+
+    @classmethod
+    def invalidate_group_ids(cls, user_id: int) -> None:
+        """사용자의 그룹 멤버십 캐시 제거 (멤버 추가/제거, 그룹 삭제 시 호출)"""
+        _membership_cache.delete(user_id)
+
+    @classmethod
+    @query_method
+    async def add_members_bulk(cls, group_id: int, user_ids: Sequence[int], conn: Connection = None) -> int:
+        """그룹에 여러 멤버를 하나의 multi-row INSERT IGNORE로 추가하고 실제로 추가된 행 수 반환
+
+        이미 멤버인 사용자는 (group_id, user_id) 유니크 키로 건너뜀
+        """
+        if not user_ids:
+            return 0
+
+        placeholders = ', '.join(['(%s, %s)'] * len(user_ids))
+        query = f"INSERT IGNORE INTO group_member (group_id, user_id) VALUES {placeholders}"
+        values = tuple(value for user_id in user_ids for value in (group_id, user_id))
+
+        result = await cls.execute(query, values, conn)
+        for user_id in user_ids:
+            cls.invalidate_group_ids(user_id)
+        return result.rowcount
+
+    @classmethod
+    @query_method
+    async def remove_members_bulk(cls, group_id: int, user_ids: Sequence[int], conn: Connection = None) -> int:
+        """그룹에서 여러 멤버를 한 번에 제거하고 제거된 행 수 반환"""
+        if not user_ids:
+            return 0
+
+        placeholders = ', '.join(['%s'] * len(user_ids))
+        query = f"DELETE FROM group_member WHERE group_id = %s AND user_id IN ({placeholders})"
+
+        result = await cls.execute(query, (group_id, *user_ids), conn)
+        for user_id in user_ids:
+            cls.invalidate_group_ids(user_id)
+        return result.rowcount
+
+    @classmethod
+    @query_method
+    async def get_member_ids_among(cls, group_id: int, user_ids: Sequence[int], conn: Connection = None) -> Set[int]:
+        """주어진 사용자 중 그룹 멤버인 사용자 ID 집합 조회"""
+        if not user_ids:
+            return set()
+
+        placeholders = ', '.join(['%s'] * len(user_ids))
+        query = f"SELECT user_id FROM group_member WHERE group_id = %s AND user_id IN ({placeholders})"
+
+        rows = await cls.fetch_all(query, (group_id, *user_ids), conn)
+        return {row["user_id"] for row in rows}
 
     @classmethod
+    @query_method
     async def is_member(cls, group_id: int, user_id: int, conn: Connection = None) -> bool:
         """사용자가 그룹 멤버인지 확인"""
         query = """
         SELECT COUNT(*) as count FROM group_member 
         WHERE group_id = %s AND user_id = %s
         """
-        cursor = await cls.execute_query(query, (group_id, user_id), conn)
-        result = await cursor.fetchone()
-        return result["count"] > 0
+        count = await cls.fetch_val(query, (group_id, user_id), conn, default=0)
+        return count > 0
 
     @classmethod
+    @query_method
     async def get_members(cls, group_id: int, conn: Connection = None) -> List[int]:
         """그룹 멤버 목록 조회"""
         query = """
         SELECT user_id FROM group_member WHERE group_id = %s
         """
-        cursor = await cls.execute_query(query, (group_id,), conn)
-        results = await cursor.fetchall()
+        results = await cls.fetch_all(query, (group_id,), conn)
         return [result["user_id"] for result in results]
\ No newline at end of file
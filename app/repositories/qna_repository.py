@@ -1,146 +1,220 @@
 # app/repositories/qna_repository.py
 import logging
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, FrozenSet, NamedTuple
 
 from asyncmy import Connection
 
+from app.core.cache import TTLCache
+from app.core.config import settings
 from app.models.answer import Answer
 from app.models.category import Category
 from app.models.qna import QuestionWithAnswers
 from app.models.question import Question
-from app.repositories.base_repository import BaseRepository
+from app.repositories.base_repository import BaseRepository, query_method
+from app.repositories.category_repository import CategoryRegistry
+from app.repositories.row_mapper import materialize, materialize_many
 
 logger = logging.getLogger(__name__)
 
 
+class AnswerKey(NamedTuple):
+    """채점에 필요한 문제 정보 (정답 키)"""
+    answer_type: int  # 1: 한 개 정답, 2: 여러 개 정답
+    category_id: int
+    correct_answer_ids: FrozenSet[int]
+    answer_count: int
+
+
+# 질문 ID별 정답 키 캐시
+_answer_key_cache = TTLCache(maxsize=settings.ANSWER_KEY_CACHE_SIZE, ttl=settings.ANSWER_KEY_CACHE_TTL, name="answer_key")
+
+
 class QnARepository:
     """질문과 답변을 함께 처리하는 레포지토리"""
 
-    @staticmethod
-    async def get_question_with_answers(question_id: int, conn: Connection = None) -> Optional[QuestionWithAnswers]:
-        """질문과 그에 대한 답변들을 함께 조회"""
-        query = """
+    # 질문 조회 시 공통으로 사용하는 SELECT 절 (카테고리는 CategoryRegistry에서 채움)
+    # 카테고리가 없는 질문은 목록에서 빠지도록 category와 JOIN만 함 (컬럼은 가져오지 않음)
+    _QUESTION_SELECT = """
         SELECT 
-            q.*,
-            a.answer_id,
-            a.question_id as answer_question_id,
-            a.is_correct,
-            a.answer_text,
-            a.note as answer_note,
-            a.create_at as answer_create_at,
-            a.update_at as answer_update_at,
-            c.category_id,
-            c.name as category_name,
-            c.is_use as category_is_use,
-            c.create_at as category_create_at,
-            c.update_at as category_update_at
+            q.*
         FROM 
             question q
         JOIN
-            category c ON q.category_id = c.category_id    
-        LEFT JOIN 
-            answer a ON q.question_id = a.question_id
-        WHERE 
-            q.question_id = %s
+            category c ON q.category_id = c.category_id
+    """
+
+    @staticmethod
+    def _build_question_with_answers(row: Dict[str, Any],
+                                     answers: List[Answer],
+                                     category: Optional[Category]) -> QuestionWithAnswers:
+        """질문 행과 답변 목록, 카테고리로 QuestionWithAnswers 생성"""
+        question_data = {k: row[k] for k in Question.model_fields if k in row}
+        question_data['answers'] = answers
+        question_data['category'] = category
+        return materialize(QuestionWithAnswers, question_data)
+
+    @staticmethod
+    @query_method
+    async def get_answers_by_question_ids(question_ids: List[int],
+                                           conn: Connection = None) -> Dict[int, List[Answer]]:
+        """여러 질문의 답변을 한 번에 조회하여 질문 ID별로 묶어서 반환"""
+        answers_by_question: Dict[int, List[Answer]] = {qid: [] for qid in question_ids}
+        if not question_ids:
+            return answers_by_question
+
+        placeholders = ', '.join(['%s'] * len(question_ids))
+        query = f"""
+        SELECT * FROM answer
+        WHERE question_id IN ({placeholders})
+        ORDER BY question_id, answer_id
         """
 
-        # 공통 쿼리 실행 메서드 활용
-        cursor = await BaseRepository.execute_query(query, (question_id,), conn)
-        rows = await cursor.fetchall()
+        rows = await BaseRepository.fetch_all(query, tuple(question_ids), conn)
+        for answer in materialize_many(Answer, rows):
+            answers_by_question[answer.question_id].append(answer)
+
+        return answers_by_question
 
+    @staticmethod
+    @query_method
+    async def _assemble(rows: List[Dict[str, Any]], conn: Connection = None) -> List[QuestionWithAnswers]:
+        """질문 행 목록에 답변(일괄 조회)과 카테고리(레지스트리)를 붙임 (행 순서 유지)
+
+        조회 사이에 카테고리가 삭제되어 레지스트리에서 찾지 못한 행은 제외 (JOIN 결과와 동일하게)
+        """
         if not rows:
-            return None
+            return []
 
-        # 첫 번째 행에서 질문 정보 추출
-        question_data = {k: v for k, v in rows[0].items()
-                         if not k.startswith('answer_') and not k.startswith('category_')}
-        question = Question(**question_data)
-
-        # 카테고리 정보 추출
-        category_data = {
-            'category_id': rows[0]['category_id'],
-            'name': rows[0]['category_name'],
-            'is_use': rows[0]['category_is_use'],
-            'create_at': rows[0]['category_create_at'],
-            'update_at': rows[0]['category_update_at']
-        }
-        category = Category(**category_data)
-
-        # 답변 목록 생성
-        answers = []
-        for row in rows:
-            if row.get('answer_id'):  # 답변이 있는 경우에만
-                answer_data = {
-                    'answer_id': row['answer_id'],
-                    'question_id': row['answer_question_id'],
-                    'is_correct': row['is_correct'],
-                    'answer_text': row['answer_text'],
-                    'note': row['answer_note'],
-                    'create_at': row['answer_create_at'],
-                    'update_at': row['answer_update_at']
-                }
-                answers.append(Answer(**answer_data))
-
-        # 질문, 카테고리, 답변을 합쳐서 반환
-        return QuestionWithAnswers(**question.dict(), answers=answers, category=category)
+        question_ids = [row['question_id'] for row in rows]
+        answers_by_question = await QnARepository.get_answers_by_question_ids(question_ids, conn)
+        categories = await CategoryRegistry.get_many(row['category_id'] for row in rows)
+
+        return [
+            QnARepository._build_question_with_answers(
+                row, answers_by_question[row['question_id']], categories[row['category_id']]
+            )
+            for row in rows
+            if categories[row['category_id']] is not None
+        ]
+
+    @staticmethod
+    @query_method
+    async def get_questions_with_answers_by_ids(question_ids: List[int],
+                                                conn: Connection = None) -> List[QuestionWithAnswers]:
+        """질문 ID 목록에 해당하는 질문과 답변들을 일괄 조회 (질문 1회 + 답변 1회 쿼리)
+
+        반환 순서는 question_ids 순서를 따르며, 존재하지 않는 ID는 건너뜀
+        """
+        if not question_ids:
+            return []
+
+        placeholders = ', '.join(['%s'] * len(question_ids))
+        query = QnARepository._QUESTION_SELECT + f" WHERE q.question_id IN ({placeholders})"
+
+        rows = await BaseRepository.fetch_all(query, tuple(question_ids), conn)
+        rows_by_id = {row['question_id']: row for row in rows}
+
+        # 요청한 순서대로 정렬 (중복 ID 제거)
+        ordered_rows = []
+        seen = set()
+        for qid in question_ids:
+            if qid in rows_by_id and qid not in seen:
+                ordered_rows.append(rows_by_id[qid])
+                seen.add(qid)
+
+        return await QnARepository._assemble(ordered_rows, conn)
+
+    @staticmethod
+    @query_method
+    async def get_question_with_answers(question_id: int, conn: Connection = None) -> Optional[QuestionWithAnswers]:
+        """질문과 그에 대한 답변들을 함께 조회"""
+        results = await QnARepository.get_questions_with_answers_by_ids([question_id], conn)
+        return results[0] if results else None
 
     @staticmethod
+    @query_method
     async def get_all_questions_with_answers(
             skip: int = 0,
             limit: int = 10,
             category_id: Optional[int] = None,
-            conn: Connection = None
+            conn: Connection = None,
+            after_id: Optional[int] = None
     ) -> List[QuestionWithAnswers]:
-        """모든 질문과 그에 대한 답변들을 함께 조회 (페이지네이션)"""
-        # 기본 쿼리
-        query = """
-        SELECT 
-            q.question_id
-        FROM 
-            question q
-        """
+        """모든 질문과 그에 대한 답변들을 함께 조회 (페이지네이션)
 
+        질문 페이지 1회 + 답변 1회, 총 2번의 쿼리로 조회
+        after_id가 주어지면 skip 대신 해당 질문 ID 다음(더 작은 ID)부터 조회 (키셋 방식)
+        """
+        query = QnARepository._QUESTION_SELECT
+        conditions = []
         params = []
 
         # 카테고리 필터링
         if category_id:
-            query += " WHERE q.category_id = %s"
+            conditions.append("q.category_id = %s")
             params.append(category_id)
 
-        # 정렬 및 페이지네이션
-        query += " ORDER BY q.question_id DESC LIMIT %s, %s"
-        params.extend([skip, limit])
+        if after_id is not None:
+            conditions.append("q.question_id < %s")
+            params.append(after_id)
 
-        # 커넥션 관리
-        cursor = await BaseRepository.execute_query(query, tuple(params), conn)
-        question_ids = [row['question_id'] for row in await cursor.fetchall()]
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
 
-        # 각 질문에 대해 상세 정보와 답변 가져오기
-        results = []
-        for qid in question_ids:
-            question_with_answers = await QnARepository.get_question_with_answers(qid, conn)
-            if question_with_answers:
-                results.append(question_with_answers)
+        # 정렬 및 페이지네이션
+        if after_id is not None:
+            query += " ORDER BY q.question_id DESC LIMIT %s"
+            params.append(limit)
+        else:
+            query += " ORDER BY q.question_id DESC LIMIT %s, %s"
+            params.extend([skip, limit])
 
-        return results
+        rows = await BaseRepository.fetch_all(query, tuple(params), conn)
+
+        return await QnARepository._assemble(rows, conn)
 
     @staticmethod
-    async def check_answers(question_id: int, selected_answer_ids: List[int], conn: Connection = None) -> Dict[
-        str, Any]:
-        """사용자가 선택한 답변이 정답인지 확인"""
-        # 문제와 답변 정보 가져오기
-        query_question = "SELECT * FROM question WHERE question_id = %s"
-        query_answers = """
-        SELECT answer_id, is_correct
-        FROM answer
-        WHERE question_id = %s
+    @query_method
+    async def get_answer_key(question_id: int, conn: Connection = None) -> Optional[AnswerKey]:
+        """질문의 정답 키 조회 (캐시에 없으면 질문 + 답변을 한 번의 쿼리로 조회)
+
+        질문이 없으면 None (없는 질문은 캐시하지 않음)
+        """
+        key = _answer_key_cache.get(question_id)
+        if key is not None:
+            return key
+
+        query = """
+        SELECT q.answer_type, q.category_id, a.answer_id, a.is_correct
+        FROM question q
+        LEFT JOIN answer a ON a.question_id = q.question_id
+        WHERE q.question_id = %s
         """
 
-        # 1. 문제 정보 조회
-        cursor_question = await BaseRepository.execute_query(query_question, (question_id,), conn)
-        question_data = await cursor_question.fetchone()
+        rows = await BaseRepository.fetch_all(query, (question_id,), conn)
+        if not rows:
+            return None
+
+        answer_rows = [row for row in rows if row['answer_id'] is not None]
+        key = AnswerKey(
+            answer_type=rows[0]['answer_type'],
+            category_id=rows[0]['category_id'],
+            correct_answer_ids=frozenset(row['answer_id'] for row in answer_rows if row['is_correct'] == 'Y'),
+            answer_count=len(answer_rows)
+        )
+        _answer_key_cache.set(question_id, key)
+
+        return key
 
-        if not question_data:
+    @staticmethod
+    def invalidate_answer_key(question_id: int) -> None:
+        """정답 키 캐시에서 질문 제거 (질문/답변 수정 및 삭제 시 호출)"""
+        _answer_key_cache.delete(question_id)
+
+    @staticmethod
+    def grade(key: Optional[AnswerKey], selected_answer_ids: List[int]) -> Dict[str, Any]:
+        """정답 키와 선택한 답변으로 채점 (DB 조회 없음)"""
+        if key is None:
             return {
                 "success": False,
                 "message": "질문을 찾을 수 없습니다.",
@@ -149,13 +223,7 @@ class QnARepository:
                 "incorrect_selections": []
             }
 
-        answer_type = question_data['answer_type']
-
-        # 2. 답변 정보 조회
-        cursor_answers = await BaseRepository.execute_query(query_answers, (question_id,), conn)
-        answers = await cursor_answers.fetchall()
-
-        if not answers:
+        if not key.answer_count:
             return {
                 "success": False,
                 "message": "질문에 대한 답변이 없습니다.",
@@ -164,18 +232,17 @@ class QnARepository:
                 "incorrect_selections": []
             }
 
-        # 정답 ID 리스트
-        correct_answer_ids = [a['answer_id'] for a in answers if a['is_correct'] == 'Y']
+        answer_type = key.answer_type
+        correct_answer_ids = key.correct_answer_ids
+        selected = set(selected_answer_ids)
 
         # 사용자가 선택한 답변 중 정답이 아닌 것들
         incorrect_selections = [aid for aid in selected_answer_ids if aid not in correct_answer_ids]
 
         # 사용자가 선택하지 않은 정답들
-        unselected_correct = [aid for aid in correct_answer_ids if aid not in selected_answer_ids]
+        unselected_correct = sorted(correct_answer_ids - selected)
 
         # 문제 유형에 따른 정답 처리
-        is_correct = False
-
         if answer_type == 1:  # 정답이 한 개인 경우
             # 정확히 하나의 정답만 선택해야 함
             is_correct = len(selected_answer_ids) == 1 and len(incorrect_selections) == 0
@@ -196,7 +263,15 @@ class QnARepository:
             "success": True,
             "message": message,
             "is_correct": is_correct,
-            "correct_answers": correct_answer_ids,
+            "correct_answers": sorted(correct_answer_ids),
             "incorrect_selections": incorrect_selections,
             "unselected_correct": unselected_correct if not is_correct else []
-        }
\ No newline at end of file
+        }
+
+    @staticmethod
+    @query_method
+    async def check_answers(question_id: int, selected_answer_ids: List[int], conn: Connection = None) -> Dict[
+        str, Any]:
+        """사용자가 선택한 답변이 정답인지 확인"""
+        key = await QnARepository.get_answer_key(question_id, conn)
+        return QnARepository.grade(key, selected_answer_ids)
@@ -1,9 +1,11 @@
 # app/repositories/question_repository.py
 import logging
-from typing import List, Optional
+from typing import List, Optional, Sequence, Tuple
 from asyncmy import Connection
 from app.models.question import Question, QuestionCreate, QuestionUpdate
-from app.repositories.base_repository import BaseRepository
+from app.repositories.base_repository import BaseRepository, query_method
+from app.repositories.group_repository import GroupMemberRepository
+from app.repositories.row_mapper import materialize_many
 
 logger = logging.getLogger(__name__)
 
@@ -16,6 +18,7 @@ class QuestionRepository(BaseRepository[Question]):
     id_column = "question_id"
 
     @classmethod
+    @query_method
     async def create(cls, question: QuestionCreate, conn: Connection = None) -> int:
         """새 질문 생성"""
         query = """
@@ -32,10 +35,11 @@ class QuestionRepository(BaseRepository[Question]):
             question.group_id
         )
 
-        cursor = await cls.execute_query(query, values, conn)
-        return cursor.lastrowid
+        result = await cls.execute(query, values, conn)
+        return result.lastrowid
 
     @classmethod
+    @query_method
     async def get_all_by_creator(cls,
                                  user_id: int,
                                  skip: int = 0,
@@ -55,6 +59,7 @@ class QuestionRepository(BaseRepository[Question]):
         )
 
     @classmethod
+    @query_method
     async def get_questions_by_group(cls,
                                      group_id: int,
                                      skip: int = 0,
@@ -73,36 +78,101 @@ class QuestionRepository(BaseRepository[Question]):
             conn=conn
         )
 
+    @staticmethod
+    def _visible_questions_query(group_condition: str,
+                                 group_params: Sequence[int],
+                                 category_id: Optional[int],
+                                 after_id: Optional[int]) -> Tuple[str, List]:
+        """공개 범위 조건 하나에 대한 질문 조회 쿼리 (질문 ID 내림차순, LIMIT 제외)"""
+        conditions = [group_condition]
+        params = list(group_params)
+
+        if category_id:
+            conditions.append("q.category_id = %s")
+            params.append(category_id)
+
+        if after_id is not None:
+            conditions.append("q.question_id < %s")
+            params.append(after_id)
+
+        query = "SELECT q.* FROM question q WHERE " + " AND ".join(conditions) + " ORDER BY q.question_id DESC"
+        return query, params
+
     @classmethod
+    @query_method
     async def get_available_questions_for_user(cls,
                                                user_id: int,
                                                skip: int = 0,
                                                limit: int = 100,
                                                category_id: Optional[int] = None,
-                                               conn: Connection = None) -> List[Question]:
-        """사용자가 풀 수 있는 질문 목록 조회"""
-        query = """
-        SELECT q.* FROM question q
-        WHERE (q.group_id IS NULL OR q.group_id IN (
-            SELECT group_id FROM group_member WHERE user_id = %s
-        ))
+                                               conn: Connection = None,
+                                               after_id: Optional[int] = None,
+                                               group_ids: Optional[Sequence[int]] = None) -> List[Question]:
+        """사용자가 풀 수 있는 질문 목록 조회 (그룹 제한 없는 질문 + 소속 그룹의 질문)
+
+        after_id가 주어지면 skip 대신 해당 질문 ID 다음(더 작은 ID)부터 조회 (키셋 방식)
+        group_ids가 없으면 그룹 멤버십 캐시에서 조회
+
+        OR 조건은 인덱스를 타지 못하므로, 공개 질문과 그룹 질문을 각각 (group_id, question_id)
+        인덱스로 필요한 만큼만 읽은 뒤 UNION ALL로 합쳐서 정렬
         """
+        if group_ids is None:
+            group_ids = await GroupMemberRepository.get_group_ids(user_id, conn)
 
-        params = [user_id]
+        # 페이지 범위 (키셋 방식이면 OFFSET 없음)
+        offset = 0 if after_id is not None else skip
 
-        if category_id:
-            query += " AND q.category_id = %s"
-            params.append(category_id)
+        query, params = cls._visible_questions_query("q.group_id IS NULL", (), category_id, after_id)
+
+        if group_ids:
+            placeholders = ', '.join(['%s'] * len(group_ids))
+            group_query, group_params = cls._visible_questions_query(
+                f"q.group_id IN ({placeholders})", group_ids, category_id, after_id
+            )
+
+            # 각 부분 쿼리는 페이지 끝까지만 읽음
+            query = f"""
+            ({query} LIMIT %s)
+            UNION ALL
+            ({group_query} LIMIT %s)
+            ORDER BY question_id DESC
+            """
+            params = params + [offset + limit] + group_params + [offset + limit]
+
+        query += " LIMIT %s, %s"
+        params.extend([offset, limit])
+
+        results = await cls.fetch_all(query, tuple(params), conn)
+
+        return materialize_many(Question, results)
+
+    @classmethod
+    @query_method
+    async def get_ids_by_category(cls, category_id: int, conn: Connection = None) -> List[int]:
+        """카테고리에 속한 질문 ID 목록 조회 (ID 오름차순)"""
+        query = "SELECT question_id FROM question WHERE category_id = %s ORDER BY question_id"
+
+        rows = await cls.fetch_all(query, (category_id,), conn)
+
+        return [row['question_id'] for row in rows]
+
+    @classmethod
+    @query_method
+    async def filter_existing_ids(cls, question_ids: List[int], conn: Connection = None) -> List[int]:
+        """주어진 질문 ID 중 실제로 존재하는 ID만 반환 (입력 순서 유지)"""
+        if not question_ids:
+            return []
 
-        query += " ORDER BY q.question_id DESC LIMIT %s, %s"
-        params.extend([skip, limit])
+        placeholders = ', '.join(['%s'] * len(question_ids))
+        query = f"SELECT question_id FROM question WHERE question_id IN ({placeholders})"
 
-        cursor = await cls.execute_query(query, tuple(params), conn)
-        results = await cursor.fetchall()
+        rows = await cls.fetch_all(query, tuple(question_ids), conn)
+        existing = {row['question_id'] for row in rows}
 
-        return [Question(**result) for result in results]
+        return [qid for qid in question_ids if qid in existing]
 
     @classmethod
+    @query_method
     async def update(cls, question_id: int, question_update: QuestionUpdate, conn: Connection = None) -> bool:
         """질문 업데이트"""
         return await super().update(question_id, question_update, conn)
\ No newline at end of file
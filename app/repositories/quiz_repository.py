@@ -9,7 +9,8 @@ from app.models.quiz_session import (
     QuizSession, QuizSessionCreate, QuizSessionWithStats,
     SessionQuestion
 )
-from app.repositories.base_repository import BaseRepository
+from app.repositories.base_repository import BaseRepository, query_method
+from app.repositories.category_repository import CategoryRegistry
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +23,7 @@ class QuizSessionRepository(BaseRepository[QuizSession]):
     id_column = "session_id"
 
     @classmethod
+    @query_method
     async def create_session(cls, session: QuizSessionCreate, conn: Connection = None) -> int:
         """새 퀴즈 세션 생성"""
         query = """
@@ -34,135 +36,79 @@ class QuizSessionRepository(BaseRepository[QuizSession]):
             session.description
         )
 
-        cursor = await cls.execute_query(query, values, conn)
-        return cursor.lastrowid
+        result = await cls.execute(query, values, conn)
+        return result.lastrowid
 
-    @classmethod
-    async def get_session_with_stats(cls, session_id: int, conn: Connection = None) -> Optional[QuizSessionWithStats]:
-        """세션 정보와 통계 함께 조회"""
-        query = """
+    # 세션 조회 시 공통으로 사용하는 SELECT 절 (카테고리는 CategoryRegistry에서 채움)
+    # (question_count, completed_count, correct_count는 quiz_session에 저장된 카운터)
+    # 카테고리가 없는 세션은 빠지도록 category와 JOIN만 함 (컬럼은 가져오지 않음)
+    _SESSION_SELECT = """
         SELECT 
-            qs.*,
-            c.name as category_name,
-            c.is_use as category_is_use,
-            c.create_at as category_create_at,
-            c.update_at as category_update_at,
-            (SELECT COUNT(*) FROM session_question WHERE session_id = qs.session_id) as question_count,
-            (SELECT COUNT(*) FROM session_question WHERE session_id = qs.session_id AND is_answered = 'Y') as completed_count,
-            (SELECT COUNT(*) FROM session_question WHERE session_id = qs.session_id AND is_correct = 'Y') as correct_count
+            qs.*
         FROM 
             quiz_session qs
         JOIN
             category c ON qs.category_id = c.category_id
-        WHERE 
-            qs.session_id = %s
-        """
+    """
+
+    @staticmethod
+    def _build_session_with_stats(row: Dict[str, Any], category: Optional[Category]) -> QuizSessionWithStats:
+        """세션 행과 카테고리로 QuizSessionWithStats 생성"""
+        return QuizSessionWithStats(
+            session_id=row['session_id'],
+            category_id=row['category_id'],
+            name=row['name'],
+            description=row['description'],
+            create_at=row['create_at'],
+            update_at=row['update_at'],
+            question_count=row['question_count'],
+            completed_count=row['completed_count'],
+            correct_count=row['correct_count'],
+            category=category
+        )
+
+    @classmethod
+    @query_method
+    async def _build_sessions_with_stats(cls, rows: List[Dict[str, Any]]) -> List[QuizSessionWithStats]:
+        """세션 행 목록으로 QuizSessionWithStats 목록 생성 (레지스트리에서 카테고리를 찾지 못한 행은 제외)"""
+        categories = await CategoryRegistry.get_many(row['category_id'] for row in rows)
+        return [cls._build_session_with_stats(row, categories[row['category_id']])
+                for row in rows if categories[row['category_id']] is not None]
+
+    @classmethod
+    @query_method
+    async def get_session_with_stats(cls, session_id: int, conn: Connection = None) -> Optional[QuizSessionWithStats]:
+        """세션 정보와 통계 함께 조회"""
+        query = cls._SESSION_SELECT + " WHERE qs.session_id = %s"
 
-        cursor = await cls.execute_query(query, (session_id,), conn)
-        result = await cursor.fetchone()
+        result = await cls.fetch_one(query, (session_id,), conn)
 
         if not result:
             return None
 
-        # 카테고리 정보 추출
-        category_data = {
-            'category_id': result['category_id'],
-            'name': result['category_name'],
-            'is_use': result['category_is_use'],
-            'create_at': result['category_create_at'],
-            'update_at': result['category_update_at']
-        }
-        category = Category(**category_data)
-
-        # 세션 기본 정보 추출
-        session_data = {
-            'session_id': result['session_id'],
-            'category_id': result['category_id'],
-            'name': result['name'],
-            'description': result['description'],
-            'create_at': result['create_at'],
-            'update_at': result['update_at'],
-            'question_count': result['question_count'],
-            'completed_count': result['completed_count'],
-            'correct_count': result['correct_count'],
-            'category': category
-        }
-
-        return QuizSessionWithStats(**session_data)
+        sessions = await cls._build_sessions_with_stats([result])
+        return sessions[0] if sessions else None
 
     @classmethod
+    @query_method
     async def get_sessions_by_category(cls, category_id: int, conn: Connection = None) -> List[QuizSessionWithStats]:
         """카테고리별 세션 목록 조회"""
-        query = """
-        SELECT 
-            qs.*,
-            c.name as category_name,
-            c.is_use as category_is_use,
-            c.create_at as category_create_at,
-            c.update_at as category_update_at,
-            (SELECT COUNT(*) FROM session_question WHERE session_id = qs.session_id) as question_count,
-            (SELECT COUNT(*) FROM session_question WHERE session_id = qs.session_id AND is_answered = 'Y') as completed_count,
-            (SELECT COUNT(*) FROM session_question WHERE session_id = qs.session_id AND is_correct = 'Y') as correct_count
-        FROM 
-            quiz_session qs
-        JOIN
-            category c ON qs.category_id = c.category_id
+        query = cls._SESSION_SELECT + """
         WHERE 
             qs.category_id = %s
         ORDER BY 
             qs.create_at DESC
         """
 
-        cursor = await cls.execute_query(query, (category_id,), conn)
-        results = await cursor.fetchall()
-
-        sessions = []
-        for result in results:
-            # 카테고리 정보 추출
-            category_data = {
-                'category_id': result['category_id'],
-                'name': result['category_name'],
-                'is_use': result['category_is_use'],
-                'create_at': result['category_create_at'],
-                'update_at': result['category_update_at']
-            }
-            category = Category(**category_data)
-
-            # 세션 기본 정보 추출
-            session_data = {
-                'session_id': result['session_id'],
-                'category_id': result['category_id'],
-                'name': result['name'],
-                'description': result['description'],
-                'create_at': result['create_at'],
-                'update_at': result['update_at'],
-                'question_count': result['question_count'],
-                'completed_count': result['completed_count'],
-                'correct_count': result['correct_count'],
-                'category': category
-            }
-
-            sessions.append(QuizSessionWithStats(**session_data))
-
-        return sessions
+        results = await cls.fetch_all(query, (category_id,), conn)
+
+        return await cls._build_sessions_with_stats(results)
 
     @classmethod
+    @query_method
     async def get_user_sessions(cls, user_id: int, conn: Connection = None) -> List[QuizSessionWithStats]:
         """사용자의 세션 목록 조회"""
-        query = """
-        SELECT 
-            qs.*,
-            c.name as category_name,
-            c.is_use as category_is_use,
-            c.create_at as category_create_at,
-            c.update_at as category_update_at,
-            (SELECT COUNT(*) FROM session_question WHERE session_id = qs.session_id) as question_count,
-            (SELECT COUNT(*) FROM session_question WHERE session_id = qs.session_id AND is_answered = 'Y') as completed_count,
-            (SELECT COUNT(*) FROM session_question WHERE session_id = qs.session_id AND is_correct = 'Y') as correct_count
-        FROM 
-            quiz_session qs
-        JOIN
-            category c ON qs.category_id = c.category_id
+        query = cls._SESSION_SELECT + """
         WHERE 
             qs.session_id IN (
                 SELECT DISTINCT sq.session_id 
@@ -174,38 +120,67 @@ class QuizSessionRepository(BaseRepository[QuizSession]):
             qs.create_at DESC
         """
 
-        cursor = await cls.execute_query(query, (user_id,), conn)
-        results = await cursor.fetchall()
-
-        sessions = []
-        for result in results:
-            # 카테고리 정보 추출
-            category_data = {
-                'category_id': result['category_id'],
-                'name': result['category_name'],
-                'is_use': result['category_is_use'],
-                'create_at': result['category_create_at'],
-                'update_at': result['category_update_at']
-            }
-            category = Category(**category_data)
-
-            # 세션 기본 정보 추출
-            session_data = {
-                'session_id': result['session_id'],
-                'category_id': result['category_id'],
-                'name': result['name'],
-                'description': result['description'],
-                'create_at': result['create_at'],
-                'update_at': result['update_at'],
-                'question_count': result['question_count'],
-                'completed_count': result['completed_count'],
-                'correct_count': result['correct_count'],
-                'category': category
-            }
-
-            sessions.append(QuizSessionWithStats(**session_data))
-
-        return sessions
+        results = await cls.fetch_all(query, (user_id,), conn)
+
+        return await cls._build_sessions_with_stats(results)
+
+    @classmethod
+    @query_method
+    async def increment_counters(cls,
+                                 session_id: int,
+                                 question_delta: int = 0,
+                                 completed_delta: int = 0,
+                                 correct_delta: int = 0,
+                                 conn: Connection = None) -> bool:
+        """세션 통계 카운터 증감"""
+        query = """
+        UPDATE quiz_session
+        SET question_count = question_count + %s,
+            completed_count = completed_count + %s,
+            correct_count = correct_count + %s
+        WHERE session_id = %s
+        """
+        values = (question_delta, completed_delta, correct_delta, session_id)
+
+        result = await cls.execute(query, values, conn)
+        return result.rowcount > 0
+
+    @classmethod
+    @query_method
+    async def rebuild_stats(cls, session_id: Optional[int] = None, conn: Connection = None) -> int:
+        """session_question 기준으로 세션 통계 카운터 재계산 (변경된 세션 수 반환)
+
+        session_id가 없으면 전체 세션을 재계산
+        """
+        inner_where = ""
+        outer_where = ""
+        params = None
+
+        if session_id is not None:
+            inner_where = "WHERE session_id = %s"
+            outer_where = "WHERE qs.session_id = %s"
+            params = (session_id, session_id)
+
+        query = f"""
+        UPDATE quiz_session qs
+        LEFT JOIN (
+            SELECT 
+                session_id,
+                COUNT(*) as question_count,
+                SUM(is_answered = 'Y') as completed_count,
+                SUM(is_correct = 'Y') as correct_count
+            FROM session_question
+            {inner_where}
+            GROUP BY session_id
+        ) s ON s.session_id = qs.session_id
+        SET qs.question_count = COALESCE(s.question_count, 0),
+            qs.completed_count = COALESCE(s.completed_count, 0),
+            qs.correct_count = COALESCE(s.correct_count, 0)
+        {outer_where}
+        """
+
+        result = await cls.execute(query, params, conn)
+        return result.rowcount
 
 
 class SessionQuestionRepository(BaseRepository[SessionQuestion]):
@@ -216,38 +191,107 @@ class SessionQuestionRepository(BaseRepository[SessionQuestion]):
     id_column = "sq_id"
 
     @classmethod
+    @query_method
     async def add_question_to_session(cls,
                                       session_id: int,
                                       question_id: int,
                                       order_num: int,
                                       conn: Connection = None) -> int:
-        """세션에 문제 추가"""
+        """세션에 문제 추가 (세션의 question_count도 함께 증가)
+
+        카운터가 어긋나지 않도록 conn에는 트랜잭션 커넥션을 전달
+        """
         query = """
         INSERT INTO session_question (session_id, question_id, order_num)
         VALUES (%s, %s, %s)
         """
         values = (session_id, question_id, order_num)
 
-        cursor = await cls.execute_query(query, values, conn)
-        return cursor.lastrowid
+        result = await cls.execute(query, values, conn)
+        await QuizSessionRepository.increment_counters(session_id, question_delta=1, conn=conn)
+
+        return result.lastrowid
+
+    @classmethod
+    @query_method
+    async def add_questions_bulk(cls,
+                                 session_id: int,
+                                 question_ids: List[int],
+                                 start_order: int = 1,
+                                 conn: Connection = None) -> int:
+        """세션에 여러 문제를 한 번의 INSERT로 추가하고 추가된 행 수 반환 (order_num은 start_order부터 순서대로)
+
+        세션의 question_count도 함께 증가하므로 conn에는 트랜잭션 커넥션을 전달
+        """
+        if not question_ids:
+            return 0
+
+        placeholders = ', '.join(['(%s, %s, %s)'] * len(question_ids))
+        query = f"INSERT INTO session_question (session_id, question_id, order_num) VALUES {placeholders}"
+
+        values = []
+        for order_num, question_id in enumerate(question_ids, start=start_order):
+            values.extend((session_id, question_id, order_num))
+
+        result = await cls.execute(query, tuple(values), conn)
+        await QuizSessionRepository.increment_counters(session_id, question_delta=len(question_ids), conn=conn)
+
+        return result.rowcount
 
     @classmethod
+    @query_method
     async def get_session_questions(cls, session_id: int, conn: Connection = None) -> List[Dict[str, Any]]:
-        """세션에 포함된 문제 ID 목록 조회"""
+        """세션에 포함된 문제 목록 조회 (문제 본문 포함, 문제의 생성/수정 시각은 question_ 접두사)"""
         query = """
-        SELECT sq.*, q.question_text, q.answer_type
+        SELECT 
+            sq.*,
+            q.category_id,
+            q.user_id,
+            q.answer_type,
+            q.question_text,
+            q.note,
+            q.link_url,
+            q.group_id,
+            q.create_at as question_create_at,
+            q.update_at as question_update_at
         FROM session_question sq
         JOIN question q ON sq.question_id = q.question_id
         WHERE sq.session_id = %s
         ORDER BY sq.order_num
         """
 
-        cursor = await cls.execute_query(query, (session_id,), conn)
-        results = await cursor.fetchall()
+        results = await cls.fetch_all(query, (session_id,), conn)
 
         return results
 
     @classmethod
+    @query_method
+    async def lock_for_submission(cls,
+                                  session_id: int,
+                                  question_id: int,
+                                  conn: Connection) -> Optional[List[Dict[str, Any]]]:
+        """답변 제출용 세션/세션 문제 확인 및 행 잠금 (쿼리 1회)
+
+        세션이 없으면 None, 세션에 문제가 없으면 빈 리스트,
+        있으면 해당 세션 문제들의 이전 결과(is_answered, is_correct) 목록 반환
+        """
+        query = """
+        SELECT sq.sq_id, sq.is_answered, sq.is_correct
+        FROM quiz_session qs
+        LEFT JOIN session_question sq
+            ON sq.session_id = qs.session_id AND sq.question_id = %s
+        WHERE qs.session_id = %s
+        FOR UPDATE
+        """
+
+        rows = await cls.fetch_all(query, (question_id, session_id), conn)
+        if not rows:
+            return None
+
+        return [row for row in rows if row['sq_id'] is not None]
+
+    @classmethod
+    @query_method
     async def is_question_in_session(cls, session_id: int, question_id: int, conn: Connection = None) -> bool:
         """문제가 해당 세션에 있는지 확인"""
         query = """
@@ -256,23 +300,56 @@ class SessionQuestionRepository(BaseRepository[SessionQuestion]):
         WHERE session_id = %s AND question_id = %s
         """
 
-        cursor = await cls.execute_query(query, (session_id, question_id), conn)
-        result = await cursor.fetchone()
+        count = await cls.fetch_val(query, (session_id, question_id), conn, default=0)
 
-        return result["count"] > 0
+        return count > 0
 
     @classmethod
+    @query_method
     async def update_question_result(cls,
                                      session_id: int,
                                      question_id: int,
                                      is_correct: str,
-                                     conn: Connection = None) -> bool:
-        """세션 문제의 결과 업데이트"""
+                                     conn: Connection = None,
+                                     prev_rows: List[Dict[str, Any]] = None) -> bool:
+        """세션 문제의 결과 업데이트 (세션의 completed_count, correct_count도 함께 갱신)
+
+        이전 결과를 잠근 뒤 변화량만큼 카운터를 증감하므로 conn에는 트랜잭션 커넥션을 전달
+        prev_rows: 같은 트랜잭션에서 이미 잠그고 조회한 이전 결과 (is_answered, is_correct)
+        """
+        if prev_rows is None:
+            # 이전 결과 조회 (동시 제출 시 카운터가 중복 반영되지 않도록 행 잠금)
+            query_prev = """
+            SELECT is_answered, is_correct
+            FROM session_question
+            WHERE session_id = %s AND question_id = %s
+            FOR UPDATE
+            """
+            prev_rows = await cls.fetch_all(query_prev, (session_id, question_id), conn)
+
+        if not prev_rows:
+            return False
+
         query = """
         UPDATE session_question
         SET is_answered = 'Y', is_correct = %s, answer_time = CURRENT_TIMESTAMP
         WHERE session_id = %s AND question_id = %s
         """
 
-        cursor = await cls.execute_query(query, (is_correct, session_id, question_id), conn)
-        return cursor.rowcount > 0
\ No newline at end of file
+        result = await cls.execute(query, (is_correct, session_id, question_id), conn)
+
+        # 같은 문제가 세션에 여러 번 들어있을 수 있으므로 행마다 변화량 계산
+        completed_delta = sum(1 for row in prev_rows if row['is_answered'] != 'Y')
+        correct_delta = sum(
+            (1 if is_correct == 'Y' else 0) - (1 if row['is_correct'] == 'Y' else 0)
+            for row in prev_rows
+        )
+        if completed_delta or correct_delta:
+            await QuizSessionRepository.increment_counters(
+                session_id,
+                completed_delta=completed_delta,
+                correct_delta=correct_delta,
+                conn=conn
+            )
+
+        return result.rowcount > 0
\ No newline at end of file
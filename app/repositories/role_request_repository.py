@@ -1,15 +1,25 @@
 # app/repositories/role_request_repository.py
 import logging
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, List, Optional, Sequence, Tuple
 
 from asyncmy import Connection
 
-from app.models.role_request import RoleRequest, RoleRequestCreate
-from app.repositories.base_repository import BaseRepository
+from app.models.role_request import RoleRequest, RoleRequestCreate, PendingRoleRequest
+from app.repositories.base_repository import BaseRepository, query_method
 
 logger = logging.getLogger(__name__)
 
+# 대기 중인 요청 목록 조회 컬럼 (PendingRoleRequest 필드 순서)
+PENDING_REQUEST_COLUMNS = (
+    "r.request_id", "r.user_id", "u.username", "u.email", "u.role AS current_role",
+    "r.requested_role", "r.reason", "r.create_at"
+)
+
+# 대기 중인 요청 목록과 전체 수 조회에 같이 쓰는 FROM / WHERE 절
+_PENDING_FROM = "role_request r JOIN user u ON u.user_id = r.user_id"
+_PENDING_WHERE = "r.status = %s"
+
 
 class RoleRequestRepository(BaseRepository[RoleRequest]):
     """역할 변경 요청 관련 데이터베이스 작업을 처리하는 레포지토리"""
@@ -19,6 +29,7 @@ class RoleRequestRepository(BaseRepository[RoleRequest]):
     id_column = "request_id"
 
     @classmethod
+    @query_method
     async def create(cls, role_request: RoleRequestCreate, conn: Connection = None) -> int:
         """새 역할 변경 요청 생성"""
         query = """
@@ -32,20 +43,41 @@ class RoleRequestRepository(BaseRepository[RoleRequest]):
             role_request.status
         )
 
-        cursor = await cls.execute_query(query, values, conn)
-        return cursor.lastrowid
+        result = await cls.execute(query, values, conn)
+        return result.lastrowid
 
     @classmethod
-    async def get_pending_requests(cls, conn: Connection = None) -> List[RoleRequest]:
-        """대기 중인 모든 요청 조회"""
-        return await cls.get_all(
-            where_clause="status = %s",
+    @query_method
+    async def get_pending_requests_page(cls,
+                                        limit: int,
+                                        after: Optional[Sequence[Any]] = None,
+                                        conn: Connection = None
+                                        ) -> Tuple[List[PendingRoleRequest], Optional[Tuple[Any, ...]]]:
+        """대기 중인 요청을 요청자 정보와 함께 키셋 방식으로 조회 (오래된 순)
+
+        after: 이전 페이지 마지막 행의 (create_at, request_id)
+        반환값: (요청 + 사용자 정보 목록, 다음 페이지 키 값 - 마지막 페이지면 None)
+        """
+        return await cls.get_page(
+            key_columns=("r.create_at", "r.request_id"),
+            limit=limit,
+            after=after,
+            where_clause=_PENDING_WHERE,
             params=("pending",),
-            order_by="create_at ASC",  # 변경: created_at → create_at
-            conn=conn
+            columns=PENDING_REQUEST_COLUMNS,
+            model=PendingRoleRequest,
+            conn=conn,
+            from_clause=_PENDING_FROM
         )
 
     @classmethod
+    @query_method
+    async def count_pending_requests(cls, conn: Connection = None) -> int:
+        """대기 중인 요청 수 조회 (목록 조회와 같은 JOIN 조건이므로 사용자가 없는 요청은 제외)"""
+        return await cls.count(_PENDING_WHERE, ("pending",), conn, from_clause=_PENDING_FROM)
+
+    @classmethod
+    @query_method
     async def get_user_requests(cls, user_id: int, conn: Connection = None) -> List[RoleRequest]:
         """특정 사용자의 모든 요청 조회"""
         return await cls.get_all(
@@ -56,6 +88,7 @@ class RoleRequestRepository(BaseRepository[RoleRequest]):
         )
 
     @classmethod
+    @query_method
     async def get_latest_pending_request(cls, user_id: int, conn: Connection = None) -> Optional[RoleRequest]:
         """사용자의 가장 최근 대기 중인 요청 조회"""
         query = """
@@ -65,20 +98,15 @@ class RoleRequestRepository(BaseRepository[RoleRequest]):
         LIMIT 1
         """
 
-        cursor = await cls.execute_query(query, (user_id,), conn)
-        result = await cursor.fetchone()
+        result = await cls.fetch_one(query, (user_id,), conn)
 
         if not result:
             return None
 
-        if not isinstance(result, dict) and hasattr(cursor, 'description'):
-            column_names = [column[0] for column in cursor.description]
-            result_dict = dict(zip(column_names, result))
-            return cls.model_class(**result_dict)
-        else:
-            return cls.model_class(**result)
+        return cls._to_model(result)
 
     @classmethod
+    @query_method
     async def update_status(cls,
                             request_id: int,
                             status: str,
@@ -94,9 +122,9 @@ class RoleRequestRepository(BaseRepository[RoleRequest]):
 
         process_at = datetime.utcnow()  # 변경: processed_at → process_at
 
-        cursor = await cls.execute_query(
+        result = await cls.execute(
             query,
             (status, admin_id, process_at, admin_comment, request_id),
             conn
         )
-        return cursor.rowcount > 0
+        return result.rowcount > 0
@@ -0,0 +1,92 @@
+# app/repositories/row_mapper.py
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type, TypeVar
+
+from pydantic import BaseModel
+
+from app.core.config import settings
+
+M = TypeVar('M', bound=BaseModel)
+
+_new = object.__new__
+_setattr = object.__setattr__
+
+
+class RowMapper:
+    """DB 행(딕셔너리)을 검증 없이 pydantic 모델로 바로 만드는 매퍼
+
+    모델과 행의 컬럼 구성(커서 description)마다 한 번만 만들어 캐시하며,
+    model_construct와 같은 방식으로 인스턴스의 __dict__를 직접 채움
+    (DB에서 읽은 값은 스키마가 보장하므로 타입 변환/검증을 생략)
+    """
+
+    __slots__ = ("model", "present", "missing", "fields_set", "exact")
+
+    def __init__(self, model: Type[BaseModel], columns: Tuple[str, ...]):
+        self.model = model
+        self.present = tuple(name for name in model.model_fields if name in columns)
+        self.missing = tuple(
+            (name, field) for name, field in model.model_fields.items() if name not in columns
+        )
+        self.fields_set = frozenset(self.present)
+        # 행의 컬럼이 모델 필드와 정확히 같으면 행 딕셔너리를 그대로 복사해서 사용
+        self.exact = not self.missing and len(columns) == len(self.present)
+
+    def __call__(self, row: Dict[str, Any]) -> BaseModel:
+        if self.exact:
+            values = dict(row)
+        else:
+            values = {name: row[name] for name in self.present}
+            for name, field in self.missing:
+                values[name] = field.get_default(call_default_factory=True)
+
+        instance = _new(self.model)
+        _setattr(instance, "__dict__", values)
+        _setattr(instance, "__pydantic_fields_set__", set(self.fields_set))
+        _setattr(instance, "__pydantic_extra__", None)
+        _setattr(instance, "__pydantic_private__", None)
+        return instance
+
+
+# (모델, 컬럼 목록) → RowMapper (컬럼 목록이 맞지 않아 쓸 수 없으면 None)
+_mappers: Dict[Tuple[Type[BaseModel], Tuple[str, ...]], Optional[RowMapper]] = {}
+
+
+def _get_mapper(model: Type[BaseModel], columns: Tuple[str, ...]) -> Optional[RowMapper]:
+    """캐시된 매퍼 조회 (필수 필드가 빠져 있거나 private/extra 속성을 쓰는 모델이면 None)"""
+    key = (model, columns)
+    if key in _mappers:
+        return _mappers[key]
+
+    mapper = None
+    if not model.__private_attributes__ and model.model_config.get("extra") != "allow":
+        candidate = RowMapper(model, columns)
+        if not any(field.is_required() for _, field in candidate.missing):
+            mapper = candidate
+
+    _mappers[key] = mapper
+    return mapper
+
+
+def materialize(model: Type[M], row: Dict[str, Any]) -> M:
+    """DB 행 하나를 모델로 변환 (STRICT_ROW_VALIDATION이면 전체 검증)"""
+    if settings.STRICT_ROW_VALIDATION:
+        return model(**row)
+
+    mapper = _get_mapper(model, tuple(row))
+    return mapper(row) if mapper else model(**row)
+
+
+def materialize_many(model: Type[M], rows: Iterable[Dict[str, Any]]) -> List[M]:
+    """같은 컬럼 구성의 DB 행 목록을 모델 목록으로 변환 (매퍼는 첫 행 기준으로 한 번만 조회)"""
+    rows = rows if isinstance(rows, list) else list(rows)
+    if not rows:
+        return []
+
+    if settings.STRICT_ROW_VALIDATION:
+        return [model(**row) for row in rows]
+
+    mapper = _get_mapper(model, tuple(rows[0]))
+    if mapper is None:
+        return [model(**row) for row in rows]
+
+    return [mapper(row) for row in rows]
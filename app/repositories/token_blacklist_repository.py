@@ -1,11 +1,14 @@
 # app/repositories/token_blacklist_repository.py
 import logging
-from datetime import datetime
+from datetime import datetime, timedelta
+from typing import Dict, List
 
 from asyncmy import Connection
 
+from app.core.cache import token_blacklist_cache
+from app.core.config import settings
 from app.models.token_blacklist import TokenBlacklist, TokenBlacklistCreate
-from app.repositories.base_repository import BaseRepository
+from app.repositories.base_repository import BaseRepository, query_method
 
 logger = logging.getLogger(__name__)
 
@@ -18,6 +21,7 @@ class TokenBlacklistRepository(BaseRepository[TokenBlacklist]):
     id_column = "id"
 
     @classmethod
+    @query_method
     async def create(cls, token_data: TokenBlacklistCreate, conn: Connection = None) -> int:
         """블랙리스트에 토큰 추가"""
         query = """
@@ -31,30 +35,56 @@ class TokenBlacklistRepository(BaseRepository[TokenBlacklist]):
             token_data.expire_at
         )
 
-        cursor = await cls.execute_query(query, values, conn)
-        return cursor.lastrowid
+        result = await cls.execute(query, values, conn)
+
+        # 캐시에 즉시 반영
+        token_blacklist_cache.mark_revoked(token_data.jti, token_data.expire_at)
+
+        return result.lastrowid
 
     @classmethod
-    async def is_token_blacklisted(cls, jti: str, conn: Connection = None) -> bool:
-        """토큰이 블랙리스트에 있는지 확인"""
-        query = """
-        SELECT COUNT(*) as count FROM token_blacklist
-        WHERE jti = %s AND expire_at > %s
+    @query_method
+    async def find_blacklisted(cls, jtis: List[str], conn: Connection = None) -> Dict[str, datetime]:
+        """여러 jti 중 블랙리스트에 등록된 것을 한 번에 조회
+
+        idx_token_blacklist_jti_expire (jti, expire_at) 인덱스 사용
+        (migrations/001_token_blacklist_jti_expire_index.sql)
+
+        Returns:
+            등록된 jti와 만료 시각 매핑 (등록되지 않은 jti는 포함되지 않음)
+        """
+        if not jtis:
+            return {}
+
+        placeholders = ', '.join(['%s'] * len(jtis))
+        query = f"""
+        SELECT jti, MAX(expire_at) as expire_at FROM token_blacklist
+        WHERE jti IN ({placeholders}) AND expire_at > %s
+        GROUP BY jti
         """
 
         now = datetime.utcnow()
-        cursor = await cls.execute_query(query, (jti, now), conn)
-        result = await cursor.fetchone()
+        rows = await cls.fetch_all(query, (*jtis, now), conn)
+        return {row["jti"]: row["expire_at"] for row in rows}
+
+    @staticmethod
+    def user_sentinel_jti(user_id: int) -> str:
+        """사용자의 모든 토큰 무효화 기록에 사용하는 jti"""
+        return f"user_{user_id}_all"
 
-        count = result["count"] if isinstance(result, dict) else result[0]
-        return count > 0
+    @staticmethod
+    def user_revoked_at(expire_at: datetime) -> datetime:
+        """무효화 기록의 만료 시각으로 무효화 시각 계산 (이 시각 전에 발급된 토큰만 무효)"""
+        return expire_at - timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
 
     @classmethod
+    @query_method
     async def blacklist_user_tokens(cls, user_id: int, reason: str, conn: Connection = None) -> bool:
-        """사용자의 모든 활성 토큰을 블랙리스트에 추가
-        (실제로는 토큰을 알 수 없으므로, JWT 디코딩을 통해 활성 토큰 검증에 실패하도록 함)"""
+        """사용자의 기존 토큰을 모두 무효화
+        (실제로는 토큰을 알 수 없으므로, 무효화 시각 이전에 발급된(iat) 토큰이 검증에 실패하도록 함)"""
         # 사용자 ID와, jti="user_{user_id}_all"을 사용하는 특수 레코드 생성
-        # 이후 토큰 확인 시 사용자 ID로 이 레코드를 확인하여 모든 토큰을 무효화
+        # expire_at = 무효화 시각 + 토큰 유효 시간 (그 전에 발급된 토큰이 모두 만료되면 기록도 만료)
+        # 이후 토큰 확인 시 이 레코드의 무효화 시각보다 먼저 발급된 토큰만 거부
 
         # 기존에 같은 패턴의 레코드가 있으면 삭제
         delete_query = """
@@ -62,37 +92,41 @@ class TokenBlacklistRepository(BaseRepository[TokenBlacklist]):
         WHERE user_id = %s AND jti = %s
         """
 
-        jti = f"user_{user_id}_all"
-        await cls.execute_query(delete_query, (user_id, jti), conn)
+        jti = cls.user_sentinel_jti(user_id)
+        await cls.execute(delete_query, (user_id, jti), conn)
 
-        # 새 레코드 생성 (30일 후 만료)
-        expire_at = datetime.utcnow().replace(
-            hour=0, minute=0, second=0, microsecond=0
-        )
-        expire_at = expire_at.replace(day=expire_at.day + 30)
+        # JWT의 iat는 초 단위이므로 무효화 시각도 초 단위로 맞춤
+        # (같은 초에 새로 발급한 토큰은 유효, DATETIME 컬럼에도 그대로 저장됨)
+        revoked_at = datetime.utcnow().replace(microsecond=0)
+        expire_at = revoked_at + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
 
         query = """
         INSERT INTO token_blacklist (user_id, jti, reason, expire_at)
         VALUES (%s, %s, %s, %s)
         """
 
-        cursor = await cls.execute_query(
+        result = await cls.execute(
             query,
             (user_id, jti, reason, expire_at),
             conn
         )
 
-        return cursor.rowcount > 0
+        # 캐시에 즉시 반영
+        token_blacklist_cache.mark_revoked(jti, expire_at)
+
+        return result.rowcount > 0
 
     @classmethod
-    async def clean_expired_tokens(cls, conn: Connection = None) -> int:
-        """만료된 토큰 레코드 정리"""
+    @query_method
+    async def delete_expired_batch(cls, batch_size: int, conn: Connection = None) -> int:
+        """만료된 토큰 레코드를 최대 batch_size개만 삭제 (락 점유 시간을 짧게 유지)"""
         query = """
         DELETE FROM token_blacklist
         WHERE expire_at < %s
+        LIMIT %s
         """
 
         now = datetime.utcnow()
-        cursor = await cls.execute_query(query, (now,), conn)
+        result = await cls.execute(query, (now, batch_size), conn)
 
-        return cursor.rowcount
+        return result.rowcount
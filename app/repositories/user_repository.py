@@ -1,13 +1,25 @@
 # app/repositories/user_repository.py
 import logging
-from typing import Optional, List
+from typing import Any, Dict, Optional, List, Sequence, Tuple
 from asyncmy import Connection
-from app.models.user import User, UserCreate, UserUpdate
-from app.repositories.base_repository import BaseRepository
-from app.core.auth import get_password_hash
+from app.models.user import User, UserCreate, UserUpdate, UserSummary, UserProfile
+from app.repositories.base_repository import BaseRepository, query_method
+from app.repositories.row_mapper import materialize
+from app.core.auth import get_password_hash_async
+from app.core.cache import TTLCache, get_request_memo
+from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# 사용자 ID별 캐시
+_user_cache = TTLCache(maxsize=settings.USER_CACHE_SIZE, ttl=settings.USER_CACHE_TTL, name="user")
+
+# 인증/권한 확인 시 사용하는 컬럼 (비밀번호 제외)
+USER_PROFILE_COLUMNS = tuple(UserProfile.model_fields)
+
+# 사용자 목록 조회 시 사용하는 컬럼 (비밀번호 제외)
+USER_SUMMARY_COLUMNS = ("user_id", "email", "username", "role", "is_active", "is_admin", "create_at")
+
 
 class UserRepository(BaseRepository[User]):
     """사용자 관련 데이터베이스 작업을 처리하는 레포지토리"""
@@ -17,10 +29,11 @@ class UserRepository(BaseRepository[User]):
     id_column = "user_id"
 
     @classmethod
+    @query_method
     async def create(cls, user: UserCreate, conn: Connection = None) -> int:
         """새 사용자 생성 (비밀번호 해싱 처리)"""
         # 비밀번호 해싱
-        hashed_password = get_password_hash(user.password)
+        hashed_password = await get_password_hash_async(user.password)
 
         query = """
         INSERT INTO user (email, username, password, is_active, is_admin, role)
@@ -35,39 +48,93 @@ class UserRepository(BaseRepository[User]):
             user.role
         )
 
-        cursor = await cls.execute_query(query, values, conn)
-        return cursor.lastrowid
+        result = await cls.execute(query, values, conn)
+        return result.lastrowid
+
+    @classmethod
+    @query_method
+    async def get_cached(cls, user_id: int) -> Optional[UserProfile]:
+        """ID로 사용자 조회 (요청 범위 메모 → 사용자 캐시 → DB 순서로 확인, 비밀번호 제외)
+
+        트랜잭션 안에서 최신 값이나 비밀번호가 필요한 경우에는 get_by_id를 사용
+        """
+        memo = get_request_memo()
+        memo_key = ("user", user_id)
+        if memo is not None and memo_key in memo:
+            return memo[memo_key]
+
+        user = _user_cache.get(user_id)
+        if user is None:
+            user = await cls.get_by_id(user_id, columns=USER_PROFILE_COLUMNS, model=UserProfile)
+            if user:
+                _user_cache.set(user_id, user)
+
+        if memo is not None:
+            memo[memo_key] = user
+
+        return user
+
+    @classmethod
+    def invalidate_cache(cls, user_id: int) -> None:
+        """사용자 캐시 및 현재 요청 메모에서 해당 사용자 제거"""
+        _user_cache.delete(user_id)
+
+        memo = get_request_memo()
+        if memo is not None:
+            memo.pop(("user", user_id), None)
 
     @classmethod
+    @query_method
+    async def find_user_ids(cls,
+                            user_ids: Sequence[int] = (),
+                            emails: Sequence[str] = (),
+                            conn: Connection = None) -> List[Dict[str, Any]]:
+        """사용자 ID 또는 이메일 목록 중 실제로 있는 사용자의 user_id, email 조회 (한 번의 쿼리)
+
+        각 조건이 인덱스를 타도록 ID 조건과 이메일 조건을 UNION으로 합침
+        """
+        branches = []
+        params: List[Any] = []
+
+        if user_ids:
+            branches.append(f"SELECT user_id, email FROM user WHERE user_id IN ({', '.join(['%s'] * len(user_ids))})")
+            params.extend(user_ids)
+
+        if emails:
+            branches.append(f"SELECT user_id, email FROM user WHERE email IN ({', '.join(['%s'] * len(emails))})")
+            params.extend(emails)
+
+        if not branches:
+            return []
+
+        return await cls.fetch_all(" UNION ".join(branches), tuple(params), conn)
+
+    @classmethod
+    @query_method
     async def get_by_email(cls, email: str, conn: Connection = None) -> Optional[User]:
         """이메일로 사용자 조회"""
         query = "SELECT * FROM user WHERE email = %s"
 
-        cursor = await cls.execute_query(query, (email,), conn)
-        result = await cursor.fetchone()
+        result = await cls.fetch_one(query, (email,), conn)
 
         # 결과가 없으면 None 반환
         if not result:
             return None
 
-        # 튜플 결과를 딕셔너리로 변환
-        if not isinstance(result, dict) and hasattr(cursor, 'description'):
-            column_names = [column[0] for column in cursor.description]
-            result_dict = dict(zip(column_names, result))
-            return User(**result_dict)
-        else:
-            # 이미 딕셔너리 형태인 경우
-            return User(**result)
+        return materialize(User, result)
 
     @classmethod
+    @query_method
     async def update_password(cls, user_id: int, hashed_password: str, conn: Connection = None) -> bool:
         """사용자 비밀번호 업데이트"""
         query = "UPDATE user SET password = %s WHERE user_id = %s"
 
-        cursor = await cls.execute_query(query, (hashed_password, user_id), conn)
-        return cursor.rowcount > 0
+        result = await cls.execute(query, (hashed_password, user_id), conn)
+        cls.invalidate_cache(user_id)
+        return result.rowcount > 0
 
     @classmethod
+    @query_method
     async def update(cls, user_id: int, user_update: UserUpdate, conn: Connection = None) -> bool:
         """사용자 정보 업데이트 (비밀번호가 있는 경우 해싱 처리)"""
         # 업데이트할 데이터 준비
@@ -75,28 +142,28 @@ class UserRepository(BaseRepository[User]):
 
         # 비밀번호가 있는 경우 해싱 처리
         if 'password' in update_dict:
-            update_dict['password'] = get_password_hash(update_dict['password'])
+            update_dict['password'] = await get_password_hash_async(update_dict['password'])
 
         # 기본 업데이트 메서드 사용
-        return await super().update(user_id, update_dict, conn)
+        success = await super().update(user_id, update_dict, conn)
+        cls.invalidate_cache(user_id)
+        return success
 
     @classmethod
-    async def get_users_by_role(cls, role: str, conn: Connection = None) -> List[User]:
-        """역할별 사용자 목록 조회"""
-        query = "SELECT * FROM user WHERE role = %s ORDER BY user_id"
-
-        cursor = await cls.execute_query(query, (role,), conn)
-        rows = await cursor.fetchall()
-
-        # 결과가 없으면 빈 리스트 반환
-        if not rows:
-            return []
-
-        # 튜플 결과를 딕셔너리로 변환 (첫 번째 결과가 딕셔너리가 아닌 경우)
-        if rows and not isinstance(rows[0], dict) and hasattr(cursor, 'description'):
-            column_names = [column[0] for column in cursor.description]
-            result_dicts = [dict(zip(column_names, row)) for row in rows]
-            return [User(**result_dict) for result_dict in result_dicts]
-        else:
-            # 이미 딕셔너리 형태인 경우
-            return [User(**row) for row in rows]
\ No newline at end of file
+    @query_method
+    async def get_users_page(cls,
+                             limit: int,
+                             after_id: Optional[int] = None,
+                             role: Optional[str] = None,
+                             conn: Connection = None) -> Tuple[List[UserSummary], Optional[Tuple]]:
+        """사용자 요약 목록을 user_id 오름차순 키셋 방식으로 조회 (role이 있으면 해당 역할만, 비밀번호 제외)"""
+        return await cls.get_page(
+            key_columns=("user_id",),
+            limit=limit,
+            after=(after_id,) if after_id is not None else None,
+            where_clause="role = %s" if role else "",
+            params=(role,) if role else None,
+            columns=USER_SUMMARY_COLUMNS,
+            model=UserSummary,
+            conn=conn
+        )
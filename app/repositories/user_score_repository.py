@@ -1,11 +1,13 @@
 # app/repositories/user_score_repository.py
 import logging
-from typing import List, Optional, Dict, Any
+from datetime import datetime
+from typing import List, Optional, Dict, Any, Iterable, Set, Tuple
 
 from asyncmy import Connection
 
 from app.models.user_score import UserScore, UserScoreCreate, UserCategoryStat
-from app.repositories.base_repository import BaseRepository
+from app.repositories.base_repository import BaseRepository, query_method
+from app.repositories.row_mapper import materialize, materialize_many
 
 logger = logging.getLogger(__name__)
 
@@ -18,6 +20,7 @@ class UserScoreRepository(BaseRepository[UserScore]):
     id_column = "score_id"
 
     @classmethod
+    @query_method
     async def create_score(cls, score: UserScoreCreate, conn: Connection = None) -> int:
         """새 성적 기록 생성"""
         query = """
@@ -31,10 +34,21 @@ class UserScoreRepository(BaseRepository[UserScore]):
             score.selected_answers
         )
 
-        cursor = await cls.execute_query(query, values, conn)
-        return cursor.lastrowid
+        result = await cls.execute(query, values, conn)
+        return result.lastrowid
 
     @classmethod
+    @query_method
+    async def create_scores_bulk(cls, scores: List[UserScoreCreate], conn: Connection = None) -> int:
+        """여러 성적 기록을 한 번에 생성하고 생성된 행 수 반환"""
+        return await cls.bulk_create(
+            scores,
+            conn,
+            fields=("user_id", "question_id", "is_correct", "selected_answers")
+        )
+
+    @classmethod
+    @query_method
     async def get_user_scores(cls, user_id: int, limit: int = 100, conn: Connection = None) -> List[UserScore]:
         """사용자의 성적 기록 조회"""
         query = """
@@ -44,12 +58,30 @@ class UserScoreRepository(BaseRepository[UserScore]):
         LIMIT %s
         """
 
-        cursor = await cls.execute_query(query, (user_id, limit), conn)
-        results = await cursor.fetchall()
+        results = await cls.fetch_all(query, (user_id, limit), conn)
 
-        return [UserScore(**result) for result in results]
+        return materialize_many(UserScore, results)
+
+    @classmethod
+    @query_method
+    async def get_user_scores_page(cls,
+                                   user_id: int,
+                                   limit: int = 100,
+                                   after: Optional[Tuple[datetime, int]] = None,
+                                   conn: Connection = None) -> Tuple[List[UserScore], Optional[Tuple]]:
+        """사용자의 성적 기록을 (submit_at, score_id) 내림차순 키셋 방식으로 조회"""
+        return await cls.get_page(
+            key_columns=("submit_at", "score_id"),
+            limit=limit,
+            after=after,
+            where_clause="user_id = %s",
+            params=(user_id,),
+            descending=True,
+            conn=conn
+        )
 
     @classmethod
+    @query_method
     async def get_user_question_score(cls, user_id: int, question_id: int, conn: Connection = None) -> Optional[
         UserScore]:
         """사용자의 특정 문제에 대한 성적 기록 조회"""
@@ -60,12 +92,45 @@ class UserScoreRepository(BaseRepository[UserScore]):
         LIMIT 1
         """
 
-        cursor = await cls.execute_query(query, (user_id, question_id), conn)
-        result = await cursor.fetchone()
+        result = await cls.fetch_one(query, (user_id, question_id), conn)
+
+        return materialize(UserScore, result) if result else None
+
+    @classmethod
+    @query_method
+    async def get_answered_question_ids(cls,
+                                        user_id: int,
+                                        category_id: int,
+                                        correct_only: bool = False,
+                                        within_days: Optional[int] = None,
+                                        conn: Connection = None) -> Set[int]:
+        """사용자가 카테고리에서 답변을 제출한 질문 ID 집합 조회
+
+        correct_only: 정답을 맞힌 질문만 포함
+        within_days: 최근 며칠 안에 제출한 질문만 포함
+            (submit_at은 DB 기본값으로 기록되므로 기준 시각도 DB의 NOW()로 계산)
+        """
+        query = """
+        SELECT DISTINCT us.question_id
+        FROM user_score us
+        JOIN question q ON us.question_id = q.question_id
+        WHERE us.user_id = %s AND q.category_id = %s
+        """
+        params = [user_id, category_id]
+
+        if correct_only:
+            query += " AND us.is_correct = 'Y'"
+
+        if within_days is not None:
+            query += " AND us.submit_at >= NOW() - INTERVAL %s DAY"
+            params.append(within_days)
 
-        return UserScore(**result) if result else None
+        rows = await cls.fetch_all(query, tuple(params), conn)
+
+        return {row['question_id'] for row in rows}
 
     @classmethod
+    @query_method
     async def get_user_score_summary(cls, user_id: int, conn: Connection = None) -> Dict[str, Any]:
         """사용자의 성적 요약 정보 조회"""
         query = """
@@ -78,8 +143,7 @@ class UserScoreRepository(BaseRepository[UserScore]):
             user_id = %s
         """
 
-        cursor = await cls.execute_query(query, (user_id,), conn)
-        result = await cursor.fetchone()
+        result = await cls.fetch_one(query, (user_id,), conn)
 
         return {
             "total_questions": result["total_questions"] if result else 0,
@@ -97,48 +161,67 @@ class UserCategoryStatRepository(BaseRepository[UserCategoryStat]):
     id_column = "stat_id"
 
     @classmethod
+    @query_method
     async def update_category_stat(cls,
                                    user_id: int,
                                    category_id: int,
                                    is_correct: str,
                                    conn: Connection = None) -> None:
-        """사용자의 카테고리별 성적 통계 업데이트"""
-        # 먼저 해당 사용자의 카테고리 통계가 있는지 확인
-        query_check = """
-        SELECT * FROM user_category_stat
-        WHERE user_id = %s AND category_id = %s
+        """사용자의 카테고리별 성적 통계 업데이트 (없으면 생성, (user_id, category_id) 유니크 키 필요)"""
+        query = """
+        INSERT INTO user_category_stat 
+            (user_id, category_id, total_questions, correct_answers)
+        VALUES 
+            (%s, %s, 1, %s)
+        ON DUPLICATE KEY UPDATE
+            total_questions = total_questions + VALUES(total_questions),
+            correct_answers = correct_answers + VALUES(correct_answers),
+            last_access = CURRENT_TIMESTAMP
         """
 
-        cursor = await cls.execute_query(query_check, (user_id, category_id), conn)
-        existing_stat = await cursor.fetchone()
+        correct_value = 1 if is_correct == 'Y' else 0
+        await cls.execute(query, (user_id, category_id, correct_value), conn)
 
-        if existing_stat:
-            # 통계 업데이트
-            query_update = """
-            UPDATE user_category_stat
-            SET 
-                total_questions = total_questions + 1,
-                correct_answers = correct_answers + %s,
-                last_access = CURRENT_TIMESTAMP
-            WHERE 
-                user_id = %s AND category_id = %s
-            """
-
-            correct_value = 1 if is_correct == 'Y' else 0
-            await cls.execute_query(query_update, (correct_value, user_id, category_id), conn)
-        else:
-            # 새 통계 생성
-            query_insert = """
+    @classmethod
+    @query_method
+    async def apply_increments(cls,
+                               increments: Iterable[Tuple[int, int, int, int]],
+                               conn: Connection = None,
+                               batch_size: int = 1000) -> int:
+        """여러 사용자/카테고리 통계 증가분을 한 번에 반영 (재처리, 백필용)
+
+        increments: (user_id, category_id, total_delta, correct_delta) 목록
+        같은 (user_id, category_id)는 합쳐서 반영하며, batch_size 행마다 INSERT 한 번 실행
+        반환값은 반영한 (user_id, category_id) 수
+        """
+        merged: Dict[Tuple[int, int], List[int]] = {}
+        for user_id, category_id, total_delta, correct_delta in increments:
+            delta = merged.setdefault((user_id, category_id), [0, 0])
+            delta[0] += total_delta
+            delta[1] += correct_delta
+
+        rows = [(user_id, category_id, total, correct) for (user_id, category_id), (total, correct) in merged.items()]
+
+        for start in range(0, len(rows), batch_size):
+            batch = rows[start:start + batch_size]
+            placeholders = ', '.join(['(%s, %s, %s, %s)'] * len(batch))
+            query = f"""
             INSERT INTO user_category_stat 
                 (user_id, category_id, total_questions, correct_answers)
             VALUES 
-                (%s, %s, 1, %s)
+                {placeholders}
+            ON DUPLICATE KEY UPDATE
+                total_questions = total_questions + VALUES(total_questions),
+                correct_answers = correct_answers + VALUES(correct_answers),
+                last_access = CURRENT_TIMESTAMP
             """
+            values = tuple(value for row in batch for value in row)
+            await cls.execute(query, values, conn)
 
-            correct_value = 1 if is_correct == 'Y' else 0
-            await cls.execute_query(query_insert, (user_id, category_id, correct_value), conn)
+        return len(rows)
 
     @classmethod
+    @query_method
     async def get_user_category_stats(cls, user_id: int, conn: Connection = None) -> List[UserCategoryStat]:
         """사용자의 카테고리별 성적 통계 조회"""
         query = """
@@ -147,7 +230,6 @@ class UserCategoryStatRepository(BaseRepository[UserCategoryStat]):
         ORDER BY total_questions DESC, category_id ASC
         """
 
-        cursor = await cls.execute_query(query, (user_id,), conn)
-        results = await cursor.fetchall()
+        results = await cls.fetch_all(query, (user_id,), conn)
 
-        return [UserCategoryStat(**result) for result in results]
\ No newline at end of file
+        return materialize_many(UserCategoryStat, results)
\ No newline at end of file
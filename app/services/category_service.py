@@ -2,7 +2,7 @@
 import logging
 from typing import List, Dict, Any
 from app.models.category import Category, CategoryCreate, CategoryUpdate
-from app.repositories.category_repository import CategoryRepository
+from app.repositories.category_repository import CategoryRepository, CategoryRegistry
 from app.core.exceptions import NotFoundException, DatabaseException, ValidationException
 
 logger = logging.getLogger(__name__)
@@ -13,6 +13,7 @@ class CategoryService:
         """새 카테고리 생성"""
         try:
             category_id = await CategoryRepository.create(category)
+            CategoryRegistry.invalidate()
             logger.info(f"카테고리 생성 (ID: {category_id}, 이름: {category.name})")
 
             return {
@@ -26,19 +27,19 @@ class CategoryService:
 
     @staticmethod
     async def get_category(category_id: int) -> Category:
-        """ID로 카테고리 조회"""
-        category = await CategoryRepository.get_by_id(category_id)
+        """ID로 카테고리 조회 (레지스트리 사용)"""
+        category = await CategoryRegistry.get_by_id(category_id)
         if not category:
             raise NotFoundException(f"ID가 {category_id}인 카테고리를 찾을 수 없습니다.")
         return category
 
     @staticmethod
     async def get_all_categories(is_use: str = None) -> List[Category]:
-        """모든 카테고리 조회 (사용 여부 필터링 지원)"""
+        """모든 카테고리 조회 (사용 여부 필터링 지원, 레지스트리 사용)"""
         if is_use and is_use not in ['Y', 'N']:
             raise ValidationException("is_use 파라미터는 'Y' 또는 'N'이어야 합니다.")
 
-        return await CategoryRepository.get_all(is_use=is_use)
+        return await CategoryRegistry.get_all(is_use=is_use)
 
     @staticmethod
     async def update_category(
@@ -48,12 +49,12 @@ class CategoryService:
         """카테고리 업데이트"""
         try:
             # 카테고리 존재 여부 확인
-            category = await CategoryRepository.get_by_id(category_id)
-            if not category:
+            if not await CategoryRepository.exists_by_id(category_id):
                 raise NotFoundException(f"ID가 {category_id}인 카테고리를 찾을 수 없습니다.")
 
             # 카테고리 업데이트
             success = await CategoryRepository.update(category_id, category_update)
+            CategoryRegistry.invalidate()
 
             # 로그 기록
             update_fields = ', '.join(k for k, v in category_update.dict(exclude_unset=True).items() if v is not None)
@@ -74,8 +75,7 @@ class CategoryService:
         """카테고리 삭제"""
         try:
             # 카테고리 존재 여부 확인
-            category = await CategoryRepository.get_by_id(category_id)
-            if not category:
+            if not await CategoryRepository.exists_by_id(category_id):
                 raise NotFoundException(f"ID가 {category_id}인 카테고리를 찾을 수 없습니다.")
 
             # TODO: 카테고리를 참조하는 질문이 있는지 확인하는 로직 추가 필요
@@ -83,6 +83,7 @@ class CategoryService:
 
             # 카테고리 삭제
             success = await CategoryRepository.delete(category_id)
+            CategoryRegistry.invalidate()
 
             # 로그 기록
             logger.info(f"카테고리 삭제 (ID: {category_id})")
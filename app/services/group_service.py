@@ -1,9 +1,11 @@
 # app/services/group_service.py
 import logging
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 
-from app.core.exceptions import NotFoundException, ForbiddenException, DatabaseException
-from app.models.group import Group, GroupCreate, GroupUpdate, GroupMemberCreate
+from app.core.config import settings
+from app.core.database import transaction
+from app.core.exceptions import NotFoundException, ForbiddenException, DatabaseException, ValidationException
+from app.models.group import Group, GroupCreate, GroupUpdate, GroupMemberCreate, GroupMemberBulkRequest
 from app.repositories.group_repository import GroupRepository, GroupMemberRepository
 from app.repositories.user_repository import UserRepository
 
@@ -16,7 +18,7 @@ class GroupService:
         """새 그룹 생성"""
         try:
             # 사용자 존재 및 출제자 권한 확인
-            user = await UserRepository.get_by_id(group.user_id)
+            user = await UserRepository.get_cached(group.user_id)
             if not user:
                 raise NotFoundException(f"ID가 {group.user_id}인 사용자를 찾을 수 없습니다.")
 
@@ -55,7 +57,7 @@ class GroupService:
             if not group:
                 raise NotFoundException(f"ID가 {group_id}인 그룹을 찾을 수 없습니다.")
 
-            user = await UserRepository.get_by_id(user_id)
+            user = await UserRepository.get_cached(user_id)
             if group.user_id != user_id and user.role != "admin":
                 raise ForbiddenException("해당 그룹을 수정할 권한이 없습니다.")
 
@@ -81,7 +83,7 @@ class GroupService:
             if not group:
                 raise NotFoundException(f"ID가 {group_id}인 그룹을 찾을 수 없습니다.")
 
-            user = await UserRepository.get_by_id(user_id)
+            user = await UserRepository.get_cached(user_id)
             if group.user_id != user_id and user.role != "admin":
                 raise ForbiddenException("해당 그룹을 삭제할 권한이 없습니다.")
 
@@ -107,12 +109,12 @@ class GroupService:
             if not group:
                 raise NotFoundException(f"ID가 {group_id}인 그룹을 찾을 수 없습니다.")
 
-            adding_user = await UserRepository.get_by_id(added_by_id)
+            adding_user = await UserRepository.get_cached(added_by_id)
             if group.user_id != added_by_id and adding_user.role != "admin":
                 raise ForbiddenException("그룹에 멤버를 추가할 권한이 없습니다.")
 
             # 추가할 사용자 존재 확인
-            member = await UserRepository.get_by_id(user_id)
+            member = await UserRepository.get_cached(user_id)
             if not member:
                 raise NotFoundException(f"ID가 {user_id}인 사용자를 찾을 수 없습니다.")
 
@@ -148,7 +150,7 @@ class GroupService:
             if not group:
                 raise NotFoundException(f"ID가 {group_id}인 그룹을 찾을 수 없습니다.")
 
-            removing_user = await UserRepository.get_by_id(removed_by_id)
+            removing_user = await UserRepository.get_cached(removed_by_id)
             if group.user_id != removed_by_id and removing_user.role != "admin" and removed_by_id != user_id:
                 raise ForbiddenException("그룹에서 멤버를 제거할 권한이 없습니다.")
 
@@ -173,6 +175,125 @@ class GroupService:
             logger.error(f"그룹에서 멤버 제거 중 오류 발생: {e}")
             raise DatabaseException(str(e))
 
+    @staticmethod
+    async def _check_group_manager(group_id: int, user_id: int, action: str) -> None:
+        """그룹 존재 여부 및 멤버 관리 권한(그룹 소유자 또는 관리자) 확인"""
+        group = await GroupRepository.get_by_id(group_id)
+        if not group:
+            raise NotFoundException(f"ID가 {group_id}인 그룹을 찾을 수 없습니다.")
+
+        user = await UserRepository.get_cached(user_id)
+        if group.user_id != user_id and (not user or user.role != "admin"):
+            raise ForbiddenException(f"그룹에서 멤버를 {action}할 권한이 없습니다.")
+
+    @staticmethod
+    async def _resolve_bulk_users(request: GroupMemberBulkRequest) -> Tuple[List[int], List[int], List[str]]:
+        """요청의 사용자 ID/이메일을 한 번의 조회로 확인
+
+        반환값: (존재하는 사용자 ID 목록 - 요청 순서, 중복 제거), 없는 사용자 ID 목록, 없는 이메일 목록)
+        """
+        requested_ids = list(dict.fromkeys(request.user_ids))
+        requested_emails = list(dict.fromkeys(email.lower() for email in request.emails))
+
+        if not requested_ids and not requested_emails:
+            raise ValidationException("user_ids 또는 emails 중 하나 이상을 입력해야 합니다.")
+
+        if len(requested_ids) + len(requested_emails) > settings.GROUP_MEMBER_BULK_MAX_SIZE:
+            raise ValidationException(
+                f"한 번에 최대 {settings.GROUP_MEMBER_BULK_MAX_SIZE}명까지 처리할 수 있습니다."
+            )
+
+        rows = await UserRepository.find_user_ids(requested_ids, requested_emails)
+        found_ids = {row["user_id"] for row in rows}
+        ids_by_email = {row["email"].lower(): row["user_id"] for row in rows}
+
+        unknown_ids = [user_id for user_id in requested_ids if user_id not in found_ids]
+        unknown_emails = [email for email in requested_emails if email not in ids_by_email]
+
+        user_ids = [user_id for user_id in requested_ids if user_id in found_ids]
+        user_ids.extend(ids_by_email[email] for email in requested_emails if email in ids_by_email)
+
+        return list(dict.fromkeys(user_ids)), unknown_ids, unknown_emails
+
+    @staticmethod
+    async def add_members_bulk(
+            group_id: int,
+            request: GroupMemberBulkRequest,
+            added_by_id: int
+    ) -> Dict[str, Any]:
+        """그룹에 여러 멤버를 한 번에 추가
+
+        사용자 확인 1회, 기존 멤버 확인 1회, multi-row INSERT IGNORE 1회로 처리하고
+        추가된 사용자, 이미 멤버인 사용자, 없는 사용자를 함께 반환
+        """
+        try:
+            await GroupService._check_group_manager(group_id, added_by_id, "추가")
+
+            user_ids, unknown_ids, unknown_emails = await GroupService._resolve_bulk_users(request)
+
+            async with transaction() as conn:
+                existing = await GroupMemberRepository.get_member_ids_among(group_id, user_ids, conn)
+                added = [user_id for user_id in user_ids if user_id not in existing]
+                inserted = await GroupMemberRepository.add_members_bulk(group_id, added, conn)
+
+            if inserted != len(added):
+                # 확인과 INSERT 사이에 다른 요청이 같은 멤버를 추가한 경우
+                logger.warning(f"그룹 멤버 일괄 추가 중 동시 추가 발생 (그룹 ID: {group_id}, "
+                               f"예상: {len(added)}, 실제: {inserted})")
+
+            logger.info(f"그룹 멤버 일괄 추가 (그룹 ID: {group_id}) - 추가: {len(added)}, "
+                        f"기존 멤버: {len(existing)}, 없는 사용자: {len(unknown_ids) + len(unknown_emails)}")
+
+            return {
+                "success": True,
+                "added": added,
+                "duplicates": [user_id for user_id in user_ids if user_id in existing],
+                "unknown_user_ids": unknown_ids,
+                "unknown_emails": unknown_emails,
+                "message": f"{len(added)}명의 멤버가 추가되었습니다."
+            }
+        except (NotFoundException, ForbiddenException, ValidationException):
+            raise
+        except Exception as e:
+            logger.error(f"그룹에 멤버 일괄 추가 중 오류 발생: {e}")
+            raise DatabaseException(str(e))
+
+    @staticmethod
+    async def remove_members_bulk(
+            group_id: int,
+            request: GroupMemberBulkRequest,
+            removed_by_id: int
+    ) -> Dict[str, Any]:
+        """그룹에서 여러 멤버를 한 번에 제거
+
+        제거된 사용자, 멤버가 아닌 사용자, 없는 사용자를 함께 반환
+        """
+        try:
+            await GroupService._check_group_manager(group_id, removed_by_id, "제거")
+
+            user_ids, unknown_ids, unknown_emails = await GroupService._resolve_bulk_users(request)
+
+            async with transaction() as conn:
+                existing = await GroupMemberRepository.get_member_ids_among(group_id, user_ids, conn)
+                removed = [user_id for user_id in user_ids if user_id in existing]
+                await GroupMemberRepository.remove_members_bulk(group_id, removed, conn)
+
+            logger.info(f"그룹 멤버 일괄 제거 (그룹 ID: {group_id}) - 제거: {len(removed)}")
+
+            return {
+                "success": True,
+                "removed": removed,
+                "not_members": [user_id for user_id in user_ids if user_id not in existing],
+                "unknown_user_ids": unknown_ids,
+                "unknown_emails": unknown_emails,
+                "message": f"{len(removed)}명의 멤버가 제거되었습니다."
+            }
+        except (NotFoundException, ForbiddenException, ValidationException):
+            raise
+        except Exception as e:
+            logger.error(f"그룹에서 멤버 일괄 제거 중 오류 발생: {e}")
+            raise DatabaseException(str(e))
+
     @staticmethod
     async def get_user_groups(user_id: int) -> List[Group]:
         """사용자가 속한 그룹 목록 조회"""
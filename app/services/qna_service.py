@@ -1,18 +1,20 @@
 # app/services/qna_service.py
 import logging
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 
 from app.core.database import transaction
 from app.core.exceptions import NotFoundException, DatabaseException, ForbiddenException
-from app.models.answer import AnswerCreate, AnswerUpdate
+from app.core.pagination import decode_cursor, encode_cursor
+from app.models.answer import AnswerCreate, AnswerUpdate, AnswerRef
 from app.models.qna import QuestionWithAnswers
-from app.models.question import QuestionCreate, QuestionUpdate
+from app.models.question import QuestionCreate, QuestionUpdate, QuestionRef
 from app.repositories.answer_repository import AnswerRepository
-from app.repositories.category_repository import CategoryRepository
+from app.repositories.category_repository import CategoryRegistry
 from app.repositories.group_repository import GroupRepository
 from app.repositories.qna_repository import QnARepository
 from app.repositories.question_repository import QuestionRepository
 from app.repositories.user_repository import UserRepository
+from app.services.question_sampler import QuestionSampler
 
 logger = logging.getLogger(__name__)
 
@@ -26,12 +28,11 @@ class QnAService:
         """질문과 답변을 함께 생성"""
         try:
             # 카테고리 존재 확인
-            category = await CategoryRepository.get_by_id(question.category_id)
-            if not category:
+            if not await CategoryRegistry.exists(question.category_id):
                 raise NotFoundException(f"ID가 {question.category_id}인 카테고리를 찾을 수 없습니다.")
 
             # 출제자 권한 확인
-            user = await UserRepository.get_by_id(question.user_id)
+            user = await UserRepository.get_cached(question.user_id)
             if not user:
                 raise NotFoundException(f"ID가 {question.user_id}인 사용자를 찾을 수 없습니다.")
 
@@ -52,24 +53,27 @@ class QnAService:
                 # 질문 생성
                 question_id = await QuestionRepository.create(question, conn)
 
-                # 답변 목록 생성
-                answer_ids = []
+                # 답변 목록 일괄 생성
                 for answer in answers:
                     # 질문 ID 설정
                     answer.question_id = question_id
-                    # 답변 생성
-                    answer_id = await AnswerRepository.create(answer, conn)
-                    answer_ids.append(answer_id)
+                await AnswerRepository.create_bulk(answers, conn)
 
-                # 로그 기록
-                logger.info(f"질문 생성 (ID: {question_id}) - 출제자: {question.user_id}, 답변 수: {len(answer_ids)}")
+                # 생성된 답변 ID는 연속이라는 보장이 없으므로 같은 트랜잭션에서 다시 조회
+                answer_ids = await AnswerRepository.get_ids_by_question_id(question_id, conn)
 
-                return {
-                    "success": True,
-                    "question_id": question_id,
-                    "answer_ids": answer_ids,
-                    "message": "질문과 답변이 성공적으로 생성되었습니다."
-                }
+            # 문제 추출용 ID 캐시 갱신
+            QuestionSampler.invalidate(question.category_id)
+
+            # 로그 기록
+            logger.info(f"질문 생성 (ID: {question_id}) - 출제자: {question.user_id}, 답변 수: {len(answer_ids)}")
+
+            return {
+                "success": True,
+                "question_id": question_id,
+                "answer_ids": answer_ids,
+                "message": "질문과 답변이 성공적으로 생성되었습니다."
+            }
 
         except (NotFoundException, ForbiddenException):
             raise
@@ -91,48 +95,72 @@ class QnAService:
             limit: int = 10,
             category_id: Optional[int] = None,
             user_id: int = None,
-            is_random: bool = False
+            after_id: Optional[int] = None
     ) -> List[QuestionWithAnswers]:
-        """모든 질문과 답변 조회 (페이지네이션 포함)"""
+        """모든 질문과 답변 조회 (페이지네이션 포함)
+
+        after_id가 주어지면 skip 대신 해당 질문 ID 다음부터 조회 (키셋 방식)
+        """
         try:
             # 카테고리 ID가 제공된 경우 카테고리 존재 확인
             if category_id:
-                category = await CategoryRepository.get_by_id(category_id)
-                if not category:
+                if not await CategoryRegistry.exists(category_id):
                     raise NotFoundException(f"ID가 {category_id}인 카테고리를 찾을 수 없습니다.")
 
             # 사용자 정보 확인
             user = None
             if user_id:
-                user = await UserRepository.get_by_id(user_id)
+                user = await UserRepository.get_cached(user_id)
                 if not user:
                     raise NotFoundException(f"ID가 {user_id}인 사용자를 찾을 수 없습니다.")
 
             # 사용자 권한에 따라 조회할 질문 결정
             if user and user.role in ["creator", "admin"]:
                 # 출제자나 관리자는 모든 질문 조회 가능
-                return await QnARepository.get_all_questions_with_answers(skip, limit, category_id, is_random)
+                return await QnARepository.get_all_questions_with_answers(
+                    skip, limit, category_id, after_id=after_id
+                )
             elif user:
                 # 풀이자는 자신이 속한 그룹의 질문 또는 그룹 제한이 없는 질문만 조회 가능
-                questions = await QuestionRepository.get_available_questions_for_user(user_id, skip, limit, category_id)
-
-                # 각 질문에 대한 상세 정보 조회
-                results = []
-                for q in questions:
-                    question_with_answers = await QnARepository.get_question_with_answers(q.question_id)
-                    if question_with_answers:
-                        results.append(question_with_answers)
-
-                return results
+                questions = await QuestionRepository.get_available_questions_for_user(
+                    user_id, skip, limit, category_id, after_id=after_id
+                )
+
+                # 질문 상세 정보와 답변을 일괄 조회
+                return await QnARepository.get_questions_with_answers_by_ids(
+                    [q.question_id for q in questions]
+                )
             else:
                 # 사용자 정보가 없으면 그룹 제한이 없는 질문만 조회
-                return await QnARepository.get_all_questions_with_answers(skip, limit, category_id, is_random)
+                return await QnARepository.get_all_questions_with_answers(
+                    skip, limit, category_id, after_id=after_id
+                )
         except NotFoundException:
             raise
         except Exception as e:
             logger.error(f"질문 목록 조회 중 오류 발생: {e}")
             raise DatabaseException(str(e))
 
+    @staticmethod
+    async def get_questions_page(
+            limit: int = 10,
+            category_id: Optional[int] = None,
+            user_id: int = None,
+            after: Optional[str] = None
+    ) -> Tuple[List[QuestionWithAnswers], Optional[str]]:
+        """질문과 답변을 커서 방식으로 조회
+
+        반환값: (질문 목록, 다음 페이지 커서 - 더 이상 없으면 None)
+        """
+        after_id = decode_cursor(after, [int])[0] if after else None
+
+        questions = await QnAService.get_all_questions_with_answers(
+            0, limit, category_id, user_id, after_id=after_id
+        )
+
+        cursor = encode_cursor([questions[-1].question_id]) if len(questions) == limit else None
+        return questions, cursor
+
     @staticmethod
     async def update_question(
             question_id: int,
@@ -141,19 +169,26 @@ class QnAService:
         """질문 업데이트"""
         try:
             # 질문 존재 여부 확인
-            question = await QuestionRepository.get_by_id(question_id)
+            question = await QuestionRepository.get_by_id(question_id, model=QuestionRef)
             if not question:
                 raise NotFoundException(f"ID가 {question_id}인 질문을 찾을 수 없습니다.")
 
             # 카테고리 ID가 제공된 경우 카테고리 존재 확인
             if question_update.category_id:
-                category = await CategoryRepository.get_by_id(question_update.category_id)
-                if not category:
+                if not await CategoryRegistry.exists(question_update.category_id):
                     raise NotFoundException(f"ID가 {question_update.category_id}인 카테고리를 찾을 수 없습니다.")
 
             # 질문 업데이트
             success = await QuestionRepository.update(question_id, question_update)
 
+            # 채점용 정답 키 캐시 갱신
+            QnARepository.invalidate_answer_key(question_id)
+
+            # 카테고리가 바뀐 경우 문제 추출용 ID 캐시 갱신
+            if question_update.category_id and question_update.category_id != question.category_id:
+                QuestionSampler.invalidate(question.category_id)
+                QuestionSampler.invalidate(question_update.category_id)
+
             # 로그 기록
             update_fields = ', '.join(k for k, v in question_update.dict(exclude_unset=True).items() if v is not None)
             logger.info(f"질문 업데이트 (ID: {question_id}) - 필드: {update_fields}")
@@ -176,13 +211,16 @@ class QnAService:
         """답변 업데이트"""
         try:
             # 답변 존재 여부 확인
-            answer = await AnswerRepository.get_by_id(answer_id)
+            answer = await AnswerRepository.get_by_id(answer_id, model=AnswerRef)
             if not answer:
                 raise NotFoundException(f"ID가 {answer_id}인 답변을 찾을 수 없습니다.")
 
             # 답변 업데이트
             success = await AnswerRepository.update(answer_id, answer_update)
 
+            # 채점용 정답 키 캐시 갱신
+            QnARepository.invalidate_answer_key(answer.question_id)
+
             # 로그 기록
             update_fields = ', '.join(k for k, v in answer_update.dict(exclude_unset=True).items() if v is not None)
             logger.info(f"답변 업데이트 (ID: {answer_id}) - 필드: {update_fields}")
@@ -203,7 +241,7 @@ class QnAService:
         try:
             async with transaction() as conn:
                 # 질문 존재 여부 확인
-                question = await QuestionRepository.get_by_id(question_id, conn)
+                question = await QuestionRepository.get_by_id(question_id, conn, model=QuestionRef)
                 if not question:
                     raise NotFoundException(f"ID가 {question_id}인 질문을 찾을 수 없습니다.")
 
@@ -213,13 +251,17 @@ class QnAService:
                 # 질문 삭제
                 success = await QuestionRepository.delete(question_id, conn)
 
-                # 로그 기록
-                logger.info(f"질문 삭제 (ID: {question_id})")
+            # 문제 추출용 ID 캐시 및 채점용 정답 키 캐시 갱신
+            QuestionSampler.invalidate(question.category_id)
+            QnARepository.invalidate_answer_key(question_id)
 
-                return {
-                    "success": success,
-                    "message": "질문 및 관련 답변이 성공적으로 삭제되었습니다."
-                }
+            # 로그 기록
+            logger.info(f"질문 삭제 (ID: {question_id})")
+
+            return {
+                "success": success,
+                "message": "질문 및 관련 답변이 성공적으로 삭제되었습니다."
+            }
         except NotFoundException:
             raise
         except Exception as e:
@@ -233,13 +275,13 @@ class QnAService:
     ) -> Dict[str, Any]:
         """사용자가 선택한 답변이 정답인지 확인"""
         try:
-            # 질문 존재 여부 확인
-            question = await QuestionRepository.get_by_id(question_id)
-            if not question:
+            # 정답 키 조회 (질문 존재 여부 확인 겸용)
+            answer_key = await QnARepository.get_answer_key(question_id)
+            if not answer_key:
                 raise NotFoundException(f"ID가 {question_id}인 질문을 찾을 수 없습니다.")
 
             # 정답 확인
-            result = await QnARepository.check_answers(question_id, selected_answer_ids)
+            result = QnARepository.grade(answer_key, selected_answer_ids)
 
             # 로그 기록
             logger.info(f"답변 제출 (질문 ID: {question_id}) - 결과: {'정답' if result.get('is_correct') else '오답'}")
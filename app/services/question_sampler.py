@@ -0,0 +1,114 @@
+# app/services/question_sampler.py
+import logging
+import random
+from typing import Collection, List, Optional, Sequence, Set
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.repositories.question_repository import QuestionRepository
+from app.repositories.user_score_repository import UserScoreRepository
+
+logger = logging.getLogger(__name__)
+
+
+def sample_ids(ids: Sequence[int], k: int, rng: random.Random, excluded: Collection[int] = ()) -> List[int]:
+    """ids에서 excluded를 제외하고 중복 없이 최대 k개를 무작위로 추출
+
+    필요한 만큼만 섞는 Fisher-Yates 방식이라 제외 대상이 적으면 O(k)에 끝남
+    같은 ids, k, excluded와 같은 시드의 rng를 주면 항상 같은 결과를 반환
+    """
+    n = len(ids)
+    swapped = {}  # 섞인 위치만 기록 (전체 배열을 복사하지 않음)
+    result = []
+
+    for i in range(n):
+        if len(result) >= k:
+            break
+
+        j = rng.randrange(i, n)
+        picked = swapped.get(j, j)
+        swapped[j] = swapped.get(i, i)
+
+        question_id = ids[picked]
+        if question_id not in excluded:
+            result.append(question_id)
+
+    return result
+
+
+class QuestionSampler:
+    """퀴즈 세션용 문제 무작위 추출
+
+    카테고리별 질문 ID 목록을 캐시해두고 메모리에서 추출하므로 ORDER BY RAND() 같은
+    전체 스캔 없이 세션을 만들 수 있음
+    """
+
+    # 카테고리 ID → 질문 ID 튜플 (ID 오름차순)
+    _id_cache = TTLCache(maxsize=settings.QUESTION_ID_CACHE_SIZE, ttl=settings.QUESTION_ID_CACHE_TTL, name="question_ids")
+
+    @classmethod
+    async def get_category_question_ids(cls, category_id: int) -> Sequence[int]:
+        """카테고리의 질문 ID 목록 조회 (캐시 사용)"""
+        ids = cls._id_cache.get(category_id)
+        if ids is None:
+            ids = tuple(await QuestionRepository.get_ids_by_category(category_id))
+            cls._id_cache.set(category_id, ids)
+        return ids
+
+    @classmethod
+    def invalidate(cls, category_id: int) -> None:
+        """카테고리의 질문 ID 캐시 제거 (질문 생성/삭제/카테고리 변경 시 호출)"""
+        cls._id_cache.delete(category_id)
+
+    @classmethod
+    async def _get_excluded_ids(cls,
+                                user_id: int,
+                                category_id: int,
+                                exclude_correct: bool,
+                                exclude_recent_days: Optional[int]) -> Set[int]:
+        """추출에서 제외할 질문 ID 집합 조회"""
+        excluded: Set[int] = set()
+
+        if exclude_correct:
+            excluded |= await UserScoreRepository.get_answered_question_ids(
+                user_id, category_id, correct_only=True
+            )
+
+        if exclude_recent_days:
+            excluded |= await UserScoreRepository.get_answered_question_ids(
+                user_id, category_id, within_days=exclude_recent_days
+            )
+
+        return excluded
+
+    @classmethod
+    async def sample(cls,
+                     category_id: int,
+                     k: int,
+                     seed: Optional[int] = None,
+                     user_id: Optional[int] = None,
+                     exclude_correct: bool = False,
+                     exclude_recent_days: Optional[int] = None) -> List[int]:
+        """카테고리에서 질문 ID를 최대 k개 무작위 추출
+
+        Args:
+            category_id: 카테고리 ID
+            k: 추출할 문제 수
+            seed: 난수 시드 (같은 시드와 같은 문제 목록이면 같은 결과)
+            user_id: 제외 조건을 적용할 사용자 ID
+            exclude_correct: 사용자가 이미 맞힌 문제 제외
+            exclude_recent_days: 최근 N일 안에 사용자가 풀었던 문제 제외
+        """
+        ids = await cls.get_category_question_ids(category_id)
+
+        excluded: Set[int] = set()
+        if user_id is not None and (exclude_correct or exclude_recent_days):
+            excluded = await cls._get_excluded_ids(user_id, category_id, exclude_correct, exclude_recent_days)
+
+        result = sample_ids(ids, k, random.Random(seed), excluded)
+
+        logger.debug(
+            f"문제 추출 (카테고리: {category_id}) - 후보: {len(ids)}, 제외: {len(excluded)}, 추출: {len(result)}"
+        )
+
+        return result
@@ -1,59 +1,77 @@
 # app/services/quiz_service.py
 import logging
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, AsyncIterator
 
+from app.core.config import settings
 from app.core.database import transaction
-from app.core.exceptions import NotFoundException, DatabaseException, ValidationException
+from app.core.exceptions import NotFoundException, DatabaseException, ValidationException, ServiceUnavailableException
+from app.models.qna import QuestionWithAnswers
 from app.models.quiz_session import (
     QuizSessionCreate, QuizSessionWithStats
 )
-from app.models.submit import SubmitAnswer
-from app.repositories.category_repository import CategoryRepository
+from app.repositories.category_repository import CategoryRegistry
 from app.repositories.qna_repository import QnARepository
+from app.repositories.question_repository import QuestionRepository
 from app.repositories.quiz_repository import QuizSessionRepository, SessionQuestionRepository
-from app.services.user_score_service import UserScoreService
+from app.services.question_sampler import QuestionSampler
+from app.services.submission_pipeline import SubmissionPipeline
 
 logger = logging.getLogger(__name__)
 
 
 class QuizService:
     @staticmethod
-    async def create_quiz_session(session: QuizSessionCreate, question_count: int = 10) -> Dict[str, Any]:
-        """카테고리 기반으로 퀴즈 세션 생성"""
+    async def create_quiz_session(
+            session: QuizSessionCreate,
+            question_count: int = 10,
+            user_id: Optional[int] = None,
+            seed: Optional[int] = None,
+            exclude_correct: bool = False,
+            exclude_recent_days: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """카테고리 기반으로 퀴즈 세션 생성
+
+        Args:
+            session: 생성할 세션 정보
+            question_count: 세션에 넣을 문제 수
+            user_id: 세션을 만드는 사용자 ID (제외 조건에 사용)
+            seed: 문제 추출 난수 시드 (같은 시드면 같은 문제 구성)
+            exclude_correct: 사용자가 이미 맞힌 문제 제외
+            exclude_recent_days: 최근 N일 안에 사용자가 풀었던 문제 제외
+        """
         try:
             # 카테고리 존재 확인
-            category = await CategoryRepository.get_by_id(session.category_id)
+            category = await CategoryRegistry.get_by_id(session.category_id)
             if not category:
                 raise NotFoundException(f"ID가 {session.category_id}인 카테고리를 찾을 수 없습니다.")
 
+            # 해당 카테고리에서 랜덤하게 문제 추출
+            question_ids = await QuestionSampler.sample(
+                session.category_id,
+                question_count,
+                seed=seed,
+                user_id=user_id,
+                exclude_correct=exclude_correct,
+                exclude_recent_days=exclude_recent_days
+            )
+
             async with transaction() as conn:
+                # 캐시된 ID 목록 이후에 삭제된 문제 제외
+                question_ids = await QuestionRepository.filter_existing_ids(question_ids, conn)
+
                 # 세션 생성
                 session_id = await QuizSessionRepository.create_session(session, conn)
 
-                # 해당 카테고리에서 랜덤하게 문제 가져오기
-                questions = await QnARepository.get_all_questions_with_answers(
-                    skip=0,
-                    limit=question_count,
-                    category_id=session.category_id,
-                    is_random=True
-                )
-
-                # 세션에 문제 추가
-                for idx, q in enumerate(questions, start=1):
-                    await SessionQuestionRepository.add_question_to_session(
-                        session_id,
-                        q.question_id,
-                        idx,
-                        conn
-                    )
+                # 세션에 문제 일괄 추가
+                await SessionQuestionRepository.add_questions_bulk(session_id, question_ids, conn=conn)
 
                 # 로그 기록
-                logger.info(f"퀴즈 세션 생성: {session_id} (카테고리: {category.name}, 문제 수: {len(questions)})")
+                logger.info(f"퀴즈 세션 생성: {session_id} (카테고리: {category.name}, 문제 수: {len(question_ids)})")
 
                 return {
                     "success": True,
                     "session_id": session_id,
-                    "question_count": len(questions),
+                    "question_count": len(question_ids),
                     "message": f"카테고리 '{category.name}'의 퀴즈 세션이 생성되었습니다."
                 }
 
@@ -82,8 +100,7 @@ class QuizService:
         """카테고리별 퀴즈 세션 목록 조회"""
         try:
             # 카테고리 존재 확인
-            category = await CategoryRepository.get_by_id(category_id)
-            if not category:
+            if not await CategoryRegistry.exists(category_id):
                 raise NotFoundException(f"ID가 {category_id}인 카테고리를 찾을 수 없습니다.")
 
             return await QuizSessionRepository.get_sessions_by_category(category_id)
@@ -100,89 +117,135 @@ class QuizService:
             selected_answer_ids: List[int],
             user_id: int
     ) -> Dict[str, Any]:
-        """세션 내 문제 답변 제출"""
+        """세션 내 문제 답변 제출 (SubmissionPipeline에서 하나의 트랜잭션으로 처리)"""
         try:
-            # 세션 존재 확인
-            session = await QuizSessionRepository.get_session_with_stats(session_id)
-            if not session:
-                raise NotFoundException(f"ID가 {session_id}인 퀴즈 세션을 찾을 수 없습니다.")
+            return await SubmissionPipeline.submit(session_id, question_id, selected_answer_ids, user_id)
+        except (NotFoundException, ValidationException, ServiceUnavailableException):
+            raise
+        except Exception as e:
+            logger.error(f"세션 답변 제출 중 오류 발생: {e}")
+            raise DatabaseException(str(e))
 
-            # 세션에 문제가 포함되어 있는지 확인
-            if not await SessionQuestionRepository.is_question_in_session(session_id, question_id):
-                raise ValidationException(f"해당 퀴즈 세션에 ID가 {question_id}인 문제가 없습니다.")
+    @staticmethod
+    async def _hydrate_session_questions(
+            session: QuizSessionWithStats,
+            session_questions: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """세션 문제 행에 답변 목록을 일괄 조회해서 붙임 (답변 조회 1회)
 
-            # 사용자 성적 서비스를 이용해 답변 기록 및 결과 확인
-            submit_data = SubmitAnswer(
-                question_id=question_id,
-                selected_answer_ids=selected_answer_ids
-            )
-            result = await UserScoreService.record_user_answer(user_id, submit_data)
+        세션과 카테고리가 같은 문제는 session.category를 그대로 쓰고,
+        나머지만 CategoryRegistry에서 조회 (DB 조회 없음)
+        """
+        if not session_questions:
+            return []
+
+        answers_by_question = await QnARepository.get_answers_by_question_ids(
+            list({sq["question_id"] for sq in session_questions})
+        )
+
+        # 세션 생성 후 카테고리가 바뀐 문제도 있을 수 있으므로 문제의 카테고리 기준으로 조회
+        categories = {session.category_id: session.category}
+        categories.update(await CategoryRegistry.get_many(
+            sq["category_id"] for sq in session_questions if sq["category_id"] != session.category_id
+        ))
+
+        result = []
+        for sq in session_questions:
+            category_id = sq["category_id"]
+
+            # 같은 문제가 여러 번 들어있을 수 있으므로 답변은 복사해서 사용
+            answers = [answer.model_copy() for answer in answers_by_question.get(sq["question_id"], [])]
 
-            # 세션 문제 결과 업데이트
-            await SessionQuestionRepository.update_question_result(
-                session_id,
-                question_id,
-                "Y" if result["is_correct"] else "N"
+            # 답변 제출 전인 경우에만 정답 정보 숨김
+            if sq["is_answered"] == "N":
+                # 답변에서 is_correct 정보 제거 (정답 숨김)
+                for answer in answers:
+                    answer.is_correct = "?"
+
+            q_detail = QuestionWithAnswers(
+                question_id=sq["question_id"],
+                category_id=category_id,
+                user_id=sq["user_id"],
+                answer_type=sq["answer_type"],
+                question_text=sq["question_text"],
+                note=sq["note"],
+                link_url=sq["link_url"],
+                group_id=sq["group_id"],
+                create_at=sq["question_create_at"],
+                update_at=sq["question_update_at"],
+                answers=answers,
+                category=categories[category_id]
             )
 
-            # 응답에 세션 ID 추가
-            result["session_id"] = session_id
+            # 세션 문제 정보와 상세 정보 합치기
+            result.append({
+                "sq_id": sq["sq_id"],
+                "session_id": sq["session_id"],
+                "question_id": sq["question_id"],
+                "order_num": sq["order_num"],
+                "is_answered": sq["is_answered"],
+                "is_correct": sq["is_correct"],
+                "answer_time": sq["answer_time"],
+                "detail": q_detail
+            })
+
+        return result
+
+    @staticmethod
+    async def _load_session_questions(session_id: int):
+        """세션 존재 확인 후 세션 정보와 세션 문제 행 목록 반환"""
+        session = await QuizSessionRepository.get_session_with_stats(session_id)
+        if not session:
+            raise NotFoundException(f"ID가 {session_id}인 퀴즈 세션을 찾을 수 없습니다.")
+
+        session_questions = await SessionQuestionRepository.get_session_questions(session_id)
+        return session, session_questions
 
-            return result
+    @staticmethod
+    async def get_session_questions(session_id: int) -> List[Dict[str, Any]]:
+        """세션에 포함된 문제 목록 조회 (세션 1회 + 세션 문제 1회 + 답변 1회 쿼리)"""
+        try:
+            session, session_questions = await QuizService._load_session_questions(session_id)
+
+            return await QuizService._hydrate_session_questions(session, session_questions)
         except NotFoundException:
             raise
-        except ValidationException:
-            raise
         except Exception as e:
-            logger.error(f"세션 답변 제출 중 오류 발생: {e}")
+            logger.error(f"세션 문제 목록 조회 중 오류 발생: {e}")
             raise DatabaseException(str(e))
 
     @staticmethod
-    async def get_session_questions(session_id: int) -> List[Dict[str, Any]]:
-        """세션에 포함된 문제 목록 조회"""
-        try:
-            # 세션 존재 확인
-            session = await QuizSessionRepository.get_session_with_stats(session_id)
-            if not session:
-                raise NotFoundException(f"ID가 {session_id}인 퀴즈 세션을 찾을 수 없습니다.")
-
-            # 세션 문제 목록 조회
-            session_questions = await SessionQuestionRepository.get_session_questions(session_id)
-
-            # 문제 상세 정보 조회
-            result = []
-            for sq in session_questions:
-                # 문제 상세 정보를 QnA 레포지토리에서 가져오지만,
-                # 이미 답변을 제출한 경우에는 답변 정보를 표시하지 않음
-                q_detail = await QnARepository.get_question_with_answers(sq["question_id"])
-
-                # 답변 제출 전인 경우에만 정답 정보 숨김
-                if sq["is_answered"] == "N":
-                    # 답변에서 is_correct 정보 제거 (정답 숨김)
-                    for answer in q_detail.answers:
-                        answer.is_correct = "?"
-
-                # 세션 문제 정보와 상세 정보 합치기
-                question_data = {
-                    "sq_id": sq["sq_id"],
-                    "session_id": sq["session_id"],
-                    "question_id": sq["question_id"],
-                    "order_num": sq["order_num"],
-                    "is_answered": sq["is_answered"],
-                    "is_correct": sq["is_correct"],
-                    "answer_time": sq["answer_time"],
-                    "detail": q_detail
-                }
+    async def stream_session_questions(
+            session_id: int,
+            chunk_size: int = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """세션 문제 목록을 chunk_size개씩 조회하며 순서대로 내보내는 비동기 이터레이터 반환
 
-                result.append(question_data)
+        세션 존재 확인은 호출 시점에 수행하므로 응답 전송 전에 NotFoundException을 받을 수 있음
+        """
+        chunk_size = chunk_size or settings.SESSION_QUESTION_STREAM_CHUNK
 
-            return result
+        try:
+            session, session_questions = await QuizService._load_session_questions(session_id)
         except NotFoundException:
             raise
         except Exception as e:
             logger.error(f"세션 문제 목록 조회 중 오류 발생: {e}")
             raise DatabaseException(str(e))
 
+        async def iterate() -> AsyncIterator[Dict[str, Any]]:
+            try:
+                for start in range(0, len(session_questions), chunk_size):
+                    chunk = session_questions[start:start + chunk_size]
+                    for item in await QuizService._hydrate_session_questions(session, chunk):
+                        yield item
+            except Exception as e:
+                # 응답 전송이 이미 시작된 뒤라 상태 코드를 바꿀 수 없으므로 기록만 남김
+                logger.error(f"세션 문제 목록 스트리밍 중 오류 발생 (세션 ID: {session_id}): {e}")
+                raise
+
+        return iterate()
+
     @staticmethod
     async def get_user_sessions(user_id: int) -> List[QuizSessionWithStats]:
         """사용자의 퀴즈 세션 목록 조회"""
@@ -191,3 +254,22 @@ class QuizService:
         except Exception as e:
             logger.error(f"사용자 세션 목록 조회 중 오류 발생: {e}")
             raise DatabaseException(str(e))
+
+    @staticmethod
+    async def rebuild_session_stats(session_id: int = None) -> Dict[str, Any]:
+        """session_question 기준으로 세션 통계 카운터 재계산"""
+        try:
+            updated = await QuizSessionRepository.rebuild_stats(session_id)
+
+            # 로그 기록
+            target = f"세션 {session_id}" if session_id is not None else "전체 세션"
+            logger.info(f"세션 통계 재계산 ({target}) - 변경된 세션 수: {updated}")
+
+            return {
+                "success": True,
+                "updated_count": updated,
+                "message": "세션 통계가 재계산되었습니다."
+            }
+        except Exception as e:
+            logger.error(f"세션 통계 재계산 중 오류 발생: {e}")
+            raise DatabaseException(str(e))
@@ -1,10 +1,12 @@
 # app/services/role_request_service.py
 import logging
-from typing import Dict, Any, List
+from datetime import datetime
+from typing import Dict, Any, List, Optional, Tuple
 
 from app.core.auth import create_access_token
 from app.core.database import transaction
 from app.core.exceptions import ValidationException, ForbiddenException, NotFoundException, DatabaseException
+from app.core.pagination import decode_cursor, next_cursor
 from app.models.role_request import RoleRequest, RoleRequestCreate, RoleRequestStatus, RoleApprovalRequest
 from app.models.user import UserUpdate
 from app.repositories.role_request_repository import RoleRequestRepository
@@ -20,7 +22,7 @@ class RoleRequestService:
         """새 역할 변경 요청 생성"""
         try:
             # 사용자 존재 확인
-            user = await UserRepository.get_by_id(user_id)
+            user = await UserRepository.get_cached(user_id)
             if not user:
                 raise NotFoundException(f"ID가 {user_id}인 사용자를 찾을 수 없습니다.")
 
@@ -63,36 +65,31 @@ class RoleRequestService:
             raise DatabaseException(str(e))
 
     @staticmethod
-    async def get_pending_requests(admin_id: int) -> List[Dict[str, Any]]:
-        """관리자용 대기 중인 역할 변경 요청 목록 조회"""
+    async def get_pending_requests(
+            admin_id: int,
+            limit: int = 100,
+            after: Optional[str] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[str], int]:
+        """관리자용 대기 중인 역할 변경 요청 목록 조회 (오래된 순, 커서 방식)
+
+        요청과 요청자 정보를 한 번의 JOIN 쿼리로 조회
+        반환값: (요청 목록, 다음 페이지 커서 - 더 이상 없으면 None, 대기 중인 전체 요청 수)
+        """
         try:
             # 관리자 권한 확인
-            admin = await UserRepository.get_by_id(admin_id)
+            admin = await UserRepository.get_cached(admin_id)
             if not admin or admin.role != "admin":
                 raise ForbiddenException("역할 변경 요청 목록을 조회할 권한이 없습니다.")
 
-            # 대기 중인 요청 조회
-            requests = await RoleRequestRepository.get_pending_requests()
-
-            # 사용자 정보 포함하여 반환
-            result = []
-            for req in requests:
-                user = await UserRepository.get_by_id(req.user_id)
-                if user:
-                    result.append({
-                        "request_id": req.request_id,
-                        "user_id": req.user_id,
-                        "username": user.username,
-                        "email": user.email,
-                        "current_role": user.role,
-                        "requested_role": req.requested_role,
-                        "reason": req.reason,
-                        "create_at": req.create_at  # 변경: created_at → create_at
-                    })
-
-            return result
-
-        except ForbiddenException:
+            after_key = decode_cursor(after, [datetime, int]) if after else None
+
+            # 대기 중인 요청 + 요청자 정보 조회
+            requests, next_key = await RoleRequestRepository.get_pending_requests_page(limit, after_key)
+            total = await RoleRequestRepository.count_pending_requests()
+
+            return [request.model_dump() for request in requests], next_cursor(next_key), total
+
+        except (ForbiddenException, ValidationException):
             raise
         except Exception as e:
             logger.error(f"대기 중인 역할 변경 요청 조회 중 오류 발생: {e}")
@@ -113,7 +110,7 @@ class RoleRequestService:
         """역할 변경 요청 승인"""
         try:
             # 관리자 권한 확인
-            admin = await UserRepository.get_by_id(admin_id)
+            admin = await UserRepository.get_cached(admin_id)
             if not admin or admin.role != "admin":
                 raise ForbiddenException("역할 변경 요청을 승인할 권한이 없습니다.")
 
@@ -127,7 +124,7 @@ class RoleRequestService:
                 raise ValidationException(f"이미 처리된 요청입니다 (현재 상태: {request.status}).")
 
             # 사용자 존재 확인
-            user = await UserRepository.get_by_id(request.user_id)
+            user = await UserRepository.get_cached(request.user_id)
             if not user:
                 raise NotFoundException(f"ID가 {request.user_id}인 사용자를 찾을 수 없습니다.")
 
@@ -152,6 +149,9 @@ class RoleRequestService:
                     conn
                 )
 
+            # 트랜잭션 커밋 전에 다른 요청이 이전 값을 다시 캐시했을 수 있으므로 한 번 더 제거
+            UserRepository.invalidate_cache(request.user_id)
+
             # 사용자의 업데이트된 정보 가져오기
             updated_user = await UserRepository.get_by_id(request.user_id)
 
@@ -193,7 +193,7 @@ class RoleRequestService:
         """역할 변경 요청 거부"""
         try:
             # 관리자 권한 확인
-            admin = await UserRepository.get_by_id(admin_id)
+            admin = await UserRepository.get_cached(admin_id)
             if not admin or admin.role != "admin":
                 raise ForbiddenException("역할 변경 요청을 거부할 권한이 없습니다.")
 
@@ -215,7 +215,7 @@ class RoleRequestService:
             )
 
             # 사용자 정보 가져오기
-            user = await UserRepository.get_by_id(request.user_id)
+            user = await UserRepository.get_cached(request.user_id)
             username = user.username if user else f"사용자 {request.user_id}"
 
             logger.info(f"역할 변경 요청 거부: 요청 ID {request_id}, 사용자 ID {request.user_id}")
@@ -0,0 +1,329 @@
+# app/services/score_write_buffer.py
+import asyncio
+import json
+import logging
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+from app.core.database import transaction
+from app.core.exceptions import ServiceUnavailableException
+from app.core.metrics import registry
+from app.models.user_score import UserScoreCreate
+from app.repositories.user_score_repository import UserScoreRepository, UserCategoryStatRepository
+
+logger = logging.getLogger(__name__)
+
+# 종료 신호
+_STOP = object()
+
+
+class ScoreWriteBuffer:
+    """user_score / user_category_stat 쓰기 지연(write-behind) 버퍼
+
+    - 제출 요청은 큐에 넣기만 하고 바로 응답
+    - 백그라운드 작업이 flush_interval(ms)마다 또는 max_batch개가 모이면
+      user_score는 multi-row INSERT로, 카테고리 통계는 (user_id, category_id)별로 합쳐서 한 번에 반영
+    - 제출 처리 전에 reserve()로 큐 자리를 먼저 확보하고, 다른 기록을 커밋한 뒤에 put_reserved()로 추가
+      (자리가 put_timeout(초) 안에 나지 않으면 아무것도 기록하지 않고 ServiceUnavailableException)
+    - 배치 반영이 실패하면 간격을 늘려가며 재시도하고, 그래도 실패하면 행 단위로 기록하며
+      끝까지 실패한 행은 dead_letter_path 파일에 남김
+    - 종료 시 새 예약을 막고, 이미 예약된 항목까지 큐에 들어온 뒤에 남은 항목을 모두 반영하고 멈춤
+
+    user_score.submit_at은 반영 시점의 시각이 기록되며 (최대 flush_interval 지연),
+    버퍼 모드에서는 응답의 score_id가 None (score_buffered가 True)
+    """
+
+    _queue: Optional[asyncio.Queue] = None
+    _slots: Optional[asyncio.Semaphore] = None
+    _task: Optional[asyncio.Task] = None
+    _accepting: bool = False
+
+    # 자리를 확보했지만 아직 큐에 넣지 않은 항목 수 (종료 시 모두 들어올 때까지 대기)
+    _reserved: int = 0
+    _reserved_done: Optional[asyncio.Event] = None
+
+    # 실행 통계
+    flushed_rows: int = 0
+    flush_count: int = 0
+    failed_rows: int = 0
+    retried_flushes: int = 0
+    last_flush_duration: float = 0.0  # 초 단위
+
+    @classmethod
+    def is_running(cls) -> bool:
+        """버퍼가 제출을 받고 있는지 여부"""
+        return cls._accepting
+
+    @classmethod
+    def queue_size(cls) -> int:
+        """큐에 대기 중인 항목 수"""
+        return cls._queue.qsize() if cls._queue else 0
+
+    @classmethod
+    async def reserve(cls) -> bool:
+        """큐 자리 하나를 미리 확보
+
+        버퍼가 꺼져 있거나 종료 중이면 False (호출한 쪽에서 직접 기록),
+        put_timeout 안에 자리가 나지 않으면 ServiceUnavailableException
+        확보한 자리는 put_reserved() 또는 release()로 반드시 돌려줘야 함
+        """
+        if not cls._accepting:
+            return False
+
+        try:
+            await asyncio.wait_for(cls._slots.acquire(), timeout=settings.SCORE_WRITE_BUFFER_PUT_TIMEOUT)
+        except asyncio.TimeoutError:
+            logger.warning(f"성적 쓰기 버퍼가 가득 참 (대기 중: {cls.queue_size()}건)")
+            raise ServiceUnavailableException()
+
+        # 기다리는 동안 종료가 시작된 경우
+        if not cls._accepting:
+            cls._slots.release()
+            return False
+
+        cls._reserved += 1
+        cls._reserved_done.clear()
+        return True
+
+    @classmethod
+    def _unreserve(cls) -> None:
+        cls._reserved -= 1
+        if cls._reserved == 0:
+            cls._reserved_done.set()
+
+    @classmethod
+    def put_reserved(cls, score: UserScoreCreate, category_id: int) -> None:
+        """reserve()로 확보한 자리에 성적 기록 및 카테고리 통계 증가분 추가 (대기 없음)"""
+        cls._queue.put_nowait((score, category_id))
+        cls._unreserve()
+
+    @classmethod
+    def release(cls) -> None:
+        """reserve()로 확보한 자리를 사용하지 않고 반환 (제출 처리가 실패한 경우)"""
+        cls._slots.release()
+        cls._unreserve()
+
+    @classmethod
+    async def enqueue(cls, score: UserScoreCreate, category_id: int) -> bool:
+        """자리를 확보해서 바로 큐에 추가 (버퍼가 꺼져 있거나 종료 중이면 False)"""
+        if not await cls.reserve():
+            return False
+        cls.put_reserved(score, category_id)
+        return True
+
+    @classmethod
+    def get_stats(cls) -> Dict[str, Any]:
+        """버퍼 실행 통계"""
+        return {
+            "running": cls.is_running(),
+            "queue_size": cls.queue_size(),
+            "flushed_rows": cls.flushed_rows,
+            "flush_count": cls.flush_count,
+            "failed_rows": cls.failed_rows,
+            "retried_flushes": cls.retried_flushes,
+            "last_flush_duration_ms": round(cls.last_flush_duration * 1000, 2)
+        }
+
+    @staticmethod
+    async def _write_batch(batch: List[Tuple[UserScoreCreate, int]]) -> None:
+        """모인 항목을 하나의 트랜잭션으로 기록 (user_score INSERT 1회 + 통계 upsert 1회)"""
+        scores = [score for score, _ in batch]
+        increments = [
+            (score.user_id, category_id, 1, 1 if score.is_correct == 'Y' else 0)
+            for score, category_id in batch
+        ]
+
+        async with transaction() as conn:
+            await UserScoreRepository.create_scores_bulk(scores, conn)
+            await UserCategoryStatRepository.apply_increments(increments, conn)
+
+    @staticmethod
+    async def _write_row(score: UserScoreCreate, category_id: int) -> None:
+        """항목 하나를 별도 트랜잭션으로 기록"""
+        async with transaction() as conn:
+            await UserScoreRepository.create_score(score, conn)
+            await UserCategoryStatRepository.update_category_stat(
+                score.user_id,
+                category_id,
+                score.is_correct,
+                conn
+            )
+
+    @staticmethod
+    def _write_dead_letter(batch: List[Tuple[UserScoreCreate, int]], error: str) -> None:
+        """기록하지 못한 항목을 JSON Lines 파일에 추가"""
+        failed_at = datetime.utcnow().isoformat()
+        with open(settings.SCORE_WRITE_BUFFER_DEAD_LETTER_PATH, "a", encoding="utf-8") as f:
+            for score, category_id in batch:
+                f.write(json.dumps({
+                    **score.model_dump(),
+                    "category_id": category_id,
+                    "failed_at": failed_at,
+                    "error": error
+                }, ensure_ascii=False) + "\n")
+
+    @classmethod
+    async def _flush(cls, batch: List[Tuple[UserScoreCreate, int]]) -> None:
+        """모인 항목을 반영 (실패 시 재시도 → 행 단위 기록 → dead letter 파일)"""
+        if not batch:
+            return
+
+        start = time.perf_counter()
+        retries = settings.SCORE_WRITE_BUFFER_FLUSH_RETRIES
+
+        for attempt in range(retries + 1):
+            try:
+                await cls._write_batch(batch)
+                break
+            except Exception as e:
+                if attempt == retries:
+                    logger.error(f"성적 쓰기 버퍼 배치 반영 실패 ({len(batch)}건, 행 단위로 기록): {e}")
+                    await cls._flush_rows(batch)
+                    return
+                cls.retried_flushes += 1
+                delay = settings.SCORE_WRITE_BUFFER_RETRY_BACKOFF * (2 ** attempt)
+                logger.warning(f"성적 쓰기 버퍼 반영 중 오류 발생 ({len(batch)}건, {delay:.1f}초 후 재시도): {e}")
+                await asyncio.sleep(delay)
+
+        cls.last_flush_duration = time.perf_counter() - start
+        cls.flushed_rows += len(batch)
+        cls.flush_count += 1
+        logger.debug(f"성적 쓰기 버퍼 반영: {len(batch)}건 ({cls.last_flush_duration * 1000:.1f}ms)")
+
+    @classmethod
+    async def _flush_rows(cls, batch: List[Tuple[UserScoreCreate, int]]) -> None:
+        """배치 반영이 끝내 실패한 항목을 행 단위로 기록하고, 그래도 실패한 행은 파일에 남김"""
+        failed = []
+        error = ""
+        for score, category_id in batch:
+            try:
+                await cls._write_row(score, category_id)
+                cls.flushed_rows += 1
+            except Exception as e:
+                failed.append((score, category_id))
+                error = str(e)
+
+        if not failed:
+            return
+
+        cls.failed_rows += len(failed)
+        try:
+            await asyncio.to_thread(cls._write_dead_letter, failed, error)
+            logger.error(
+                f"성적 {len(failed)}건을 기록하지 못해 {settings.SCORE_WRITE_BUFFER_DEAD_LETTER_PATH}에 저장: {error}"
+            )
+        except Exception as e:
+            logger.critical(f"성적 {len(failed)}건을 기록하지 못했고 파일 저장도 실패 ({e}): {failed}")
+
+    @classmethod
+    async def _run(cls, flush_interval: float, max_batch: int):
+        """큐에서 항목을 모아서 주기적으로 반영"""
+        loop = asyncio.get_running_loop()
+        stopping = False
+
+        while not stopping:
+            item = await cls._take()
+            if item is _STOP:
+                break
+
+            batch = [item]
+            deadline = loop.time() + flush_interval
+
+            # flush_interval 동안 또는 max_batch개가 모일 때까지 수집
+            while len(batch) < max_batch:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(cls._take(), timeout=remaining)
+                except asyncio.TimeoutError:
+                    break
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+
+            await cls._flush(batch)
+
+        await cls._drain(max_batch)
+
+    @classmethod
+    async def _take(cls):
+        """큐에서 항목 하나를 꺼내고 그 자리를 반환"""
+        item = await cls._queue.get()
+        if item is not _STOP:
+            cls._slots.release()
+        return item
+
+    @classmethod
+    async def _drain(cls, max_batch: int):
+        """큐에 남은 항목을 모두 반영"""
+        batch = []
+        while not cls._queue.empty():
+            item = cls._queue.get_nowait()
+            if item is _STOP:
+                continue
+            cls._slots.release()
+            batch.append(item)
+            if len(batch) >= max_batch:
+                await cls._flush(batch)
+                batch = []
+        await cls._flush(batch)
+
+    @classmethod
+    def start(cls):
+        """쓰기 지연 버퍼 시작"""
+        if cls._task and not cls._task.done():
+            return
+
+        # 큐 크기는 _slots로 제한 (put_reserved와 종료 신호는 대기 없이 들어가야 하므로 큐 자체는 무제한)
+        cls._queue = asyncio.Queue()
+        cls._slots = asyncio.Semaphore(settings.SCORE_WRITE_BUFFER_QUEUE_SIZE)
+        cls._reserved = 0
+        cls._reserved_done = asyncio.Event()
+        cls._reserved_done.set()
+        cls._task = asyncio.create_task(cls._run(
+            settings.SCORE_WRITE_BUFFER_FLUSH_INTERVAL_MS / 1000,
+            settings.SCORE_WRITE_BUFFER_MAX_BATCH
+        ))
+        cls._accepting = True
+        logger.info(
+            f"성적 쓰기 버퍼 시작 (주기: {settings.SCORE_WRITE_BUFFER_FLUSH_INTERVAL_MS}ms, "
+            f"최대 배치: {settings.SCORE_WRITE_BUFFER_MAX_BATCH}건, 큐 크기: {settings.SCORE_WRITE_BUFFER_QUEUE_SIZE})"
+        )
+
+    @classmethod
+    async def stop(cls):
+        """새 제출 받기를 멈추고 큐에 남은 항목을 모두 반영한 뒤 종료"""
+        if not cls._task:
+            return
+
+        # 새 예약을 막고, 이미 자리를 확보한 제출이 큐에 들어올 때까지 기다린 뒤에 종료 신호 전달
+        cls._accepting = False
+        await cls._reserved_done.wait()
+        cls._queue.put_nowait(_STOP)
+        await cls._task
+
+        cls._task = None
+        logger.info(f"성적 쓰기 버퍼 종료 (반영: {cls.flushed_rows}건, 실패: {cls.failed_rows}건)")
+
+
+# 버퍼 상태 지표 (/metrics 조회 시점에 갱신)
+_queue_size_gauge = registry.gauge("score_write_buffer_queue_size", "쓰기 지연 버퍼 대기 항목 수")
+_flushed_rows_counter = registry.counter("score_write_buffer_flushed_rows_total", "쓰기 지연 버퍼에서 반영한 행 수")
+_failed_rows_counter = registry.counter("score_write_buffer_failed_rows_total", "쓰기 지연 버퍼에서 반영하지 못한 행 수")
+_flush_counter = registry.counter("score_write_buffer_flushes_total", "쓰기 지연 버퍼 반영 횟수")
+_retried_flush_counter = registry.counter("score_write_buffer_retried_flushes_total", "쓰기 지연 버퍼 배치 반영 재시도 횟수")
+
+
+def _collect_buffer_metrics() -> None:
+    _queue_size_gauge.set(value=ScoreWriteBuffer.queue_size())
+    _flushed_rows_counter.set(value=ScoreWriteBuffer.flushed_rows)
+    _failed_rows_counter.set(value=ScoreWriteBuffer.failed_rows)
+    _flush_counter.set(value=ScoreWriteBuffer.flush_count)
+    _retried_flush_counter.set(value=ScoreWriteBuffer.retried_flushes)
+
+
+registry.register_collector(_collect_buffer_metrics)
@@ -0,0 +1,136 @@
+# app/services/submission_pipeline.py
+import logging
+import time
+from typing import List, Dict, Any
+
+from app.core.database import transaction
+from app.core.exceptions import NotFoundException, ValidationException
+from app.core.metrics import registry
+from app.models.user_score import UserScoreCreate
+from app.repositories.qna_repository import QnARepository
+from app.repositories.quiz_repository import SessionQuestionRepository
+from app.repositories.user_score_repository import UserScoreRepository, UserCategoryStatRepository
+from app.services.score_write_buffer import ScoreWriteBuffer
+
+logger = logging.getLogger(__name__)
+
+# 단계별 소요 시간 지표
+submission_stage_duration_seconds = registry.histogram(
+    "submission_stage_duration_seconds", "세션 답변 제출 단계별 소요 시간(초)", ("stage",)
+)
+
+
+class SubmissionPipeline:
+    """퀴즈 세션 답변 제출 처리
+
+    1. grade: 캐시된 정답 키로 채점 (캐시에 있으면 DB 조회 없음)
+    2. probe: 세션 존재 + 세션 문제 포함 여부 확인 및 행 잠금 (쿼리 1회)
+    3. write: user_score, user_category_stat, session_question(+세션 카운터) 기록
+    4. commit: 트랜잭션 커밋
+
+    2~4단계는 하나의 트랜잭션에서 실행되며 단계별 소요 시간(ms)은 로그와
+    submission_stage_duration_seconds 지표에만 기록 (응답에는 포함하지 않음)
+    ScoreWriteBuffer가 실행 중이면 트랜잭션 전에 버퍼 자리를 먼저 확보하고 (자리가 없으면 아무것도 기록하지 않고 503)
+    트랜잭션에서는 session_question(+세션 카운터)만 기록한 뒤, 커밋되면 user_score / user_category_stat 기록을
+    확보한 자리에 넣음 (reserve 단계 시간 추가, 응답의 score_id는 None이고 score_buffered는 True)
+    """
+
+    @staticmethod
+    async def submit(
+            session_id: int,
+            question_id: int,
+            selected_answer_ids: List[int],
+            user_id: int
+    ) -> Dict[str, Any]:
+        """세션 내 문제 답변 제출 (채점 후 성적/통계/세션 결과 기록)"""
+        timings: Dict[str, float] = {}
+        started = time.perf_counter()
+
+        # 1. 채점
+        answer_key = await QnARepository.get_answer_key(question_id)
+        if not answer_key:
+            raise NotFoundException(f"ID가 {question_id}인 질문을 찾을 수 없습니다.")
+
+        result = QnARepository.grade(answer_key, selected_answer_ids)
+        is_correct = "Y" if result["is_correct"] else "N"
+        score_data = UserScoreCreate(
+            user_id=user_id,
+            question_id=question_id,
+            is_correct=is_correct,
+            selected_answers=",".join(map(str, selected_answer_ids))
+        )
+        mark = time.perf_counter()
+        timings["grade"] = (mark - started) * 1000
+
+        # 쓰기 지연 모드: 세션 결과를 기록하기 전에 버퍼 자리 확보 (가득 차 있으면 여기서 503)
+        buffered = await ScoreWriteBuffer.reserve()
+        if buffered:
+            now = time.perf_counter()
+            timings["reserve"] = (now - mark) * 1000
+            mark = now
+
+        try:
+            async with transaction() as conn:
+                # 2. 세션 및 세션 문제 확인
+                prev_rows = await SessionQuestionRepository.lock_for_submission(session_id, question_id, conn)
+                if prev_rows is None:
+                    raise NotFoundException(f"ID가 {session_id}인 퀴즈 세션을 찾을 수 없습니다.")
+                if not prev_rows:
+                    raise ValidationException(f"해당 퀴즈 세션에 ID가 {question_id}인 문제가 없습니다.")
+
+                now = time.perf_counter()
+                timings["probe"] = (now - mark) * 1000
+                mark = now
+
+                # 3. 성적, 카테고리 통계, 세션 문제 결과 기록
+                score_id = None
+                if not buffered:
+                    score_id = await UserScoreRepository.create_score(score_data, conn)
+
+                    await UserCategoryStatRepository.update_category_stat(
+                        user_id,
+                        answer_key.category_id,
+                        is_correct,
+                        conn
+                    )
+
+                await SessionQuestionRepository.update_question_result(
+                    session_id,
+                    question_id,
+                    is_correct,
+                    conn,
+                    prev_rows=prev_rows
+                )
+
+                now = time.perf_counter()
+                timings["write"] = (now - mark) * 1000
+                mark = now
+        except BaseException:
+            # 세션 결과가 기록되지 않았으므로 확보한 자리 반환
+            if buffered:
+                ScoreWriteBuffer.release()
+            raise
+
+        # 4. 커밋 (쓰기 지연 모드에서는 확보해둔 자리에 성적 기록 추가, 대기 없음)
+        if buffered:
+            ScoreWriteBuffer.put_reserved(score_data, answer_key.category_id)
+        now = time.perf_counter()
+        timings["commit"] = (now - mark) * 1000
+        timings["total"] = (now - started) * 1000
+
+        for stage, ms in timings.items():
+            submission_stage_duration_seconds.observe(ms / 1000, stage)
+        timings = {stage: round(ms, 3) for stage, ms in timings.items()}
+
+        # 로그 기록
+        logger.info(
+            f"세션 답변 제출 (세션 ID: {session_id}, 사용자 ID: {user_id}, 질문 ID: {question_id}, "
+            f"정답 여부: {is_correct}) - 소요 시간(ms): {timings}"
+        )
+
+        # 쓰기 지연 모드에서는 성적이 아직 기록되지 않아 score_id가 None
+        result["score_id"] = score_id
+        result["score_buffered"] = buffered
+        result["session_id"] = session_id
+
+        return result
@@ -0,0 +1,112 @@
+# app/services/token_cleanup_service.py
+import asyncio
+import logging
+import time
+from datetime import datetime
+from typing import Dict, Any, Optional
+
+from app.core.config import settings
+from app.core.metrics import registry
+from app.repositories.token_blacklist_repository import TokenBlacklistRepository
+
+logger = logging.getLogger(__name__)
+
+
+class TokenCleanupService:
+    """만료된 token_blacklist 레코드를 주기적으로 삭제하는 백그라운드 작업"""
+
+    _task: Optional[asyncio.Task] = None
+
+    # 실행 통계
+    last_run_at: Optional[datetime] = None
+    last_purged: int = 0
+    last_duration: float = 0.0  # 초 단위
+    total_purged: int = 0
+    run_count: int = 0
+
+    @classmethod
+    async def purge_expired_tokens(cls, batch_size: int = None) -> Dict[str, Any]:
+        """만료된 레코드를 batch_size씩 나눠서 모두 삭제"""
+        batch_size = batch_size or settings.TOKEN_PURGE_BATCH_SIZE
+        start = time.perf_counter()
+        purged = 0
+
+        while True:
+            deleted = await TokenBlacklistRepository.delete_expired_batch(batch_size)
+            purged += deleted
+            if deleted < batch_size:
+                break
+            # 배치 사이에 다른 요청이 처리될 수 있도록 양보
+            await asyncio.sleep(0)
+
+        cls.last_run_at = datetime.utcnow()
+        cls.last_purged = purged
+        cls.last_duration = time.perf_counter() - start
+        cls.total_purged += purged
+        cls.run_count += 1
+
+        logger.info(f"만료된 블랙리스트 토큰 정리: {purged}건 삭제 ({cls.last_duration * 1000:.1f}ms)")
+
+        return cls.get_stats()
+
+    @classmethod
+    def get_stats(cls) -> Dict[str, Any]:
+        """정리 작업 실행 통계"""
+        return {
+            "last_run_at": cls.last_run_at,
+            "last_purged": cls.last_purged,
+            "last_duration_ms": round(cls.last_duration * 1000, 2),
+            "total_purged": cls.total_purged,
+            "run_count": cls.run_count
+        }
+
+    @classmethod
+    async def _run_periodically(cls, interval: float):
+        """interval 초마다 정리 작업 실행"""
+        while True:
+            try:
+                await cls.purge_expired_tokens()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"만료된 블랙리스트 토큰 정리 중 오류 발생: {e}")
+
+            await asyncio.sleep(interval)
+
+    @classmethod
+    def start(cls, interval: float = None):
+        """백그라운드 정리 작업 시작"""
+        if cls._task and not cls._task.done():
+            return
+
+        interval = interval or settings.TOKEN_PURGE_INTERVAL
+        cls._task = asyncio.create_task(cls._run_periodically(interval))
+        logger.info(f"블랙리스트 토큰 정리 작업 시작 (주기: {interval}초)")
+
+    @classmethod
+    async def stop(cls):
+        """백그라운드 정리 작업 중지"""
+        if not cls._task:
+            return
+
+        cls._task.cancel()
+        try:
+            await cls._task
+        except asyncio.CancelledError:
+            pass
+        cls._task = None
+
+
+# 정리 작업 지표 (/metrics 조회 시점에 갱신)
+_purged_counter = registry.counter("token_cleanup_purged_total", "삭제한 만료 블랙리스트 토큰 수")
+_run_counter = registry.counter("token_cleanup_runs_total", "블랙리스트 정리 작업 실행 횟수")
+_duration_gauge = registry.gauge("token_cleanup_last_duration_seconds", "마지막 정리 작업 소요 시간(초)")
+
+
+def _collect_cleanup_metrics() -> None:
+    _purged_counter.set(value=TokenCleanupService.total_purged)
+    _run_counter.set(value=TokenCleanupService.run_count)
+    _duration_gauge.set(value=TokenCleanupService.last_duration)
+
+
+registry.register_collector(_collect_cleanup_metrics)
@@ -1,14 +1,16 @@
 # app/services/user_score_service.py
 import logging
-from typing import List, Dict, Any
+from datetime import datetime
+from typing import List, Dict, Any, Optional, Tuple
 
 from app.core.database import transaction
-from app.core.exceptions import NotFoundException, DatabaseException
+from app.core.exceptions import NotFoundException, DatabaseException, ServiceUnavailableException
+from app.core.pagination import decode_cursor, next_cursor
 from app.models.submit import SubmitAnswer
 from app.models.user_score import UserScore, UserScoreCreate, UserScoreSummary
 from app.repositories.qna_repository import QnARepository
-from app.repositories.question_repository import QuestionRepository
 from app.repositories.user_score_repository import UserScoreRepository, UserCategoryStatRepository
+from app.services.score_write_buffer import ScoreWriteBuffer
 
 logger = logging.getLogger(__name__)
 
@@ -21,35 +23,36 @@ class UserScoreService:
     ) -> Dict[str, Any]:
         """사용자 답변 제출 기록 및 채점"""
         try:
-            # 질문 존재 여부 확인
-            question = await QuestionRepository.get_by_id(submit_data.question_id)
-            if not question:
+            # 정답 키 조회 (질문 존재 여부 확인 겸용)
+            answer_key = await QnARepository.get_answer_key(submit_data.question_id)
+            if not answer_key:
                 raise NotFoundException(f"ID가 {submit_data.question_id}인 질문을 찾을 수 없습니다.")
 
             # 정답 확인
-            answer_result = await QnARepository.check_answers(
-                submit_data.question_id,
-                submit_data.selected_answer_ids
+            answer_result = QnARepository.grade(answer_key, submit_data.selected_answer_ids)
+
+            # 사용자 성적 기록
+            score_data = UserScoreCreate(
+                user_id=user_id,
+                question_id=submit_data.question_id,
+                is_correct="Y" if answer_result["is_correct"] else "N",
+                selected_answers=",".join(map(str, submit_data.selected_answer_ids))
             )
 
-            async with transaction() as conn:
-                # 사용자 성적 기록 생성
-                score_data = UserScoreCreate(
-                    user_id=user_id,
-                    question_id=submit_data.question_id,
-                    is_correct="Y" if answer_result["is_correct"] else "N",
-                    selected_answers=",".join(map(str, submit_data.selected_answer_ids))
-                )
-
-                score_id = await UserScoreRepository.create_score(score_data, conn)
-
-                # 카테고리 통계 업데이트
-                await UserCategoryStatRepository.update_category_stat(
-                    user_id,
-                    question.category_id,
-                    score_data.is_correct,
-                    conn
-                )
+            # 쓰기 지연 모드: 큐에 넣고 바로 응답 (score_id 없음, 버퍼가 꺼져 있거나 종료 중이면 직접 기록)
+            buffered = await ScoreWriteBuffer.enqueue(score_data, answer_key.category_id)
+            score_id = None
+            if not buffered:
+                async with transaction() as conn:
+                    score_id = await UserScoreRepository.create_score(score_data, conn)
+
+                    # 카테고리 통계 업데이트
+                    await UserCategoryStatRepository.update_category_stat(
+                        user_id,
+                        answer_key.category_id,
+                        score_data.is_correct,
+                        conn
+                    )
 
             # 로그 기록
             logger.info(
@@ -57,10 +60,11 @@ class UserScoreService:
 
             # 결과에 성적 ID 추가
             answer_result["score_id"] = score_id
+            answer_result["score_buffered"] = buffered
 
             return answer_result
 
-        except NotFoundException:
+        except (NotFoundException, ServiceUnavailableException):
             raise
         except Exception as e:
             logger.error(f"사용자 답변 기록 중 오류 발생: {e}")
@@ -75,6 +79,25 @@ class UserScoreService:
             logger.error(f"사용자 성적 조회 중 오류 발생: {e}")
             raise DatabaseException(str(e))
 
+    @staticmethod
+    async def get_user_scores_page(
+            user_id: int,
+            limit: int = 100,
+            after: Optional[str] = None
+    ) -> Tuple[List[UserScore], Optional[str]]:
+        """사용자의 성적 기록을 커서 방식으로 조회
+
+        반환값: (성적 목록, 다음 페이지 커서 - 더 이상 없으면 None)
+        """
+        after_key = decode_cursor(after, [datetime, int]) if after else None
+
+        try:
+            scores, next_key = await UserScoreRepository.get_user_scores_page(user_id, limit, after_key)
+            return scores, next_cursor(next_key)
+        except Exception as e:
+            logger.error(f"사용자 성적 조회 중 오류 발생: {e}")
+            raise DatabaseException(str(e))
+
     @staticmethod
     async def get_user_score_summary(user_id: int) -> UserScoreSummary:
         """사용자의 성적 요약 정보 조회"""
@@ -1,11 +1,13 @@
 # app/services/user_service.py
 import logging
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple, AsyncIterator
 
-from app.core.auth import verify_password, create_access_token, create_user_response
+from app.core.auth import verify_password_async, create_access_token, create_user_response
 from app.core.exceptions import NotFoundException, ValidationException, UnauthorizedException, DatabaseException, \
-    ForbiddenException
-from app.models.user import User, UserCreate, UserLogin, UserUpdate
+    ForbiddenException, ServiceUnavailableException
+from app.core.config import settings
+from app.core.pagination import decode_cursor, next_cursor
+from app.models.user import User, UserCreate, UserLogin, UserUpdate, UserSummary, UserProfile
 from app.repositories.user_repository import UserRepository
 
 logger = logging.getLogger(__name__)
@@ -25,7 +27,7 @@ class UserService:
             user_id = await UserRepository.create(user_data)
 
             # 생성된 사용자 정보 조회
-            user = await UserRepository.get_by_id(user_id)
+            user = await UserRepository.get_cached(user_id)
 
             # 액세스 토큰 생성 (is_admin 및 role 값 포함)
             is_admin = user.is_admin == "Y"
@@ -44,7 +46,7 @@ class UserService:
             # 응답 데이터 생성
             return create_user_response(user, access_token)
 
-        except ValidationException:
+        except (ValidationException, ServiceUnavailableException):
             raise
         except Exception as e:
             logger.error(f"사용자 등록 중 오류 발생: {e}")
@@ -60,7 +62,7 @@ class UserService:
                 raise UnauthorizedException("이메일 또는 비밀번호가 잘못되었습니다.")
 
             # 비밀번호 검증
-            if not verify_password(login_data.password, user.password):
+            if not await verify_password_async(login_data.password, user.password):
                 raise UnauthorizedException("이메일 또는 비밀번호가 잘못되었습니다.")
 
             # 계정이 활성 상태인지 확인
@@ -84,7 +86,7 @@ class UserService:
             # 응답 데이터 생성
             return create_user_response(user, access_token)
 
-        except UnauthorizedException:
+        except (UnauthorizedException, ServiceUnavailableException):
             raise
         except Exception as e:
             logger.error(f"로그인 중 오류 발생: {e}")
@@ -100,7 +102,7 @@ class UserService:
                 raise UnauthorizedException("이메일 또는 비밀번호가 잘못되었습니다.")
 
             # 비밀번호 검증
-            if not verify_password(login_data.password, user.password):
+            if not await verify_password_async(login_data.password, user.password):
                 raise UnauthorizedException("이메일 또는 비밀번호가 잘못되었습니다.")
 
             # 관리자 권한 확인
@@ -127,16 +129,16 @@ class UserService:
             # 응답 데이터 생성
             return create_user_response(user, access_token)
 
-        except (UnauthorizedException, ForbiddenException):
+        except (UnauthorizedException, ForbiddenException, ServiceUnavailableException):
             raise
         except Exception as e:
             logger.error(f"관리자 로그인 중 오류 발생: {e}")
             raise DatabaseException(str(e))
 
     @staticmethod
-    async def get_user_by_id(user_id: int) -> User:
-        """ID로 사용자 조회"""
-        user = await UserRepository.get_by_id(user_id)
+    async def get_user_by_id(user_id: int) -> UserProfile:
+        """ID로 사용자 조회 (비밀번호 제외)"""
+        user = await UserRepository.get_cached(user_id)
         if not user:
             raise NotFoundException(f"ID가 {user_id}인 사용자를 찾을 수 없습니다.")
         return user
@@ -158,7 +160,7 @@ class UserService:
         """
         try:
             # 사용자 존재 확인
-            user = await UserRepository.get_by_id(user_id)
+            user = await UserRepository.get_cached(user_id)
             if not user:
                 raise NotFoundException(f"ID가 {user_id}인 사용자를 찾을 수 없습니다.")
 
@@ -211,7 +213,7 @@ class UserService:
                 }
             }
 
-        except (NotFoundException, ValidationException, ForbiddenException):
+        except (NotFoundException, ValidationException, ForbiddenException, ServiceUnavailableException):
             raise
         except Exception as e:
             logger.error(f"사용자 정보 업데이트 중 오류 발생: {e}")
@@ -222,12 +224,12 @@ class UserService:
         """사용자 역할 업데이트 (관리자만 가능)"""
         try:
             # 관리자 권한 확인
-            admin = await UserRepository.get_by_id(admin_id)
+            admin = await UserRepository.get_cached(admin_id)
             if not admin or admin.role != "admin":
                 raise ForbiddenException("사용자 역할을 변경할 권한이 없습니다.")
 
             # 사용자 존재 확인
-            user = await UserRepository.get_by_id(user_id)
+            user = await UserRepository.get_cached(user_id)
             if not user:
                 raise NotFoundException(f"ID가 {user_id}인 사용자를 찾을 수 없습니다.")
 
@@ -251,19 +253,31 @@ class UserService:
             raise DatabaseException(str(e))
 
     @staticmethod
-    async def get_users_by_role(role: str, user_id: int, check_admin: bool = True) -> List[User]:
-        """역할별 사용자 목록 조회
+    async def get_users_by_role_page(
+            role: str,
+            user_id: int,
+            limit: int = 100,
+            after: Optional[str] = None,
+            check_admin: bool = True
+    ) -> Tuple[List[UserSummary], Optional[str]]:
+        """역할별 사용자 요약 목록을 커서 방식으로 조회 (비밀번호 제외)
 
         Args:
             role: 조회할 역할 (admin, creator, solver)
             user_id: 요청 사용자 ID
+            limit: 페이지 크기
+            after: 이전 페이지의 다음 페이지 커서
             check_admin: 관리자 권한 확인 여부 (기본값: True)
                         check_admin=False인 경우 일반 사용자도 solver 역할만 조회 가능
+
+        반환값: (사용자 목록, 다음 페이지 커서 - 더 이상 없으면 None)
         """
+        after_id = decode_cursor(after, [int])[0] if after else None
+
         try:
             # 관리자 권한 확인 (check_admin=True인 경우에만)
             if check_admin:
-                admin = await UserRepository.get_by_id(user_id)
+                admin = await UserRepository.get_cached(user_id)
                 if not admin or admin.role != "admin":
                     raise ForbiddenException("역할별 사용자 목록을 조회할 권한이 없습니다.")
             elif role != "solver":
@@ -276,7 +290,9 @@ class UserService:
                 raise ValidationException(f"유효하지 않은 역할입니다. 가능한 역할: {', '.join(valid_roles)}")
 
             # 역할별 사용자 조회
-            return await UserRepository.get_users_by_role(role)
+            users, next_key = await UserRepository.get_users_page(limit, after_id, role)
+
+            return users, next_cursor(next_key)
         except (ForbiddenException, ValidationException):
             raise
         except Exception as e:
@@ -284,18 +300,80 @@ class UserService:
             raise DatabaseException(str(e))
 
     @staticmethod
-    async def get_all_users(admin_id: int) -> List[User]:
-        """모든 사용자 목록 조회 (관리자만 가능)"""
+    async def _check_user_list_access(admin_id: int, role: Optional[str]) -> None:
+        """사용자 목록 조회 권한 및 역할 필터 값 확인"""
+        admin = await UserRepository.get_cached(admin_id)
+        if not admin or admin.role != "admin":
+            raise ForbiddenException("사용자 목록을 조회할 권한이 없습니다.")
+
+        valid_roles = ["admin", "creator", "solver"]
+        if role and role not in valid_roles:
+            raise ValidationException(f"유효하지 않은 역할입니다. 가능한 역할: {', '.join(valid_roles)}")
+
+    @staticmethod
+    async def get_users_page(
+            admin_id: int,
+            limit: int = 100,
+            after: Optional[str] = None,
+            role: Optional[str] = None
+    ) -> Tuple[List[UserSummary], Optional[str]]:
+        """사용자 요약 목록을 커서 방식으로 조회 (관리자만 가능, 비밀번호 제외)
+
+        반환값: (사용자 목록, 다음 페이지 커서 - 더 이상 없으면 None)
+        """
+        after_id = decode_cursor(after, [int])[0] if after else None
+
         try:
-            # 관리자 권한 확인
-            admin = await UserRepository.get_by_id(admin_id)
-            if not admin or admin.role != "admin":
-                raise ForbiddenException("사용자 목록을 조회할 권한이 없습니다.")
+            await UserService._check_user_list_access(admin_id, role)
+
+            users, next_key = await UserRepository.get_users_page(limit, after_id, role)
 
-            # 모든 사용자 조회
-            return await UserRepository.get_all()
-        except ForbiddenException:
+            return users, next_cursor(next_key)
+        except (ForbiddenException, ValidationException):
             raise
         except Exception as e:
             logger.error(f"사용자 목록 조회 중 오류 발생: {e}")
-            raise DatabaseException(str(e))
\ No newline at end of file
+            raise DatabaseException(str(e))
+
+    @staticmethod
+    async def export_users(
+            admin_id: int,
+            role: Optional[str] = None,
+            chunk_size: int = None
+    ) -> AsyncIterator[UserSummary]:
+        """전체 사용자 요약 목록을 chunk_size개씩 조회하며 내보내는 비동기 이터레이터 반환 (관리자만 가능)
+
+        권한 확인은 호출 시점에 수행하므로 응답 전송 전에 예외를 받을 수 있음
+        한 번에 chunk_size개만 메모리에 올리므로 사용자 수와 관계없이 메모리 사용량이 일정함
+        """
+        chunk_size = chunk_size or settings.USER_EXPORT_CHUNK_SIZE
+
+        try:
+            await UserService._check_user_list_access(admin_id, role)
+        except (ForbiddenException, ValidationException):
+            raise
+        except Exception as e:
+            logger.error(f"사용자 목록 내보내기 중 오류 발생: {e}")
+            raise DatabaseException(str(e))
+
+        async def iterate() -> AsyncIterator[UserSummary]:
+            after_id = None
+            exported = 0
+            try:
+                while True:
+                    users, next_key = await UserRepository.get_users_page(chunk_size, after_id, role)
+                    for user in users:
+                        yield user
+                    exported += len(users)
+
+                    if next_key is None:
+                        break
+                    after_id = next_key[0]
+            except Exception as e:
+                # 응답 전송이 이미 시작된 뒤라 상태 코드를 바꿀 수 없으므로 기록만 남김
+                logger.error(f"사용자 목록 내보내기 중 오류 발생 ({exported}건 전송 후): {e}")
+                raise
+
+            logger.info(f"사용자 목록 내보내기 (관리자 ID: {admin_id}, 역할: {role or '전체'}) - {exported}건")
+
+        return iterate()
@@ -0,0 +1,80 @@
+# benchmarks/bench_row_materialization.py
+"""DB 행 → 모델 변환 속도 비교 (model(**row) 검증 vs RowMapper)
+
+실행: python -m benchmarks.bench_row_materialization [--rows 10000] [--repeat 5]
+"""
+import argparse
+import os
+import sys
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.models.answer import Answer  # noqa: E402
+from app.models.question import Question  # noqa: E402
+from app.models.user import User  # noqa: E402
+from app.repositories import row_mapper  # noqa: E402
+
+
+def _question_rows(n):
+    now = datetime(2024, 1, 1, 12, 0, 0)
+    return [{
+        'question_id': i + 1, 'category_id': i % 20 + 1, 'user_id': i % 50 + 1, 'answer_type': 1,
+        'question_text': f"문제 {i}", 'note': None, 'link_url': None, 'group_id': None,
+        'create_at': now, 'update_at': now
+    } for i in range(n)]
+
+
+def _answer_rows(n):
+    now = datetime(2024, 1, 1, 12, 0, 0)
+    return [{
+        'answer_id': i + 1, 'question_id': i // 4 + 1, 'answer_text': f"답변 {i}",
+        'is_correct': 'Y' if i % 4 == 0 else 'N', 'note': None, 'create_at': now, 'update_at': now
+    } for i in range(n)]
+
+
+def _user_rows(n):
+    now = datetime(2024, 1, 1, 12, 0, 0)
+    return [{
+        'user_id': i + 1, 'email': f"user{i}@example.com", 'username': f"user{i:05d}",
+        'password': "$2b$12$" + "x" * 53, 'is_active': 'Y', 'is_admin': 'N', 'role': 'solver',
+        'create_at': now, 'update_at': now
+    } for i in range(n)]
+
+
+def _best_rate(func, rows, repeat):
+    """repeat번 실행 중 가장 빠른 결과의 초당 행 수"""
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func(rows)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return len(rows) / best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="행 → 모델 변환 벤치마크")
+    parser.add_argument("--rows", type=int, default=10000, help="결과 집합 행 수")
+    parser.add_argument("--repeat", type=int, default=5, help="반복 횟수 (가장 빠른 값 사용)")
+    args = parser.parse_args()
+
+    # 설정과 관계없이 매퍼 경로를 측정
+    row_mapper.settings.STRICT_ROW_VALIDATION = False
+
+    cases = [
+        (Question, _question_rows(args.rows)),
+        (Answer, _answer_rows(args.rows)),
+        (User, _user_rows(args.rows)),
+    ]
+
+    print(f"{'model':<10} {'validate rows/s':>16} {'mapper rows/s':>16} {'speedup':>8}")
+    for model, rows in cases:
+        validated = _best_rate(lambda rs: [model(**row) for row in rs], rows, args.repeat)
+        mapped = _best_rate(lambda rs: row_mapper.materialize_many(model, rs), rows, args.repeat)
+        print(f"{model.__name__:<10} {validated:>16,.0f} {mapped:>16,.0f} {mapped / validated:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
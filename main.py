@@ -2,14 +2,21 @@
 import logging
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, Request
+from fastapi import Depends, FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse
 
+from app.api.dependencies import verify_metrics_access
 from app.api.routes import api_router
 from app.core.config import settings
-from app.core.database import close_db_connections, init_db_pool
+from app.core.database import close_db_connections, init_db_pool, warm_up_db_pool
 from app.core.exceptions import NotFoundException, DatabaseException, ValidationException
+from app.core.metrics import registry as metrics_registry, CONTENT_TYPE as METRICS_CONTENT_TYPE
+from app.core.middleware import RequestMemoMiddleware, MetricsMiddleware
+from app.core.pagination import NEXT_CURSOR_HEADER, TOTAL_COUNT_HEADER
+from app.repositories.category_repository import CategoryRegistry
+from app.services.score_write_buffer import ScoreWriteBuffer
+from app.services.token_cleanup_service import TokenCleanupService
 
 # 로깅 설정
 logging.basicConfig(
@@ -28,9 +35,18 @@ async def lifespan(app: FastAPI):
     # 시작 시 실행
     logger.info("서버 시작 중... 🚀")
     await init_db_pool()
+    if settings.MYSQL_POOL_WARMUP:
+        await warm_up_db_pool()
+    await CategoryRegistry.load()
+    if settings.TOKEN_PURGE_ENABLED:
+        TokenCleanupService.start()
+    if settings.SCORE_WRITE_BUFFER_ENABLED:
+        ScoreWriteBuffer.start()
     yield
     # 종료 시 실행
     logger.info("서버 종료 중... 👋")
+    await ScoreWriteBuffer.stop()
+    await TokenCleanupService.stop()
     await close_db_connections()
 
 # FastAPI 앱 생성
@@ -50,8 +66,20 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER, TOTAL_COUNT_HEADER],
 )
 
+# 요청 범위 메모 미들웨어 (같은 요청 안의 중복 조회 방지)
+app.add_middleware(RequestMemoMiddleware)
+
+# 요청 지표 미들웨어 (api_router에 등록된 라우터 prefix별로 집계)
+if settings.METRICS_ENABLED:
+    app.add_middleware(
+        MetricsMiddleware,
+        api_prefix=settings.API_V1_STR,
+        prefixes={"/" + route.path.lstrip("/").split("/")[0] for route in api_router.routes}
+    )
+
 # 전역 예외 핸들러
 @app.exception_handler(NotFoundException)
 async def not_found_exception_handler(request: Request, exc: NotFoundException):
@@ -82,6 +110,11 @@ app.include_router(api_router, prefix=settings.API_V1_STR)
 async def health_check():
     return {"status": "ok", "message": "서버 정상 작동 중... 건강해요! 💪"}
 
+# 지표 엔드포인트 (Prometheus 텍스트 형식, 허용 IP 또는 METRICS_TOKEN으로만 접근 가능)
+@app.get("/metrics", tags=["Health"], response_class=PlainTextResponse, dependencies=[Depends(verify_metrics_access)])
+async def metrics():
+    return PlainTextResponse(metrics_registry.render(), media_type=METRICS_CONTENT_TYPE)
+
 if __name__ == "__main__":
     import uvicorn
     # 서버 실행 (개발 환경용)
@@ -0,0 +1,8 @@
+-- migrations/001_token_blacklist_jti_expire_index.sql
+-- 인증 요청마다 실행되는 블랙리스트 조회용 인덱스
+--   SELECT jti, MAX(expire_at) FROM token_blacklist
+--   WHERE jti IN (%s, %s) AND expire_at > %s GROUP BY jti
+-- (jti, expire_at) 복합 인덱스로 테이블 접근 없이 인덱스 범위 스캔만으로 처리됨
+
+ALTER TABLE token_blacklist
+    ADD INDEX idx_token_blacklist_jti_expire (jti, expire_at);
@@ -0,0 +1,7 @@
+-- migrations/002_token_blacklist_expire_index.sql
+-- 만료 레코드 정리 작업용 인덱스
+--   DELETE FROM token_blacklist WHERE expire_at < %s LIMIT %s
+-- 인덱스가 없으면 배치마다 테이블 전체를 스캔하면서 락을 오래 잡게 됨
+
+ALTER TABLE token_blacklist
+    ADD INDEX idx_token_blacklist_expire (expire_at);
@@ -0,0 +1,25 @@
+-- migrations/003_quiz_session_counters.sql
+-- 세션 통계 카운터 컬럼 추가
+--   세션 조회마다 session_question을 세 번씩 COUNT(*) 하던 상관 서브쿼리를 대체
+--   add_question_to_session / update_question_result 에서 트랜잭션으로 함께 갱신
+-- 값이 어긋난 경우 재계산: python -m app.commands.rebuild_session_stats
+
+ALTER TABLE quiz_session
+    ADD COLUMN question_count INT NOT NULL DEFAULT 0,
+    ADD COLUMN completed_count INT NOT NULL DEFAULT 0,
+    ADD COLUMN correct_count INT NOT NULL DEFAULT 0;
+
+-- 기존 세션 값 채우기
+UPDATE quiz_session qs
+LEFT JOIN (
+    SELECT
+        session_id,
+        COUNT(*) AS question_count,
+        SUM(is_answered = 'Y') AS completed_count,
+        SUM(is_correct = 'Y') AS correct_count
+    FROM session_question
+    GROUP BY session_id
+) s ON s.session_id = qs.session_id
+SET qs.question_count = COALESCE(s.question_count, 0),
+    qs.completed_count = COALESCE(s.completed_count, 0),
+    qs.correct_count = COALESCE(s.correct_count, 0);
@@ -0,0 +1,34 @@
+-- migrations/004_user_category_stat_unique.sql
+-- 카테고리별 통계 upsert용 유니크 키
+--   INSERT ... ON DUPLICATE KEY UPDATE 가 (user_id, category_id) 기준으로 동작하려면 필요
+--   기존 SELECT 후 INSERT 방식에서 동시 요청으로 생긴 중복 행은 먼저 하나로 합침
+
+-- 1. 중복 행의 값을 가장 작은 stat_id 행으로 합치기
+UPDATE user_category_stat s
+JOIN (
+    SELECT
+        user_id,
+        category_id,
+        MIN(stat_id) AS keep_id,
+        SUM(total_questions) AS total_questions,
+        SUM(correct_answers) AS correct_answers,
+        MAX(last_access) AS last_access
+    FROM user_category_stat
+    GROUP BY user_id, category_id
+    HAVING COUNT(*) > 1
+) d ON s.stat_id = d.keep_id
+SET s.total_questions = d.total_questions,
+    s.correct_answers = d.correct_answers,
+    s.last_access = d.last_access;
+
+-- 2. 나머지 중복 행 삭제
+DELETE s
+FROM user_category_stat s
+JOIN user_category_stat k
+    ON k.user_id = s.user_id
+   AND k.category_id = s.category_id
+   AND k.stat_id < s.stat_id;
+
+-- 3. 유니크 키 추가
+ALTER TABLE user_category_stat
+    ADD UNIQUE KEY uk_user_category_stat_user_category (user_id, category_id);
@@ -0,0 +1,9 @@
+-- migrations/005_user_score_keyset_index.sql
+-- 성적 기록 커서 페이지네이션용 인덱스
+--   SELECT * FROM user_score WHERE user_id = %s
+--     AND (submit_at < %s OR (submit_at = %s AND score_id < %s))
+--   ORDER BY submit_at DESC, score_id DESC LIMIT %s
+-- 페이지 깊이와 관계없이 인덱스 범위 검색으로 바로 시작 위치를 찾도록 함
+
+ALTER TABLE user_score
+    ADD INDEX idx_user_score_user_submit (user_id, submit_at, score_id);
@@ -0,0 +1,19 @@
+-- migrations/006_question_group_visibility_index.sql
+-- 풀이자 문제 목록 조회용 인덱스
+--   (SELECT q.* FROM question q WHERE q.group_id IS NULL [AND q.category_id = %s]
+--      ORDER BY q.question_id DESC LIMIT %s)
+--   UNION ALL
+--   (SELECT q.* FROM question q WHERE q.group_id IN (%s, ...) [AND q.category_id = %s]
+--      ORDER BY q.question_id DESC LIMIT %s)
+--   ORDER BY question_id DESC LIMIT %s, %s
+-- 각 부분 쿼리가 인덱스 순서대로 필요한 행만 읽고 멈추도록 함
+--
+-- 사용자별 소속 그룹 조회 (그룹 멤버십 캐시 미스 시)
+--   SELECT group_id FROM group_member WHERE user_id = %s ORDER BY group_id
+
+ALTER TABLE question
+    ADD INDEX idx_question_group (group_id, question_id),
+    ADD INDEX idx_question_category_group (category_id, group_id, question_id);
+
+ALTER TABLE group_member
+    ADD INDEX idx_group_member_user (user_id, group_id);
@@ -0,0 +1,17 @@
+-- migrations/007_group_member_unique.sql
+-- 그룹 멤버 일괄 추가용 유니크 키
+--   INSERT IGNORE INTO group_member (group_id, user_id) VALUES (%s, %s), ...
+--   이미 멤버인 사용자를 (group_id, user_id) 기준으로 건너뛰려면 필요
+--   기존 is_member 확인 후 INSERT 방식에서 동시 요청으로 생긴 중복 행은 먼저 삭제
+
+-- 1. 중복 행 삭제 (가장 작은 member_id 행만 남김)
+DELETE m
+FROM group_member m
+JOIN group_member k
+    ON k.group_id = m.group_id
+   AND k.user_id = m.user_id
+   AND k.member_id < m.member_id;
+
+-- 2. 유니크 키 추가
+ALTER TABLE group_member
+    ADD UNIQUE KEY uk_group_member_group_user (group_id, user_id);
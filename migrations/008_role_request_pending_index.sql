@@ -0,0 +1,10 @@
+-- migrations/008_role_request_pending_index.sql
+-- 대기 중인 역할 변경 요청 목록 커서 페이지네이션용 인덱스
+--   SELECT ... FROM role_request r JOIN user u ON u.user_id = r.user_id
+--   WHERE r.status = 'pending'
+--     AND (r.create_at > %s OR (r.create_at = %s AND r.request_id > %s))
+--   ORDER BY r.create_at ASC, r.request_id ASC LIMIT %s
+-- 전체 대기 요청 수(SELECT COUNT(*) ... WHERE status = 'pending')도 인덱스만으로 계산
+
+ALTER TABLE role_request
+    ADD INDEX idx_role_request_status_create (status, create_at, request_id);
@@ -0,0 +1,32 @@
+# tests/test_answer_key.py
+from app.repositories.qna_repository import AnswerKey, QnARepository
+
+
+def test_grade_single_answer_question():
+    """정답이 한 개인 문제는 정답 하나만 골라야 정답 처리되는지 확인"""
+    key = AnswerKey(answer_type=1, category_id=1, correct_answer_ids=frozenset({2}), answer_count=4)
+
+    assert QnARepository.grade(key, [2])["is_correct"] is True
+
+    result = QnARepository.grade(key, [2, 3])
+    assert result["is_correct"] is False
+    assert result["incorrect_selections"] == [3]
+
+
+def test_grade_multiple_answer_question():
+    """정답이 여러 개인 문제는 모든 정답을 골라야 정답 처리되는지 확인"""
+    key = AnswerKey(answer_type=2, category_id=1, correct_answer_ids=frozenset({1, 3}), answer_count=4)
+
+    assert QnARepository.grade(key, [3, 1])["is_correct"] is True
+
+    result = QnARepository.grade(key, [1])
+    assert result["is_correct"] is False
+    assert result["unselected_correct"] == [3]
+
+
+def test_grade_without_answers():
+    """질문이 없거나 답변이 없으면 채점하지 않는지 확인"""
+    assert QnARepository.grade(None, [1])["success"] is False
+
+    key = AnswerKey(answer_type=1, category_id=1, correct_answer_ids=frozenset(), answer_count=0)
+    assert QnARepository.grade(key, [1])["success"] is False
@@ -0,0 +1,40 @@
+# tests/test_available_questions.py
+import asyncio
+
+from app.repositories.question_repository import QuestionRepository
+
+
+def _capture(monkeypatch):
+    captured = {}
+
+    async def fake_fetch_all(query, params=None, conn=None):
+        captured["query"] = " ".join(query.split())
+        captured["params"] = params
+        return []
+
+    monkeypatch.setattr(QuestionRepository, "fetch_all", fake_fetch_all)
+    return captured
+
+
+def test_available_questions_without_groups(monkeypatch):
+    """소속 그룹이 없으면 공개 질문만 조회하는지 확인"""
+    captured = _capture(monkeypatch)
+
+    asyncio.run(QuestionRepository.get_available_questions_for_user(1, skip=20, limit=10, group_ids=()))
+
+    assert "UNION" not in captured["query"]
+    assert " OR " not in captured["query"]
+    assert captured["params"] == (20, 10)
+
+
+def test_available_questions_with_groups_uses_union(monkeypatch):
+    """소속 그룹이 있으면 공개/그룹 질문을 각각 페이지 끝까지만 읽어서 합치는지 확인"""
+    captured = _capture(monkeypatch)
+
+    asyncio.run(QuestionRepository.get_available_questions_for_user(
+        1, limit=10, category_id=3, after_id=500, group_ids=(7, 9)
+    ))
+
+    assert "UNION ALL" in captured["query"]
+    assert " OR " not in captured["query"]
+    assert captured["params"] == (3, 500, 10, 7, 9, 3, 500, 10, 0, 10)
@@ -0,0 +1,74 @@
+# tests/test_cache.py
+import time
+from datetime import datetime, timedelta
+
+from app.core.cache import (
+    TTLCache,
+    TokenBlacklistCache,
+    end_request_memo,
+    get_request_memo,
+    start_request_memo,
+)
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    """최대 크기를 넘으면 가장 오래 사용되지 않은 항목이 제거되는지 확인"""
+    cache = TTLCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+
+    # a를 사용해서 b가 가장 오래된 항목이 되도록 함
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert len(cache) == 2
+
+
+def test_ttl_cache_expires_entries():
+    """TTL이 지난 항목은 조회되지 않는지 확인"""
+    cache = TTLCache(maxsize=10, ttl=0.05)
+    cache.set("a", 1)
+    cache.set("b", 2, ttl=60)
+
+    time.sleep(0.1)
+
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+    assert cache.hits == 1
+    assert cache.misses == 1
+
+
+def test_token_blacklist_cache_lookup():
+    """블랙리스트 캐시의 등록/미등록/알 수 없음 상태 확인"""
+    cache = TokenBlacklistCache(maxsize=10, valid_ttl=60)
+
+    assert cache.lookup("jti-1") is None
+
+    cache.mark_valid("jti-1")
+    assert cache.lookup("jti-1") is False
+
+    # 등록되면 "블랙리스트 아님" 결과보다 우선함
+    cache.mark_revoked("jti-1", datetime.utcnow() + timedelta(minutes=5))
+    assert cache.lookup("jti-1") is True
+
+    # 이미 만료된 레코드는 캐시하지 않음
+    cache.mark_revoked("jti-2", datetime.utcnow() - timedelta(minutes=5))
+    assert cache.lookup("jti-2") is None
+
+
+def test_request_memo_scope():
+    """요청 범위 메모가 시작~종료 사이에만 존재하는지 확인"""
+    assert get_request_memo() is None
+
+    token = start_request_memo()
+    try:
+        memo = get_request_memo()
+        memo["key"] = "value"
+        assert get_request_memo()["key"] == "value"
+    finally:
+        end_request_memo(token)
+
+    assert get_request_memo() is None
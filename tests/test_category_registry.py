@@ -0,0 +1,104 @@
+# tests/test_category_registry.py
+import asyncio
+from datetime import datetime
+
+from app.models.category import Category
+from app.repositories.category_repository import CategoryRepository, CategoryRegistry
+from app.repositories.qna_repository import QnARepository
+
+NOW = datetime(2024, 1, 1, 12, 0, 0)
+
+
+def test_category_registry_serves_from_memory(monkeypatch):
+    """한 번 읽은 뒤에는 DB 조회 없이 조회/필터링하고, invalidate 후에만 다시 읽는지 확인"""
+    loads = []
+    rows = [
+        Category(category_id=1, name="가", is_use="Y", create_at=NOW, update_at=NOW),
+        Category(category_id=2, name="나", is_use="N", create_at=NOW, update_at=NOW),
+    ]
+
+    async def fake_get_all(is_use=None, conn=None):
+        loads.append(is_use)
+        return list(rows)
+
+    async def fake_get_by_ids(category_ids, conn=None):
+        return [row for row in rows if row.category_id in category_ids]
+
+    monkeypatch.setattr(CategoryRepository, "get_all", fake_get_all)
+    monkeypatch.setattr(CategoryRepository, "get_by_ids", fake_get_by_ids)
+    monkeypatch.setattr(CategoryRegistry, "_categories", {})
+    monkeypatch.setattr(CategoryRegistry, "_missing", set())
+    monkeypatch.setattr(CategoryRegistry, "_loaded_at", None)
+    monkeypatch.setattr(CategoryRegistry, "_lock", None)
+
+    async def scenario():
+        assert [c.category_id for c in await CategoryRegistry.get_all()] == [1, 2]
+        assert [c.category_id for c in await CategoryRegistry.get_all(is_use="Y")] == [1]
+        assert (await CategoryRegistry.get_by_id(2)).name == "나"
+        assert not await CategoryRegistry.exists(3)
+        assert len(loads) == 1
+
+        CategoryRegistry.invalidate()
+        await CategoryRegistry.get_by_id(1)
+        assert len(loads) == 2
+
+        # 다른 워커에서 만든 카테고리: DB에서 찾은 뒤 다음 조회 때 이름 순서로 다시 읽음
+        rows.insert(0, Category(category_id=3, name="ㄱ", is_use="Y", create_at=NOW, update_at=NOW))
+        assert (await CategoryRegistry.get_by_id(3)).category_id == 3
+        assert [c.category_id for c in await CategoryRegistry.get_all()] == [3, 1, 2]
+        assert len(loads) == 3
+
+    asyncio.run(scenario())
+
+
+def test_category_registry_batches_and_remembers_misses(monkeypatch):
+    """레지스트리에 없는 ID는 쿼리 1회로 함께 확인하고, DB에도 없던 ID는 다시 조회하지 않으며
+    카테고리를 찾지 못한 질문은 목록에서 빠지는지 확인"""
+    lookups = []
+    rows = [Category(category_id=1, name="가", is_use="Y", create_at=NOW, update_at=NOW)]
+
+    async def fake_get_all(is_use=None, conn=None):
+        return list(rows)
+
+    async def fake_get_by_ids(category_ids, conn=None):
+        lookups.append(sorted(category_ids))
+        return []
+
+    async def fake_get_answers(question_ids, conn=None):
+        return {question_id: [] for question_id in question_ids}
+
+    monkeypatch.setattr(CategoryRepository, "get_all", fake_get_all)
+    monkeypatch.setattr(CategoryRepository, "get_by_ids", fake_get_by_ids)
+    monkeypatch.setattr(QnARepository, "get_answers_by_question_ids", fake_get_answers)
+    monkeypatch.setattr(CategoryRegistry, "_categories", {})
+    monkeypatch.setattr(CategoryRegistry, "_missing", set())
+    monkeypatch.setattr(CategoryRegistry, "_loaded_at", None)
+    monkeypatch.setattr(CategoryRegistry, "_lock", None)
+
+    def question_row(question_id, category_id):
+        return {
+            'question_id': question_id, 'category_id': category_id, 'user_id': 1, 'answer_type': 1,
+            'question_text': f"질문 {question_id}", 'note': None, 'link_url': None, 'group_id': None,
+            'create_at': NOW, 'update_at': NOW
+        }
+
+    async def scenario():
+        categories = await CategoryRegistry.get_many([1, 8, 9, 9])
+        assert categories[1].name == "가"
+        assert categories[8] is None and categories[9] is None
+        assert lookups == [[8, 9]]
+
+        # 이미 없다고 확인한 ID는 다음 load() 전까지 다시 조회하지 않음
+        assert not await CategoryRegistry.exists(8)
+        await CategoryRegistry.get_many([8, 9])
+        assert lookups == [[8, 9]]
+
+        questions = await QnARepository._assemble([question_row(10, 1), question_row(11, 9)])
+        assert [question.question_id for question in questions] == [10]
+        assert lookups == [[8, 9]]
+
+        CategoryRegistry.invalidate()
+        await CategoryRegistry.get_by_id(9)
+        assert lookups == [[8, 9], [9]]
+
+    asyncio.run(scenario())
@@ -0,0 +1,34 @@
+# tests/test_group_bulk.py
+import asyncio
+
+import pytest
+
+from app.core.exceptions import ValidationException
+from app.models.group import GroupMemberBulkRequest
+from app.repositories.user_repository import UserRepository
+from app.services.group_service import GroupService
+
+
+def test_resolve_bulk_users_reports_unknown(monkeypatch):
+    """ID와 이메일을 한 번에 확인하고 없는 사용자를 따로 돌려주는지 확인"""
+    calls = []
+
+    async def fake_find_user_ids(user_ids=(), emails=(), conn=None):
+        calls.append((list(user_ids), list(emails)))
+        return [{"user_id": 1, "email": "a@example.com"}, {"user_id": 3, "email": "c@example.com"}]
+
+    monkeypatch.setattr(UserRepository, "find_user_ids", fake_find_user_ids)
+
+    request = GroupMemberBulkRequest(user_ids=[3, 2, 3], emails=["A@example.com", "z@example.com"])
+    user_ids, unknown_ids, unknown_emails = asyncio.run(GroupService._resolve_bulk_users(request))
+
+    assert len(calls) == 1
+    assert user_ids == [3, 1]
+    assert unknown_ids == [2]
+    assert unknown_emails == ["z@example.com"]
+
+
+def test_resolve_bulk_users_requires_input():
+    """빈 요청은 거부하는지 확인"""
+    with pytest.raises(ValidationException):
+        asyncio.run(GroupService._resolve_bulk_users(GroupMemberBulkRequest()))
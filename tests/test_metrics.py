@@ -0,0 +1,98 @@
+# tests/test_metrics.py
+import asyncio
+
+from fastapi.testclient import TestClient
+
+from app.core import metrics
+from app.core.config import settings
+from app.repositories.base_repository import BaseRepository, QueryResult, query_method
+from app.repositories.qna_repository import QnARepository
+from app.repositories.user_repository import UserRepository
+from main import app
+
+
+def test_histogram_renders_prometheus_format():
+    """히스토그램이 누적 구간, 합계, 횟수로 출력되는지 확인"""
+    histogram = metrics.Histogram("test_duration_seconds", "테스트", ("stage",), buckets=(0.1, 1.0))
+    histogram.observe(0.05, "a")
+    histogram.observe(0.5, "a")
+    histogram.observe(5, "a")
+
+    lines = histogram.render()
+
+    assert 'test_duration_seconds_bucket{stage="a",le="0.1"} 1' in lines
+    assert 'test_duration_seconds_bucket{stage="a",le="1"} 2' in lines
+    assert 'test_duration_seconds_bucket{stage="a",le="+Inf"} 3' in lines
+    assert 'test_duration_seconds_count{stage="a"} 3' in lines
+    assert "# TYPE test_duration_seconds histogram" in lines
+
+
+def test_query_metrics_labelled_by_repository_method(monkeypatch):
+    """execute_query가 호출한 레포지토리 메서드 이름으로 실행 시간과 행 수를 기록하는지 확인"""
+    async def fake_run(conn, query, params=None):
+        return QueryResult([{"answer_type": 1, "category_id": 1, "answer_id": 1, "is_correct": "Y"}], 1, 0)
+
+    monkeypatch.setattr(BaseRepository, "_run", staticmethod(fake_run))
+    QnARepository.invalidate_answer_key(987654)
+
+    before = metrics.db_query_duration_seconds.get_count("QnARepository", "get_answer_key")
+    asyncio.run(QnARepository.get_answer_key(987654, conn=object()))
+    QnARepository.invalidate_answer_key(987654)
+
+    assert metrics.db_query_duration_seconds.get_count("QnARepository", "get_answer_key") == before + 1
+
+    async def fake_empty_run(conn, query, params=None):
+        return QueryResult([], 0, 0)
+
+    monkeypatch.setattr(BaseRepository, "_run", staticmethod(fake_empty_run))
+    before = metrics.db_query_rows.get_count("UserRepository", "get_by_id")
+    asyncio.run(UserRepository.get_by_id(1, conn=object()))
+
+    assert metrics.db_query_rows.get_count("UserRepository", "get_by_id") == before + 1
+
+
+def test_query_label_follows_nested_tasks(monkeypatch):
+    """@query_method 안에서 만든 내부 함수/태스크의 쿼리도 메서드 이름으로, 지정하지 않은 쿼리는 unlabelled로 기록하는지 확인"""
+    async def fake_run(conn, query, params=None):
+        return QueryResult([], 0, 0)
+
+    monkeypatch.setattr(BaseRepository, "_run", staticmethod(fake_run))
+
+    class ProbeRepository(BaseRepository):
+        @classmethod
+        @query_method
+        async def load_both(cls, conn):
+            async def one():
+                return await cls.fetch_all("SELECT 1", None, conn)
+
+            return await asyncio.gather(one(), one())
+
+    before = metrics.db_query_duration_seconds.get_count("ProbeRepository", "load_both")
+    asyncio.run(ProbeRepository.load_both(object()))
+    assert metrics.db_query_duration_seconds.get_count("ProbeRepository", "load_both") == before + 2
+
+    before = metrics.db_query_duration_seconds.get_count("ProbeRepository", "unlabelled")
+    asyncio.run(ProbeRepository.fetch_all("SELECT 1", None, object()))
+    assert metrics.db_query_duration_seconds.get_count("ProbeRepository", "unlabelled") == before + 1
+
+
+def test_metrics_endpoint_reports_requests_by_prefix(monkeypatch):
+    """/metrics에서 라우터 prefix별 요청 수와 캐시 통계를 조회할 수 있는지 확인 (lifespan 없이 실행)"""
+    monkeypatch.setattr(settings, "METRICS_TOKEN", "scrape-token")
+    client = TestClient(app)
+
+    client.get("/api/v1/categories/")  # 인증 없이 요청 → 401
+
+    # 허용 IP가 아니고 토큰도 없으면 거부
+    assert client.get("/metrics").status_code == 403
+    assert client.get("/metrics", headers={"Authorization": "Bearer wrong"}).status_code == 403
+
+    response = client.get("/metrics", headers={"Authorization": "Bearer scrape-token"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    body = response.text
+    assert 'http_requests_total{prefix="/categories",method="GET",status="401"}' in body
+    assert 'http_requests_in_flight{prefix="/categories"} 0' in body
+    assert 'cache_hits_total{cache="answer_key"}' in body
+    assert "# TYPE db_pool_acquire_wait_seconds histogram" in body
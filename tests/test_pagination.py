@@ -0,0 +1,33 @@
+# tests/test_pagination.py
+from datetime import datetime
+
+import pytest
+
+from app.core.exceptions import ValidationException
+from app.core.pagination import decode_cursor, encode_cursor, keyset_condition
+
+
+def test_cursor_round_trip():
+    """커서로 변환한 값이 그대로 복원되는지 확인"""
+    values = (datetime(2024, 5, 1, 12, 30, 15), 42)
+
+    cursor = encode_cursor(values)
+
+    assert decode_cursor(cursor, [datetime, int]) == values
+
+
+def test_invalid_cursor_raises_validation_error():
+    """잘못된 커서는 ValidationException이 발생하는지 확인"""
+    with pytest.raises(ValidationException):
+        decode_cursor("not-a-cursor", [int])
+
+    with pytest.raises(ValidationException):
+        decode_cursor(encode_cursor(["abc"]), [int])
+
+
+def test_keyset_condition_expands_composite_key():
+    """복합 키 조건이 OR 조건으로 풀리는지 확인"""
+    condition, params = keyset_condition(["submit_at", "score_id"], ["t", 7], descending=True)
+
+    assert condition == "(submit_at < %s OR (submit_at = %s AND score_id < %s))"
+    assert params == ["t", "t", 7]
@@ -0,0 +1,26 @@
+# tests/test_question_sampler.py
+import random
+
+from app.services.question_sampler import sample_ids
+
+
+def test_sample_ids_is_reproducible_with_seed():
+    """같은 시드면 같은 문제 구성이 나오는지 확인"""
+    ids = list(range(1, 1001))
+
+    first = sample_ids(ids, 10, random.Random(42))
+    second = sample_ids(ids, 10, random.Random(42))
+
+    assert first == second
+    assert len(first) == 10
+    assert len(set(first)) == 10
+
+
+def test_sample_ids_skips_excluded_ids():
+    """제외 대상은 추출되지 않고, 후보가 부족하면 가능한 만큼만 반환하는지 확인"""
+    ids = list(range(1, 21))
+    excluded = set(range(1, 16))
+
+    result = sample_ids(ids, 10, random.Random(7), excluded)
+
+    assert sorted(result) == [16, 17, 18, 19, 20]
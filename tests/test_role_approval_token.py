@@ -0,0 +1,93 @@
+# tests/test_role_approval_token.py
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from app.api import dependencies
+from app.core.auth import create_access_token
+from app.core.cache import token_blacklist_cache
+from app.core.config import settings
+from app.core.exceptions import UnauthorizedException
+from app.models.role_request import RoleApprovalRequest
+from app.repositories.base_repository import QueryResult
+from app.repositories.role_request_repository import RoleRequestRepository
+from app.repositories.token_blacklist_repository import TokenBlacklistRepository
+from app.repositories.user_repository import UserRepository
+from app.services import role_request_service
+from app.services.role_request_service import RoleRequestService
+
+USER_ID = 424242
+
+
+def test_approved_user_can_use_new_token(monkeypatch):
+    """역할 승인 후 새로 발급된 토큰은 통과하고, 승인 전에 발급된 토큰만 거부되는지 확인"""
+    token_blacklist_cache.clear()
+    sentinel_rows = {}
+
+    user = SimpleNamespace(user_id=USER_ID, email="solver@example.com", username="solver",
+                           role="creator", is_admin="N")
+
+    async def fake_get_cached(user_id):
+        if user_id == 1:
+            return SimpleNamespace(user_id=1, role="admin")
+        return SimpleNamespace(user_id=user_id, role="solver")
+
+    async def fake_get_request(request_id, conn=None, columns=None, model=None):
+        return SimpleNamespace(request_id=request_id, user_id=USER_ID, requested_role="creator", status="pending")
+
+    async def fake_true(*args, **kwargs):
+        return True
+
+    async def fake_get_user(user_id, conn=None, columns=None, model=None):
+        return user
+
+    async def fake_blacklist_execute(query, params=None, conn=None):
+        if query.strip().startswith("INSERT"):
+            _, jti, _, expire_at = params
+            sentinel_rows[jti] = expire_at
+        return QueryResult([], 1, 0)
+
+    async def fake_find_blacklisted(jtis, conn=None):
+        now = datetime.utcnow()
+        return {jti: sentinel_rows[jti] for jti in jtis if jti in sentinel_rows and sentinel_rows[jti] > now}
+
+    @asynccontextmanager
+    async def fake_transaction():
+        yield object()
+
+    monkeypatch.setattr(UserRepository, "get_cached", fake_get_cached)
+    monkeypatch.setattr(UserRepository, "update", fake_true)
+    monkeypatch.setattr(UserRepository, "get_by_id", fake_get_user)
+    monkeypatch.setattr(RoleRequestRepository, "get_by_id", fake_get_request)
+    monkeypatch.setattr(RoleRequestRepository, "update_status", fake_true)
+    monkeypatch.setattr(TokenBlacklistRepository, "execute", fake_blacklist_execute)
+    monkeypatch.setattr(TokenBlacklistRepository, "find_blacklisted", fake_find_blacklisted)
+    monkeypatch.setattr(role_request_service, "transaction", fake_transaction)
+
+    claims = {"sub": user.email, "user_id": USER_ID, "is_admin": False, "role": "solver"}
+    old_token = create_access_token(data=claims)
+    # 기존 토큰의 iat가 무효화 시각(초 단위)보다 앞서도록 함
+    time.sleep(1.05)
+
+    result = asyncio.run(RoleRequestService.approve_role_request(7, 1, RoleApprovalRequest()))
+
+    # 무효화 기록은 토큰 유효 시간만큼만 유지
+    expire_at = sentinel_rows[TokenBlacklistRepository.user_sentinel_jti(USER_ID)]
+    assert expire_at - datetime.utcnow() <= timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+
+    data = asyncio.run(dependencies.get_token_data(result["new_token"]))
+    assert data["user_id"] == USER_ID
+    assert data["role"] == "creator"
+
+    # 캐시 없이 DB 조회 경로로도 같은 결과
+    token_blacklist_cache.clear()
+    assert asyncio.run(dependencies.get_token_data(result["new_token"]))["user_id"] == USER_ID
+
+    with pytest.raises(UnauthorizedException):
+        asyncio.run(dependencies.get_token_data(old_token))
+
+    token_blacklist_cache.clear()
@@ -0,0 +1,60 @@
+# tests/test_role_request_pending.py
+import asyncio
+from datetime import datetime
+from types import SimpleNamespace
+
+from app.repositories.role_request_repository import RoleRequestRepository
+from app.repositories.user_repository import UserRepository
+from app.services.role_request_service import RoleRequestService
+
+NOW = datetime(2024, 5, 1, 9, 0, 0)
+
+
+def _row(request_id):
+    return {
+        'request_id': request_id, 'user_id': 10 + request_id, 'username': f"user{request_id}",
+        'email': f"user{request_id}@example.com", 'current_role': "solver",
+        'requested_role': "creator", 'reason': "출제 희망", 'create_at': NOW
+    }
+
+
+def test_pending_requests_cursor_round_trip(monkeypatch):
+    """대기 중인 요청 목록의 커서로 다음 페이지를 이어서 조회하고, 전체 수도 같은 JOIN으로 세는지 확인"""
+    rows = [_row(request_id) for request_id in (1, 2, 3)]
+    queries = []
+
+    async def fake_get_cached(user_id, conn=None):
+        return SimpleNamespace(user_id=user_id, role="admin")
+
+    async def fake_fetch_all(query, params=None, conn=None):
+        queries.append((query, params))
+        # 커서 조건 (create_at, request_id) > (after) 를 흉내내서 결과를 잘라냄
+        after_id = params[-2] if len(params) > 2 else 0
+        return [row for row in rows if row['request_id'] > after_id][:params[-1]]
+
+    async def fake_fetch_val(query, params=None, conn=None, default=None):
+        queries.append((query, params))
+        return len(rows)
+
+    monkeypatch.setattr(UserRepository, "get_cached", fake_get_cached)
+    monkeypatch.setattr(RoleRequestRepository, "fetch_all", fake_fetch_all)
+    monkeypatch.setattr(RoleRequestRepository, "fetch_val", fake_fetch_val)
+
+    first, cursor, total = asyncio.run(RoleRequestService.get_pending_requests(1, limit=2))
+
+    assert [request['request_id'] for request in first] == [1, 2]
+    assert first[0] == _row(1)
+    assert cursor is not None
+    assert total == 3
+
+    page_query, page_params = queries[0]
+    count_query, _ = queries[1]
+    assert "JOIN user u ON u.user_id = r.user_id" in page_query
+    assert "JOIN user u ON u.user_id = r.user_id" in count_query
+    assert page_params == ("pending", 3)
+
+    second, cursor, _ = asyncio.run(RoleRequestService.get_pending_requests(1, limit=2, after=cursor))
+
+    assert [request['request_id'] for request in second] == [3]
+    assert cursor is None
+    assert queries[2][1] == ("pending", NOW, NOW, 2, 3)
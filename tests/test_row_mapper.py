@@ -0,0 +1,65 @@
+# tests/test_row_mapper.py
+import asyncio
+from datetime import datetime
+
+import pytest
+
+from app.models.answer import Answer
+from app.models.qna import QuestionWithAnswers
+from app.models.question import QuestionRef
+from app.repositories import row_mapper
+from app.repositories.question_repository import QuestionRepository
+
+NOW = datetime(2024, 1, 1, 12, 0, 0)
+
+
+def _answer_row(answer_id):
+    return {
+        'answer_id': answer_id, 'question_id': 1, 'answer_text': f"답변 {answer_id}",
+        'is_correct': 'Y', 'note': None, 'create_at': NOW, 'update_at': NOW
+    }
+
+
+def test_mapped_model_matches_validated(monkeypatch):
+    """매퍼로 만든 모델이 검증을 거친 모델과 같은지 확인"""
+    monkeypatch.setattr(row_mapper.settings, "STRICT_ROW_VALIDATION", False)
+    rows = [_answer_row(1), _answer_row(2)]
+
+    mapped = row_mapper.materialize_many(Answer, rows)
+
+    assert mapped == [Answer(**row) for row in rows]
+    assert mapped[0].model_dump() == Answer(**rows[0]).model_dump()
+
+
+def test_missing_optional_fields_use_defaults(monkeypatch):
+    """행에 없는 선택 필드는 기본값으로, 추가 컬럼은 무시하는지 확인"""
+    monkeypatch.setattr(row_mapper.settings, "STRICT_ROW_VALIDATION", False)
+    row = {
+        'question_id': 1, 'category_id': 2, 'user_id': 3, 'answer_type': 1, 'question_text': "문제",
+        'create_at': NOW, 'update_at': NOW, 'category_name': "추가 컬럼"
+    }
+
+    question = row_mapper.materialize(QuestionWithAnswers, row)
+
+    assert question.note is None and question.answers == [] and question.category is None
+    assert not hasattr(question, 'category_name')
+    assert question == QuestionWithAnswers(**row)
+
+
+def test_get_by_id_projection_requires_model(monkeypatch):
+    """컬럼을 지정한 조회는 projection 모델로 반환하고, 모델 없이 컬럼만 주면 거부하는지 확인"""
+    queries = []
+
+    async def fake_fetch_one(query, params=None, conn=None):
+        queries.append(query)
+        return {'question_id': params[0], 'category_id': 3}
+
+    monkeypatch.setattr(QuestionRepository, "fetch_one", fake_fetch_one)
+
+    question = asyncio.run(QuestionRepository.get_by_id(7, model=QuestionRef))
+
+    assert question == QuestionRef(question_id=7, category_id=3)
+    assert queries == ["SELECT question_id, category_id FROM question WHERE question_id = %s"]
+
+    with pytest.raises(ValueError):
+        asyncio.run(QuestionRepository.get_by_id(7, columns=("question_id", "category_id")))
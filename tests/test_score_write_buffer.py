@@ -0,0 +1,107 @@
+# tests/test_score_write_buffer.py
+import asyncio
+import json
+
+from app.core.config import settings
+from app.core.exceptions import ServiceUnavailableException
+from app.models.user_score import UserScoreCreate
+from app.services.score_write_buffer import ScoreWriteBuffer
+
+
+def test_score_write_buffer_drains_on_stop(monkeypatch):
+    """종료 시 큐에 남은 항목이 모두 반영되는지 확인"""
+    flushed = []
+
+    async def fake_flush(batch):
+        flushed.extend(batch)
+
+    monkeypatch.setattr(ScoreWriteBuffer, "_flush", fake_flush)
+
+    async def scenario():
+        ScoreWriteBuffer.start()
+        for question_id in range(1, 6):
+            score = UserScoreCreate(user_id=1, question_id=question_id, is_correct="Y", selected_answers="1")
+            await ScoreWriteBuffer.enqueue(score, 1)
+        await ScoreWriteBuffer.stop()
+
+    asyncio.run(scenario())
+
+    assert [score.question_id for score, _ in flushed] == [1, 2, 3, 4, 5]
+    assert not ScoreWriteBuffer.is_running()
+
+
+def test_score_write_buffer_reserve_before_write(monkeypatch):
+    """자리가 없으면 reserve에서 거절되고, 종료는 예약된 항목이 들어올 때까지 기다리는지 확인"""
+    flushed = []
+
+    async def fake_flush(batch):
+        flushed.extend(batch)
+
+    monkeypatch.setattr(ScoreWriteBuffer, "_flush", fake_flush)
+    monkeypatch.setattr(settings, "SCORE_WRITE_BUFFER_QUEUE_SIZE", 1)
+    monkeypatch.setattr(settings, "SCORE_WRITE_BUFFER_PUT_TIMEOUT", 0.01)
+
+    async def scenario():
+        ScoreWriteBuffer.start()
+        assert await ScoreWriteBuffer.reserve()
+
+        rejected = False
+        try:
+            await ScoreWriteBuffer.reserve()
+        except ServiceUnavailableException:
+            rejected = True
+        assert rejected
+
+        # 종료가 시작되면 새 예약은 받지 않지만 이미 확보한 자리는 반영됨
+        stopping = asyncio.create_task(ScoreWriteBuffer.stop())
+        await asyncio.sleep(0)
+        assert not await ScoreWriteBuffer.reserve()
+        assert not stopping.done()
+
+        score = UserScoreCreate(user_id=1, question_id=7, is_correct="N", selected_answers="2")
+        ScoreWriteBuffer.put_reserved(score, 3)
+        await stopping
+
+    asyncio.run(scenario())
+
+    assert [(score.question_id, category_id) for score, category_id in flushed] == [(7, 3)]
+
+
+def test_score_write_buffer_flush_failure_falls_back(monkeypatch, tmp_path):
+    """배치 반영이 계속 실패하면 행 단위로 기록하고, 그래도 실패한 행은 파일에 남기는지 확인"""
+    dead_letter = tmp_path / "failed.jsonl"
+    monkeypatch.setattr(settings, "SCORE_WRITE_BUFFER_FLUSH_RETRIES", 2)
+    monkeypatch.setattr(settings, "SCORE_WRITE_BUFFER_RETRY_BACKOFF", 0)
+    monkeypatch.setattr(settings, "SCORE_WRITE_BUFFER_DEAD_LETTER_PATH", str(dead_letter))
+
+    batch_attempts = []
+    written = []
+
+    async def failing_batch(batch):
+        batch_attempts.append(len(batch))
+        raise RuntimeError("deadlock")
+
+    async def write_row(score, category_id):
+        if score.question_id == 2:
+            raise RuntimeError("lost connection")
+        written.append(score.question_id)
+
+    monkeypatch.setattr(ScoreWriteBuffer, "_write_batch", staticmethod(failing_batch))
+    monkeypatch.setattr(ScoreWriteBuffer, "_write_row", staticmethod(write_row))
+
+    failed_before = ScoreWriteBuffer.failed_rows
+    batch = [
+        (UserScoreCreate(user_id=1, question_id=question_id, is_correct="Y", selected_answers="1"), 5)
+        for question_id in (1, 2, 3)
+    ]
+    asyncio.run(ScoreWriteBuffer._flush(batch))
+
+    assert batch_attempts == [3, 3, 3]
+    assert written == [1, 3]
+    assert ScoreWriteBuffer.failed_rows - failed_before == 1
+
+    rows = [json.loads(line) for line in dead_letter.read_text(encoding="utf-8").splitlines()]
+    assert len(rows) == 1
+    assert rows[0]["question_id"] == 2
+    assert rows[0]["category_id"] == 5
+    assert rows[0]["error"] == "lost connection"